@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Bank Vectors — TF-IDF vectors for ranking bank bullets and paragraphs by JD text.
+
+Every bullet text in portfolio/bullet-bank.yaml and every paragraph in
+portfolio/paragraph-bank.yaml is tokenized the way JDDocument tokenizes a JD
+(lowercased \\w+ words, stop words dropped), weighted by sublinear TF x smoothed
+IDF over its bank, and L2-normalized. The vectors form a sparse CSR matrix
+stored next to the bank (portfolio/bullet-bank.vectors.pkl) and keyed by a
+hash of the bank's texts, so it is rebuilt automatically when the bank changes.
+
+A JD is vectorized with the bank's vocabulary and IDF; ranking is one sparse
+matrix-vector product giving the cosine similarity of every entry. Everything
+runs offline. numpy is optional: without it the product runs in pure Python.
+
+Usage:
+    python scripts/bank_vectors.py --build
+    python scripts/bank_vectors.py --rank --job archive/job-desc-hibob.txt
+"""
+
+import argparse
+import hashlib
+import math
+import pickle
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    print("PyYAML is required. Install with: pip install pyyaml")
+    sys.exit(1)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from fileio import atomic_write
+from jd_parser import WORD_RE, JDDocument
+
+ROOT = Path(__file__).resolve().parent.parent
+PORTFOLIO_DIR = ROOT / "portfolio"
+BANK_PATHS = {
+    "bullet": PORTFOLIO_DIR / "bullet-bank.yaml",
+    "paragraph": PORTFOLIO_DIR / "paragraph-bank.yaml",
+}
+VECTORS_VERSION = 1
+
+STOP_WORDS = frozenset("""
+a an and are as at be been but by for from has have in into is it its of on or our
+that the their this to was were will with we you your i my me who which while
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens, as JDDocument produces them, minus stop words."""
+    return [t for t in WORD_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def bank_texts(bank: dict, kind: str) -> list[str]:
+    """Entry texts in bank order: bullets flattened across companies, or paragraphs."""
+    if kind == "bullet":
+        return [b.get("text") or "" for entry in bank.get("companies", [])
+                for b in entry.get("bullets", [])]
+    return [p.get("text") or "" for p in bank.get("paragraphs", [])]
+
+
+def texts_digest(texts: list[str]) -> str:
+    h = hashlib.sha256(f"v{VECTORS_VERSION}\n".encode("utf-8"))
+    for text in texts:
+        h.update(text.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+# ---- Vectors ----------------------------------------------------------------
+
+class BankVectors:
+    """
+    TF-IDF rows for a bank's entries as a CSR matrix (indptr, indices, data),
+    plus the vocabulary and IDF needed to vectorize a JD against them.
+    """
+
+    def __init__(self, vocab: dict[str, int], idf: list[float],
+                 indptr: list[int], indices: list[int], data: list[float], digest: str = ""):
+        self.vocab, self.idf = vocab, idf
+        self.indptr, self.indices, self.data = indptr, indices, data
+        self.digest = digest
+        self.n_rows = len(indptr) - 1
+        # Column-major postings for the pure-Python product
+        self.columns: dict[int, list[tuple[int, float]]] = {}
+        for row in range(self.n_rows):
+            for k in range(indptr[row], indptr[row + 1]):
+                self.columns.setdefault(indices[k], []).append((row, data[k]))
+        if NUMPY_AVAILABLE:
+            self._data = np.asarray(data, dtype=np.float64)
+            self._indices = np.asarray(indices, dtype=np.int64)
+            self._rows = np.repeat(np.arange(self.n_rows), np.diff(np.asarray(indptr)))
+
+    @classmethod
+    def from_texts(cls, texts: list[str]) -> "BankVectors":
+        counts = [Counter(tokenize(t)) for t in texts]
+        df: Counter[str] = Counter()
+        for c in counts:
+            df.update(c.keys())
+        vocab = {term: i for i, term in enumerate(sorted(df))}
+        n = len(texts)
+        idf = [0.0] * len(vocab)
+        for term, col in vocab.items():
+            idf[col] = math.log((1 + n) / (1 + df[term])) + 1
+
+        indptr, indices, data = [0], [], []
+        for c in counts:
+            row = sorted((vocab[t], (1 + math.log(tf)) * idf[vocab[t]]) for t, tf in c.items())
+            norm = math.sqrt(sum(w * w for _, w in row)) or 1.0
+            indices.extend(col for col, _ in row)
+            data.extend(w / norm for _, w in row)
+            indptr.append(len(indices))
+        return cls(vocab, idf, indptr, indices, data, texts_digest(texts))
+
+    def jd_vector(self, jd: "JDDocument | str") -> dict[int, float]:
+        """L2-normalized TF-IDF weights of a JD over the bank's vocabulary, as {column: weight}."""
+        if isinstance(jd, JDDocument):
+            counts = {t: c for t, c in jd.counts.items() if t not in STOP_WORDS}
+        else:
+            counts = Counter(tokenize(jd))
+        vec = {}
+        for term, tf in counts.items():
+            col = self.vocab.get(term)
+            if col is not None:
+                vec[col] = (1 + math.log(tf)) * self.idf[col]
+        norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+        return {col: w / norm for col, w in vec.items()}
+
+    def similarities(self, jd: "JDDocument | str") -> list[float]:
+        """Cosine similarity of every entry to the JD, in bank order."""
+        q = self.jd_vector(jd)
+        sims = [0.0] * self.n_rows
+        for col, weight in q.items():
+            for row, value in self.columns[col]:
+                sims[row] += value * weight
+        return sims
+
+    def similarities_batch(self, jds: list) -> list[list[float]]:
+        """Cosine similarities for many JDs; one sparse matrix product with numpy."""
+        if not NUMPY_AVAILABLE:
+            return [self.similarities(jd) for jd in jds]
+        q = np.zeros((len(self.vocab), len(jds)))
+        for j, jd in enumerate(jds):
+            for col, weight in self.jd_vector(jd).items():
+                q[col, j] = weight
+        products = self._data[:, None] * q[self._indices]
+        sims = np.zeros((self.n_rows, len(jds)))
+        np.add.at(sims, self._rows, products)
+        return sims.T.tolist()
+
+    def to_dict(self) -> dict:
+        return {"version": VECTORS_VERSION, "digest": self.digest, "vocab": self.vocab,
+                "idf": self.idf, "indptr": self.indptr, "indices": self.indices, "data": self.data}
+
+
+def vectors_path(kind: str) -> Path:
+    return BANK_PATHS[kind].with_name(f"{BANK_PATHS[kind].stem}.vectors.pkl")
+
+
+def load_bank_vectors(texts: list[str], kind: str) -> BankVectors:
+    """Return the vectors for a bank's texts, from the persisted file when it matches."""
+    digest = texts_digest(texts)
+    path = vectors_path(kind)
+    try:
+        with open(path, "rb") as f:
+            stored = pickle.load(f)
+        if stored.get("version") == VECTORS_VERSION and stored.get("digest") == digest:
+            return BankVectors(stored["vocab"], stored["idf"], stored["indptr"],
+                               stored["indices"], stored["data"], digest)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing, partial or foreign file; rebuild below
+
+    vectors = BankVectors.from_texts(texts)
+    atomic_write(path, pickle.dumps(vectors.to_dict(), protocol=pickle.HIGHEST_PROTOCOL))
+    return vectors
+
+
+# Vectors for bank objects seen in this process, keyed by (id(bank), kind);
+# each entry holds a reference to its bank so the id cannot be reused. The
+# lock makes concurrent first calls from stage threads build the vectors once.
+_BANK_VECTORS: dict[tuple[int, str], tuple[BankVectors, dict]] = {}
+_BANK_VECTORS_LOCK = threading.Lock()
+
+
+def vectors_for_bank(bank: dict, kind: str) -> BankVectors:
+    """BankVectors for a loaded bank ('bullet' or 'paragraph'), computed once per process."""
+    cached = _BANK_VECTORS.get((id(bank), kind))
+    if cached is None:
+        with _BANK_VECTORS_LOCK:
+            cached = _BANK_VECTORS.get((id(bank), kind))
+            if cached is None:
+                cached = _BANK_VECTORS[(id(bank), kind)] = (load_bank_vectors(bank_texts(bank, kind), kind), bank)
+    return cached[0]
+
+
+# ---- CLI --------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the bank TF-IDF vectors")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--build", action="store_true", help="(Re)build the vectors for both banks")
+    group.add_argument("--rank", action="store_true", help="Rank bank entries against --job")
+    parser.add_argument("--job", help="Path to a JD text file (for --rank)")
+    parser.add_argument("--top", type=int, default=8, help="Entries to show per bank (default: 8)")
+    args = parser.parse_args()
+
+    for kind, bank_path in BANK_PATHS.items():
+        if not bank_path.exists():
+            print(f"  [!] {bank_path.name} not found; skipped")
+            continue
+        with open(bank_path, "r", encoding="utf-8") as f:
+            texts = bank_texts(yaml.safe_load(f) or {}, kind)
+
+        if args.build:
+            vectors_path(kind).unlink(missing_ok=True)
+            vectors = load_bank_vectors(texts, kind)
+            print(f"  {bank_path.name}: {vectors.n_rows} entries, {len(vectors.vocab)} terms, "
+                  f"{len(vectors.data)} non-zeros → {vectors_path(kind).name}")
+            continue
+
+        if not args.job:
+            parser.error("--rank requires --job")
+        vectors = load_bank_vectors(texts, kind)
+        sims = vectors.similarities(JDDocument.from_path(Path(args.job)))
+        print(f"\n  {bank_path.name}")
+        for row in sorted(range(len(sims)), key=lambda r: -sims[r])[:args.top]:
+            print(f"    {sims[row]:.3f}  {' '.join(texts[row].split())[:90]}")
+
+
+if __name__ == "__main__":
+    main()
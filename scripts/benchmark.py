@@ -0,0 +1,1902 @@
+#!/usr/bin/env python3
+"""
+Benchmarks — time the pipeline hot paths against their previous implementations.
+
+Each suite runs the current implementation and a reference copy of the code it
+replaced over the JDs in archive/, checks that both produce the same results,
+and prints per-call timings. A mismatch exits non-zero so the suite doubles as
+an equivalence check.
+
+Usage:
+    python scripts/benchmark.py --suite skills
+    python scripts/benchmark.py --suite skills --repeat 200
+    python scripts/benchmark.py --suite evaluate --repeat 10
+    python scripts/benchmark.py --suite banks
+    python scripts/benchmark.py --suite tracker --repeat 5
+    python scripts/benchmark.py --suite scan
+    python scripts/benchmark.py --suite writers
+    python scripts/benchmark.py --suite fetch
+    python scripts/benchmark.py --suite httpcache
+    python scripts/benchmark.py --suite ats --repeat 50
+    python scripts/benchmark.py --suite html --repeat 50
+    python scripts/benchmark.py --suite crawl
+    python scripts/benchmark.py --suite all --jobs-glob "archive/job-desc-*.txt"
+"""
+
+import argparse
+import glob
+import hashlib
+import html
+import io
+import json
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+import bank_vectors
+import build_cache
+import crawl_boards
+import evaluate
+import fetch_jd
+import generate_resume
+import jd_parser
+import scorer
+import tracker
+
+ROOT = Path(__file__).resolve().parent.parent
+ARCHIVE_DIR = ROOT / "archive"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+# ---- Timing helpers ---------------------------------------------------------
+
+def _time_per_call(fn, repeat: int) -> float:
+    """Return mean seconds per call of fn() over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _report(label: str, before: float, after: float) -> None:
+    speedup = before / after if after else float("inf")
+    print(f"  {label:<34} {before * 1e3:9.3f} ms  →  {after * 1e3:9.3f} ms   ({speedup:5.1f}x)")
+
+
+def _load_jds(pattern: str) -> list[Path]:
+    if not Path(pattern).is_absolute():
+        pattern = str(ROOT / pattern)
+    paths = sorted(Path(p) for p in glob.glob(pattern))
+    if not paths:
+        print(f"Error: no JD files match {pattern}")
+        sys.exit(1)
+    return paths
+
+
+# ---- Suite: tech skill extraction -------------------------------------------
+
+def _legacy_extract_tech_skills(text: str) -> list[str]:
+    """Reference copy of the per-pattern extract_tech_skills loop."""
+    found: set[str] = set()
+    lower = text.lower()
+    for pattern in jd_parser.TECH_SKILL_PATTERNS:
+        match = re.search(pattern, lower)
+        if match:
+            found.add(match.group().strip())
+    return sorted(found)
+
+
+def suite_skills(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[skills] extract_tech_skills: per-pattern loop vs single-pass matcher")
+    ok = True
+    total_before = total_after = 0.0
+    for path in jd_paths:
+        text = jd_parser.load_text(path)
+        sections = jd_parser.split_into_sections(text)
+        # parse_jd calls the extractor on requirements, preferred, and full text
+        inputs = [
+            "\n".join(sections["requirements"]),
+            "\n".join(sections["preferred"]),
+            text,
+        ]
+        for chunk in inputs:
+            legacy = _legacy_extract_tech_skills(chunk)
+            current = jd_parser.extract_tech_skills(chunk)
+            if legacy != current:
+                ok = False
+                print(f"  [!] MISMATCH in {path.name}")
+                print(f"      legacy only : {sorted(set(legacy) - set(current))}")
+                print(f"      matcher only: {sorted(set(current) - set(legacy))}")
+
+        before = _time_per_call(lambda: [_legacy_extract_tech_skills(c) for c in inputs], repeat)
+        after = _time_per_call(lambda: [jd_parser.extract_tech_skills(c) for c in inputs], repeat)
+        total_before += before
+        total_after += after
+        _report(path.name[:34], before, after)
+
+    _report("TOTAL (per parse_jd)", total_before, total_after)
+    print(f"  Equivalence on {len(jd_paths)} JD(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: skill scoring ---------------------------------------------------
+
+def _legacy_count_hits(tokens: list[str], text: str) -> int:
+    """Reference copy of the per-token regex _count_hits."""
+    total = 0
+    for token in tokens:
+        pattern = r"\b" + re.escape(token) + r"\b"
+        count = len(re.findall(pattern, text))
+        total += min(count, 3)
+    return total
+
+
+def _legacy_score_skill(entry: dict, jd_text_lower: str, req_text: str, pref_text: str, raw_kws: list[str]) -> dict:
+    """Reference copy of score_skill as it was before JDDocument lookups."""
+    tokens = entry["search_tokens"]
+    required_hits = _legacy_count_hits(tokens, req_text)
+    preferred_hits = _legacy_count_hits(tokens, pref_text)
+    full_hits = _legacy_count_hits(tokens, jd_text_lower)
+    skill_lower = entry["skill"].lower()
+    kw_bonus = sum(1 for kw in raw_kws if skill_lower in kw or kw in skill_lower)
+    raw = (required_hits * 3.0) + (preferred_hits * 1.5) + (full_hits * 0.5) + (kw_bonus * 2.0)
+    confidence = round(min(10.0, raw * 1.2), 1)
+    if confidence >= 7:
+        category = "STRONG_MATCH"
+    elif confidence >= 4:
+        category = "PARTIAL_MATCH"
+    elif confidence >= 1:
+        category = "WEAK_SIGNAL"
+    else:
+        category = "NOT_IN_JD"
+    return {
+        "skill": entry["skill"],
+        "category": entry["category"],
+        "proficiency": entry["proficiency"],
+        "years": entry["years"],
+        "jd_hits": full_hits,
+        "confidence": confidence,
+        "match_category": category,
+        "evidence_summary": "; ".join(str(e) for e in entry["evidence"][:2]) if entry["evidence"] else "",
+    }
+
+
+def _legacy_score_all(skill_index: list[dict], jd_text: str, parsed_jd: dict) -> list[dict]:
+    jd_lower = scorer._normalize(jd_text)
+    req_text = scorer._normalize(" ".join(parsed_jd.get("required_skills", [])))
+    pref_text = scorer._normalize(" ".join(parsed_jd.get("preferred_skills", [])))
+    raw_kws = [scorer._normalize(k) for k in parsed_jd.get("raw_keywords", [])]
+    return [_legacy_score_skill(e, jd_lower, req_text, pref_text, raw_kws) for e in skill_index]
+
+
+def _current_score_all(skill_index: list[dict], jd_text: str, parsed_jd: dict) -> list[dict]:
+    doc = jd_parser.JDDocument(jd_text)
+    req_doc = jd_parser.JDDocument(" ".join(parsed_jd.get("required_skills", [])))
+    pref_doc = jd_parser.JDDocument(" ".join(parsed_jd.get("preferred_skills", [])))
+    raw_kws = [scorer._normalize(k) for k in parsed_jd.get("raw_keywords", [])]
+    return [scorer.score_skill(e, doc, req_doc, pref_doc, raw_kws) for e in skill_index]
+
+
+def _grow_index(skill_index: list[dict], factor: int) -> list[dict]:
+    """Simulate a larger taxonomy: each copy gets its own variant vocabulary."""
+    grown = list(skill_index)
+    for k in range(1, factor):
+        suffix = "x" * k
+        for entry in skill_index:
+            grown.append(dict(
+                entry,
+                skill=f"{entry['skill']} {suffix}",
+                search_tokens=[t + suffix for t in entry["search_tokens"]],
+            ))
+    return grown
+
+
+def suite_scoring(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[scoring] score_skill: per-token regex scans vs JDDocument term lookups")
+    taxonomy = scorer.load_yaml(scorer.TAXONOMY_PATH)
+    skill_index = scorer.build_skill_index(taxonomy)
+    jds = [(path, jd_parser.load_text(path), jd_parser.parse_jd(path)) for path in jd_paths]
+
+    ok = True
+    for path, text, parsed in jds:
+        for legacy, current in zip(
+            _legacy_score_all(skill_index, text, parsed),
+            _current_score_all(skill_index, text, parsed),
+        ):
+            if legacy != current:
+                ok = False
+                print(f"  [!] MISMATCH in {path.name}: {legacy['skill']}")
+
+    for factor in (1, 4, 16):
+        index = _grow_index(skill_index, factor)
+        before = sum(_time_per_call(lambda: _legacy_score_all(index, t, p), repeat) for _, t, p in jds)
+        after = sum(_time_per_call(lambda: _current_score_all(index, t, p), repeat) for _, t, p in jds)
+        _report(f"{len(index)} skills x {len(jds)} JD(s)", before, after)
+
+    print(f"  Equivalence on {len(jd_paths)} JD(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: skill index loading ---------------------------------------------
+
+def suite_index(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[index] skill index: parse taxonomy + build vs cached load")
+    scorer.load_skill_index()  # warm the cache
+    rebuilt = scorer.build_skill_index(scorer.load_yaml(scorer.TAXONOMY_PATH))
+    ok = rebuilt == scorer.load_skill_index()
+    before = _time_per_call(lambda: scorer.build_skill_index(scorer.load_yaml(scorer.TAXONOMY_PATH)), repeat)
+    after = _time_per_call(scorer.load_skill_index, repeat)
+    _report("skill-taxonomy.yaml", before, after)
+
+    # Two taxonomies keep their own cache entries; an unreadable entry is rebuilt, not raised
+    saved_cache_dir = scorer.CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            scorer.CACHE_DIR = Path(tmp) / "cache"
+            other = Path(tmp) / "test-taxonomy.yaml"
+            other.write_bytes(scorer.TAXONOMY_PATH.read_bytes() + b"\n# test copy\n")
+            for path in (scorer.TAXONOMY_PATH, other, scorer.TAXONOMY_PATH, other):
+                scorer.load_skill_index(path)
+            if len(list(scorer.CACHE_DIR.glob("skill-index-*.pkl"))) != 2:
+                ok = False
+                print("  [!] loading a second taxonomy evicted the first one's cached index")
+            # A newer pickle protocol, a moved class, a removed module
+            for unreadable in (b"\x80\x09", b"cscorer\nNoSuchClass\n.", b"cno_such_module\nIndex\n."):
+                for entry in scorer.CACHE_DIR.glob(f"skill-index-{other.stem}-*.pkl"):
+                    entry.write_bytes(unreadable)
+                try:
+                    if scorer.load_skill_index(other) != rebuilt:
+                        raise ValueError("index differs from a fresh build")
+                except Exception as e:
+                    ok = False
+                    print(f"  [!] an unreadable cached index {unreadable!r} was not rebuilt: {e!r}")
+    finally:
+        scorer.CACHE_DIR = saved_cache_dir
+    print(f"  Cached index matches a fresh build; per-taxonomy entries; bad entries rebuilt: "
+          f"{'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: batch scoring ---------------------------------------------------
+
+def _score_one_by_one(jd_paths: list[Path], skill_index: list[dict]) -> list[tuple[list[dict], dict]]:
+    """Score JDs the way separate scorer.py runs do, minus the process launch."""
+    results = []
+    for path in jd_paths:
+        doc = jd_parser.JDDocument.from_path(path)
+        parsed = jd_parser.parse_jd(path, doc=doc)
+        req_doc = jd_parser.JDDocument(" ".join(parsed.get("required_skills", [])))
+        pref_doc = jd_parser.JDDocument(" ".join(parsed.get("preferred_skills", [])))
+        raw_kws = [scorer._normalize(k) for k in parsed.get("raw_keywords", [])]
+        scores = [scorer.score_skill(e, doc, req_doc, pref_doc, raw_kws) for e in skill_index]
+        ordered = sorted(scores, key=lambda x: x["confidence"], reverse=True)
+        results.append((scores, scorer._compute_summary(ordered, parsed)))
+    return results
+
+
+def suite_batch(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[batch] scoring many JDs: per-JD loop vs scorer.score_batch matrix products")
+    if not scorer.NUMPY_AVAILABLE:
+        print("  [skip] numpy not installed")
+        return True
+    skill_index = scorer.load_skill_index()
+
+    ok = True
+    confidence, summaries = scorer.score_batch(jd_paths, skill_index)
+    for row, (scores, summary) in enumerate(_score_one_by_one(jd_paths, skill_index)):
+        expected = [s["confidence"] for s in scores]
+        summary = dict(summary, source_jd=summaries[row]["source_jd"])
+        if list(confidence[row]) != expected or summary != summaries[row]:
+            ok = False
+            print(f"  [!] MISMATCH for {jd_paths[row].name}")
+
+    # What a re-triage costs today: one parser and one scorer process per JD
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for path in jd_paths:
+            parsed_out = Path(tmp) / f"{path.stem}-parsed.yaml"
+            subprocess.run([sys.executable, str(ROOT / "scripts" / "jd_parser.py"),
+                            "--job", str(path), "--output", str(parsed_out)],
+                           capture_output=True, check=True)
+            subprocess.run([sys.executable, str(ROOT / "scripts" / "scorer.py"),
+                            "--jd", str(path), "--parsed-jd", str(parsed_out),
+                            "--output", str(Path(tmp) / f"{path.stem}-scores.yaml")],
+                           capture_output=True, check=True)
+        per_jd_processes = (time.perf_counter() - start) / len(jd_paths)
+    batch_per_jd = _time_per_call(lambda: scorer.score_batch(jd_paths, skill_index), repeat) / len(jd_paths)
+    _report("per JD: processes vs --batch", per_jd_processes, batch_per_jd)
+
+    for copies in (1, 10, 50):
+        paths = jd_paths * copies
+        runs = max(1, repeat // copies)
+        before = _time_per_call(lambda: _score_one_by_one(paths, skill_index), runs)
+        after = _time_per_call(lambda: scorer.score_batch(paths, skill_index), runs)
+        _report(f"{len(paths)} JD(s)", before, after)
+
+    print(f"  Equivalence on {len(jd_paths)} JD(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: role detection -------------------------------------------------
+
+def _legacy_role_scores(jd_text: str, structures: dict[str, dict]) -> dict[str, float]:
+    """Reference copy of auto_detect_role's per-keyword substring loop, all roles."""
+    jd_lower = jd_text.lower()
+    scores = {}
+    for role_slug, structure in structures.items():
+        score = 0.0
+        for variant in structure.get("role_variants", []):
+            if variant.lower() in jd_lower:
+                score += 2.0
+        kt = structure.get("keyword_targets", {})
+        for kw in kt.get("must_include", []):
+            if kw.lower() in jd_lower:
+                score += 1.0
+        for kw in kt.get("should_include", []):
+            if kw.lower() in jd_lower:
+                score += 0.5
+        scores[role_slug] = score
+    return scores
+
+
+def _legacy_auto_detect_role(jd_text: str) -> tuple[str, float]:
+    """Reference copy of auto_detect_role: re-read every structure on each call."""
+    best_role, best_score = "solutions-engineer", 0.0
+    for role_slug, score in _legacy_role_scores(jd_text, evaluate.load_structures()).items():
+        if score > best_score:
+            best_role, best_score = role_slug, score
+    return best_role, round(min(10.0, best_score), 1)
+
+
+def _grow_structures(structures: dict[str, dict], factor: int) -> dict[str, dict]:
+    """Simulate more role templates: copies with renamed roles and suffixed keywords."""
+    grown = dict(structures)
+    for i in range(1, factor):
+        for role, structure in structures.items():
+            kt = structure.get("keyword_targets", {})
+            grown[f"{role}-{i}"] = {
+                "role_variants": [f"{v} {i}" for v in structure.get("role_variants", [])],
+                "keyword_targets": {
+                    "must_include": kt.get("must_include", []),
+                    "should_include": [f"{k} {i}" for k in kt.get("should_include", [])],
+                },
+            }
+    return grown
+
+
+def suite_roles(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[roles] role detection: per-keyword substring tests vs compiled RoleClassifier")
+    texts = [p.read_text(encoding="utf-8") for p in jd_paths]
+    structures = evaluate.load_structures()
+    classifier = evaluate.load_role_classifier()
+
+    ok = True
+    for path, text in zip(jd_paths, texts):
+        if (classifier.scores(text) != _legacy_role_scores(text, structures)
+                or evaluate.auto_detect_role(text) != _legacy_auto_detect_role(text)):
+            ok = False
+            print(f"  [!] MISMATCH for {path.name}")
+
+    text = max(texts, key=len)
+    before = _time_per_call(lambda: _legacy_auto_detect_role(text), repeat)
+    after = _time_per_call(lambda: evaluate.auto_detect_role(text), repeat)
+    _report("auto_detect_role (per call)", before, after)
+
+    for factor in (1, 5, 25):
+        grown = _grow_structures(structures, factor)
+        grown_classifier = evaluate.RoleClassifier.from_structures(grown)
+        for t in texts:
+            if grown_classifier.scores(t) != _legacy_role_scores(t, grown):
+                ok = False
+                print(f"  [!] MISMATCH with {len(grown)} roles")
+        before = _time_per_call(lambda: [_legacy_role_scores(t, grown) for t in texts], repeat)
+        after = _time_per_call(lambda: grown_classifier.scores_batch(texts), repeat)
+        _report(f"{len(grown)} roles x {len(texts)} JD(s), loaded", before, after)
+
+    print(f"  Equivalence on {len(jd_paths)} JD(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: candidate data block --------------------------------------------
+
+CANDIDATE_THREADS = 4
+CANDIDATE_ROUNDS = 100
+
+
+def suite_candidate(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[candidate] candidate data block: render per prompt vs memoized rendering")
+    ok = True
+    for role in generate_resume.get_available_roles():
+        inputs = generate_resume.load_prompt_inputs(role)
+        args = (inputs["portfolio"], inputs["taxonomy"], inputs["structure"], role)
+        rendered = generate_resume.render_candidate_data(*args)
+        generate_resume._CANDIDATE_BLOCKS.clear()
+        generate_resume._CANDIDATE_KEYS.clear()
+        if generate_resume.format_candidate_data(*args) != rendered:
+            ok = False
+            print(f"  [!] MISMATCH for {role}")
+
+        def from_disk():
+            generate_resume._CANDIDATE_BLOCKS.clear()
+            generate_resume._CANDIDATE_KEYS.clear()
+            return generate_resume.format_candidate_data(*args)
+
+        before = _time_per_call(lambda: generate_resume.render_candidate_data(*args), repeat)
+        _report(f"{role}: disk cache", before, _time_per_call(from_disk, repeat))
+        _report(f"{role}: memory cache", before,
+                _time_per_call(lambda: generate_resume.format_candidate_data(*args), repeat))
+
+    # Three prompt modes for every JD, the way a batch assembles them
+    inputs = generate_resume.load_prompt_inputs("solutions-engineer")
+    texts = [p.read_text(encoding="utf-8") for p in jd_paths]
+
+    def assemble_all():
+        for text in texts:
+            for mode in PROMPT_MODES:
+                generate_resume.build_prompt(mode, text, "solutions-engineer", inputs)
+
+    original = generate_resume.format_candidate_data
+    generate_resume.format_candidate_data = generate_resume.render_candidate_data
+    try:
+        before = _time_per_call(assemble_all, repeat)
+    finally:
+        generate_resume.format_candidate_data = original
+    after = _time_per_call(assemble_all, repeat)
+    _report(f"{len(texts) * len(PROMPT_MODES)} prompts, all modes", before, after)
+
+    # evaluate.py --jobs runs the prompt stages on threads: concurrent first renderings
+    # of one block must not collide on the disk cache's temp file
+    args = (inputs["portfolio"], inputs["taxonomy"], inputs["structure"], "solutions-engineer")
+    rendered = generate_resume.render_candidate_data(*args)
+    saved_cache_dir = generate_resume.CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_resume.CACHE_DIR = Path(tmp)
+            barrier = threading.Barrier(CANDIDATE_THREADS)
+
+            def first_call(_) -> str:
+                barrier.wait()
+                return generate_resume.format_candidate_data(*args)
+
+            errors = 0
+            with ThreadPoolExecutor(max_workers=CANDIDATE_THREADS) as pool:
+                for _ in range(CANDIDATE_ROUNDS):
+                    generate_resume._CANDIDATE_BLOCKS.clear()
+                    for p in Path(tmp).iterdir():
+                        p.unlink()
+                    futures = [pool.submit(first_call, t) for t in range(CANDIDATE_THREADS)]
+                    for future in futures:
+                        try:
+                            if future.result() != rendered:
+                                errors += 1
+                        except OSError:
+                            errors += 1
+            leftovers = [p.name for p in Path(tmp).iterdir() if p.suffix != ".md"]
+    finally:
+        generate_resume.CACHE_DIR = saved_cache_dir
+    if errors or leftovers:
+        ok = False
+        print(f"  [!] {errors} of {CANDIDATE_ROUNDS * CANDIDATE_THREADS} concurrent first renderings failed "
+              f"or differed; temp files left: {leftovers}")
+    print(f"  {'':<34} {CANDIDATE_ROUNDS} rounds of {CANDIDATE_THREADS} concurrent first renderings: "
+          f"{errors} failed")
+
+    print(f"  Cached block matches a fresh rendering: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: content bank pre-selection -------------------------------------
+
+def _legacy_preselect_bullets(bullet_bank: dict, jd_keywords: list[str], role: str,
+                              max_per_company: int = 5) -> dict[str, list[dict]]:
+    """Reference copy of preselect_bullets: substring tests over every tag of every bullet."""
+    slug = generate_resume._slug
+    kw_set = set(slug(k) for k in jd_keywords)
+    result: dict[str, list[dict]] = {}
+    for entry in bullet_bank.get("companies", []):
+        scored = []
+        for b in entry.get("bullets", []):
+            tags = [slug(t) for t in (b.get("tags") or [])]
+            clusters = [slug(c) for c in (b.get("clusters") or [])]
+            roles = b.get("applicable_roles") or []
+            tag_hits = sum(1 for t in tags if any(t in kw or kw in t for kw in kw_set))
+            cluster_hits = sum(1 for c in clusters if any(c in kw or kw in c for kw in kw_set))
+            role_bonus = 2 if not roles or role in roles else 0
+            scored.append((tag_hits * 2 + cluster_hits * 1.5 + role_bonus, b))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        result[entry.get("company", "Unknown")] = [b for _, b in scored[:max_per_company]]
+    return result
+
+
+def _legacy_preselect_paragraphs(paragraph_bank: dict, jd_keywords: list[str], role: str,
+                                 max_paragraphs: int = 3) -> list[dict]:
+    """Reference copy of preselect_paragraphs."""
+    slug = generate_resume._slug
+    kw_set = set(slug(k) for k in jd_keywords)
+    scored = []
+    for para in paragraph_bank.get("paragraphs", []):
+        tags = [slug(t) for t in (para.get("tags") or [])]
+        applicable = para.get("applicable_roles") or []
+        tag_hits = sum(1 for t in tags if any(t in kw or kw in t for kw in kw_set))
+        scored.append((tag_hits * 2 + (2 if not applicable or role in applicable else 0), para))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [p for _, p in scored[:max_paragraphs]]
+
+
+def _grow_bullet_bank(bullet_bank: dict, factor: int) -> dict:
+    """Simulate a larger bank: copies of every company with some tags suffixed per copy."""
+    companies = []
+    for i in range(factor):
+        for entry in bullet_bank.get("companies", []):
+            bullets = [
+                dict(b, tags=[t if j % 2 else f"{t} {i}" for j, t in enumerate(b.get("tags") or [])])
+                for b in entry.get("bullets", [])
+            ]
+            companies.append({"company": f"{entry.get('company')} {i}", "bullets": bullets})
+    return {"companies": companies}
+
+
+def suite_banks(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[banks] bullet/paragraph pre-selection: substring scan vs inverted tag index")
+    bullet_bank, paragraph_bank = evaluate.load_content_banks()
+    keyword_sets = []
+    for path in jd_paths:
+        parsed = jd_parser.parse_jd(path)
+        keyword_sets.append(parsed.get("raw_keywords", []) + parsed.get("required_skills", []))
+    # Edge cases: no keywords, an empty keyword (matches every tag), keywords that contain tags
+    keyword_sets += [[], ["", "python"], ["crm integration platform", "saas onboarding at scale"]]
+    roles = generate_resume.get_available_roles()
+
+    ok = True
+    for factor in (1, 10, 100):
+        bank = bullet_bank if factor == 1 else _grow_bullet_bank(bullet_bank, factor)
+        n_bullets = sum(len(c["bullets"]) for c in bank["companies"])
+        build = _time_per_call(lambda: generate_resume.TagIndex(
+            [b for c in bank["companies"] for b in c["bullets"]]), 1)
+        for kws in keyword_sets:
+            for role in roles:
+                if (generate_resume.preselect_bullets(bank, kws, role)
+                        != _legacy_preselect_bullets(bank, kws, role)):
+                    ok = False
+                    print(f"  [!] MISMATCH for {n_bullets} bullets, role {role}, keywords {kws[:3]}")
+        before = _time_per_call(
+            lambda: [_legacy_preselect_bullets(bank, k, "solutions-engineer") for k in keyword_sets],
+            max(1, repeat // factor))
+        after = _time_per_call(
+            lambda: [generate_resume.preselect_bullets(bank, k, "solutions-engineer")
+                     for k in keyword_sets], max(1, repeat // factor))
+        _report(f"{n_bullets} bullets x {len(keyword_sets)} JD(s)", before, after)
+        print(f"  {'':<34} index build {build * 1e3:.1f} ms (once per bank)")
+
+    for kws in keyword_sets:
+        for role in roles:
+            if (generate_resume.preselect_paragraphs(paragraph_bank, kws, role)
+                    != _legacy_preselect_paragraphs(paragraph_bank, kws, role)):
+                ok = False
+                print(f"  [!] MISMATCH for paragraphs, role {role}, keywords {kws[:3]}")
+    before = _time_per_call(
+        lambda: [_legacy_preselect_paragraphs(paragraph_bank, k, "solutions-engineer")
+                 for k in keyword_sets], repeat)
+    after = _time_per_call(
+        lambda: [generate_resume.preselect_paragraphs(paragraph_bank, k, "solutions-engineer")
+                 for k in keyword_sets], repeat)
+    _report(f"paragraphs x {len(keyword_sets)} JD(s)", before, after)
+
+    print(f"  Equivalence on {len(keyword_sets)} keyword set(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: budget-aware bullet selection -----------------------------------
+
+SELECTION_LIMITS = {"min_per_company": 2, "max_per_company": 5, "max_per_tag": 3}
+
+
+def _selection_violations(bank: dict, selected: dict[str, list[dict]], budget: int) -> list[str]:
+    """Constraints of select_bullets_within_budget that a selection breaks."""
+    problems = []
+    used = sum(generate_resume.bullet_cost(b) for v in selected.values() for b in v)
+    if used > budget:
+        problems.append(f"{used} words > budget {budget}")
+    tag_counts: dict[str, int] = {}
+    for entry in bank["companies"]:
+        picked = selected.get(entry["company"], [])
+        if len(picked) > SELECTION_LIMITS["max_per_company"]:
+            problems.append(f"{entry['company']}: {len(picked)} bullets")
+        for b in picked:
+            for t in set(generate_resume._slug(t) for t in b.get("tags") or []):
+                tag_counts[t] = tag_counts.get(t, 0) + 1
+    problems += [f"tag {t} on {n} bullets" for t, n in tag_counts.items()
+                 if n > SELECTION_LIMITS["max_per_tag"]]
+    return problems
+
+
+def _exact_selection_value(bank: dict, kws: list[str], role: str, budget: int) -> float:
+    """
+    Optimal relevance by exhaustive search; only for banks of ~16 bullets.
+    Per-company minimums are best-effort in the solver, so they are left out
+    here and the result is an upper bound on any selection it can return.
+    """
+    index, bullets, spans = generate_resume._bullet_bank_index(bank)
+    scores = index.scores(set(generate_resume._slug(k) for k in kws), role)
+    costs = [generate_resume.bullet_cost(b) for b in bullets]
+    company_of = [c for c, (_, start, end) in enumerate(spans) for _ in range(start, end)]
+    best = 0.0
+    for mask in range(1 << len(bullets)):
+        chosen = [i for i in range(len(bullets)) if mask >> i & 1]
+        if sum(costs[i] for i in chosen) > budget:
+            continue
+        per_company = [0] * len(spans)
+        per_tag: dict[int, int] = {}
+        for i in chosen:
+            per_company[company_of[i]] += 1
+            for t in index.entry_tags[i]:
+                per_tag[t] = per_tag.get(t, 0) + 1
+        if (any(n > SELECTION_LIMITS["max_per_company"] for n in per_company)
+                or any(n > SELECTION_LIMITS["max_per_tag"] for n in per_tag.values())):
+            continue
+        best = max(best, sum(scores[i] for i in chosen))
+    return best
+
+
+def _random_bank(rng, companies: int, per_company: int, tags: list[str]) -> dict:
+    return {"companies": [
+        {"company": f"Company {c}", "bullets": [
+            {"text": " ".join(["word"] * rng.randint(15, 40)),
+             "tags": rng.sample(tags, rng.randint(1, 4)),
+             "clusters": [],
+             "applicable_roles": rng.choice([[], ["solutions-engineer"], ["data-engineer"]])}
+            for _ in range(per_company)
+        ]} for c in range(companies)
+    ]}
+
+
+def suite_selection(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[selection] bullet selection: top 5 per company vs budget-aware global solver")
+    import random
+    rng = random.Random(7)
+    bullet_bank, _ = evaluate.load_content_banks()
+    keyword_sets = []
+    for path in jd_paths:
+        parsed = jd_parser.parse_jd(path)
+        keyword_sets.append(parsed.get("raw_keywords", []) + parsed.get("required_skills", []))
+    budget = generate_resume.DEFAULT_BULLET_WORD_BUDGET
+    select = generate_resume.select_bullets_within_budget
+
+    ok = True
+    for path, kws in zip(jd_paths, keyword_sets):
+        top5 = generate_resume.preselect_bullets(bullet_bank, kws, "solutions-engineer")
+        chosen = select(bullet_bank, kws, "solutions-engineer", budget=budget)
+        words = lambda sel: sum(generate_resume.bullet_cost(b) for v in sel.values() for b in v)
+        print(f"  {path.name:<50} top 5: {sum(map(len, top5.values())):>2} bullets "
+              f"{words(top5):>4} words  →  solver: {sum(map(len, chosen.values())):>2} bullets "
+              f"{words(chosen):>4} words")
+
+    # Feasibility on the real and grown banks, and distance from the fractional bound
+    for factor in (1, 10, 100):
+        bank = bullet_bank if factor == 1 else _grow_bullet_bank(bullet_bank, factor)
+        index, bullets, _ = generate_resume._bullet_bank_index(bank)
+        costs = [generate_resume.bullet_cost(b) for b in bullets]
+        ratios = []
+        for kws in keyword_sets:
+            for b in (150, budget, 800):
+                chosen = select(bank, kws, "solutions-engineer", budget=b)
+                problems = _selection_violations(bank, chosen, b)
+                if problems:
+                    ok = False
+                    print(f"  [!] {len(bullets)} bullets, budget {b}: {'; '.join(problems[:3])}")
+                scores = index.scores(set(generate_resume._slug(k) for k in kws), "solutions-engineer")
+                value = sum(scores[bullets.index(x)] for v in chosen.values() for x in v) if factor == 1 \
+                    else None
+                if value is not None:
+                    ratios.append(value / generate_resume.fractional_bound(scores, costs, b))
+        top5 = _time_per_call(
+            lambda: [generate_resume.preselect_bullets(bank, k, "solutions-engineer")
+                     for k in keyword_sets], max(1, repeat // factor)) / len(keyword_sets)
+        solver = _time_per_call(
+            lambda: [select(bank, k, "solutions-engineer", budget=budget) for k in keyword_sets],
+            max(1, repeat // factor)) / len(keyword_sets)
+        print(f"  {len(bullets):>5} bullets, per JD: top 5 per company {top5 * 1e3:7.3f} ms   "
+              f"solver {solver * 1e3:7.3f} ms")
+        if ratios:
+            print(f"  {'':<34} relevance >= {min(ratios):.0%} of the fractional upper bound")
+
+    # Optimality against exhaustive search on small random banks
+    tags = [f"tag{i}" for i in range(12)]
+    ratios = []
+    for _ in range(20):
+        bank = _random_bank(rng, 3, 5, tags)
+        kws = rng.sample(tags, 5)
+        b = rng.choice((120, 200, 280))
+        chosen = select(bank, kws, "solutions-engineer", budget=b)
+        if _selection_violations(bank, chosen, b):
+            ok = False
+            print(f"  [!] random bank, budget {b}: {_selection_violations(bank, chosen, b)[:3]}")
+        index, bullets, _ = generate_resume._bullet_bank_index(bank)
+        scores = index.scores(set(kws), "solutions-engineer")
+        value = sum(scores[next(i for i, x in enumerate(bullets) if x is y)]
+                    for v in chosen.values() for y in v)
+        exact = _exact_selection_value(bank, kws, "solutions-engineer", b)
+        ratios.append(value / exact if exact else 1.0)
+    print(f"  Exact optimum on 20 random 15-bullet banks: mean {sum(ratios) / len(ratios):.1%}, "
+          f"worst {min(ratios):.1%}")
+
+    print(f"  Every selection within budget and limits: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: bank TF-IDF vectors ---------------------------------------------
+
+def suite_vectors(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[vectors] bank ranking: tag overlap vs TF-IDF cosine similarity")
+    bullet_bank, paragraph_bank = evaluate.load_content_banks()
+    docs = [jd_parser.JDDocument.from_path(p) for p in jd_paths]
+    ok = True
+
+    for kind, bank in (("bullet", bullet_bank), ("paragraph", paragraph_bank)):
+        texts = bank_vectors.bank_texts(bank, kind)
+        built = bank_vectors.BankVectors.from_texts(texts)
+        loaded = bank_vectors.load_bank_vectors(texts, kind)
+        if (loaded.vocab, loaded.indices, loaded.data) != (built.vocab, built.indices, built.data):
+            ok = False
+            print(f"  [!] persisted {kind} vectors differ from a fresh build")
+        for doc in docs:
+            # A JDDocument and its raw text must vectorize identically
+            if any(abs(a - b) > 1e-12
+                   for a, b in zip(built.similarities(doc), built.similarities(doc.text))):
+                ok = False
+                print(f"  [!] {kind}: JDDocument and text vectors differ for {doc.source.name}")
+        if bank_vectors.NUMPY_AVAILABLE:
+            batch = built.similarities_batch(docs)
+            for doc, row in zip(docs, batch):
+                if any(abs(a - b) > 1e-9 for a, b in zip(row, built.similarities(doc))):
+                    ok = False
+                    print(f"  [!] {kind}: numpy batch differs for {doc.source.name}")
+
+        build = _time_per_call(lambda: bank_vectors.BankVectors.from_texts(texts), repeat)
+        load = _time_per_call(lambda: bank_vectors.load_bank_vectors(texts, kind), repeat)
+        print(f"  {kind} bank: {built.n_rows} entries, {len(built.vocab)} terms; "
+              f"build {build * 1e3:.2f} ms, load persisted {load * 1e3:.2f} ms")
+        per_jd = _time_per_call(lambda: [built.similarities(d) for d in docs], repeat) / len(docs)
+        print(f"  {'':<34} rank per JD {per_jd * 1e3:.3f} ms", end="")
+        if bank_vectors.NUMPY_AVAILABLE:
+            batched = _time_per_call(lambda: built.similarities_batch(docs), repeat) / len(docs)
+            print(f"  (numpy batch of {len(docs)}: {batched * 1e3:.3f} ms per JD)")
+        else:
+            print()
+
+    for path, doc in zip(jd_paths, docs):
+        parsed = jd_parser.parse_jd(path, doc=doc)
+        kws = parsed.get("raw_keywords", []) + parsed.get("required_skills", [])
+        by_tags = generate_resume.preselect_bullets(bullet_bank, kws, "solutions-engineer")
+        by_text = generate_resume.preselect_bullets(bullet_bank, kws, "solutions-engineer",
+                                                    ranking="tfidf", jd=doc)
+        shared = sum(len({id(b) for b in by_tags[c]} & {id(b) for b in by_text[c]}) for c in by_tags)
+        total = sum(len(v) for v in by_tags.values())
+        print(f"  {path.name:<50} {shared}/{total} bullets shared by tag and TF-IDF selection")
+
+    print(f"  Persisted, text and batch vectors agree: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: tracker store ---------------------------------------------------
+
+TRACKER_ROWS = 3000
+
+
+def _synthetic_tracker(rows: int) -> dict:
+    statuses = sorted(tracker.VALID_STATUSES)
+    return {"applications": [
+        tracker.build_entry(
+            company=f"Company {i:05d}",
+            role=("Solutions Engineer", "Data Engineer", "Platform Architect")[i % 3],
+            fit_score=round(3 + (i * 37 % 70) / 10, 1),
+            recommendation="APPLY" if i % 4 else "SKIP — missing Spark",
+            status=statuses[i % len(statuses)],
+            output_file=f"output/application-company-{i:05d}-2026-01-01.md",
+            date_evaluated=f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            notes="synthetic" if i % 5 == 0 else "",
+        )
+        for i in range(rows)
+    ]}
+
+
+def _captured(fn, *args) -> str:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        fn(*args)
+    return buf.getvalue()
+
+
+def suite_tracker(jd_paths: list[Path], repeat: int) -> bool:
+    print(f"\n[tracker] --update on a {TRACKER_ROWS}-row tracker: YAML round-trip vs SQLite")
+    ok = True
+    saved = tracker.TRACKER_PATH, tracker.TRACKER_DB_PATH, tracker.ROOT
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker.TRACKER_PATH = Path(tmp) / "output" / "tracker.yaml"
+        tracker.TRACKER_DB_PATH = Path(tmp) / "output" / "tracker.db"
+        tracker.ROOT = Path(tmp)
+        try:
+            tracker.save_tracker(_synthetic_tracker(TRACKER_ROWS))
+            db = tracker.TrackerDB()
+            db.import_data(tracker.load_tracker())
+
+            # Both stores must print the same status table and export the same CSV
+            for label, cmd in (("--status", tracker.cmd_status), ("--export-csv", tracker.cmd_export_csv)):
+                from_yaml = _captured(cmd, tracker.load_tracker())
+                csv_yaml = (Path(tmp) / "output" / "tracker.csv").read_bytes() if label == "--export-csv" else b""
+                from_db = _captured(cmd, None, db)
+                csv_db = (Path(tmp) / "output" / "tracker.csv").read_bytes() if label == "--export-csv" else b""
+                if from_yaml != from_db or csv_yaml != csv_db:
+                    ok = False
+                    print(f"  [!] {label} differs between the YAML and SQLite stores")
+            if db.export_data()["applications"] != tracker.load_tracker()["applications"]:
+                ok = False
+                print("  [!] SQLite export differs from the imported YAML")
+
+            target = f"Company {TRACKER_ROWS - 1:05d}"
+            changes = {"status": "interviewing", "notes": "Phone screen"}
+
+            def yaml_update():
+                data = tracker.load_tracker()
+                idx = tracker.find_entry(data["applications"], target)
+                data["applications"][idx].update(changes)
+                tracker.save_tracker(data)
+
+            rounds = max(1, repeat // 10)
+            before = _time_per_call(yaml_update, rounds)
+            after = _time_per_call(lambda: db.update(target, None, changes), rounds)
+            _report("update one entry", before, after)
+            before = _time_per_call(lambda: _captured(tracker.cmd_status, tracker.load_tracker()), rounds)
+            after = _time_per_call(lambda: _captured(tracker.cmd_status, None, db), rounds)
+            _report("--status", before, after)
+            db.close()
+        finally:
+            tracker.TRACKER_PATH, tracker.TRACKER_DB_PATH, tracker.ROOT = saved
+
+    print(f"  Status table, CSV and YAML export agree: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: incremental output scan -----------------------------------------
+
+SCAN_FILES = 2000
+SCAN_NEW_FILES = 10
+
+
+def _write_outputs(output_dir: Path, sources: list[Path], start: int, count: int) -> None:
+    """Copies of the real application files, each under its own company name."""
+    for i in range(start, start + count):
+        src = sources[i % len(sources)]
+        role = re.sub(r"^application-[^-]+-|-\d{4}-\d{2}-\d{2}$", "", src.stem)
+        (output_dir / f"application-co{i:05d}-{role}-2026-01-01.md").write_bytes(src.read_bytes())
+
+
+def suite_scan(jd_paths: list[Path], repeat: int) -> bool:
+    print(f"\n[scan] --scan-outputs over {SCAN_FILES} files with {SCAN_NEW_FILES} new: full vs manifest")
+    sources = sorted(evaluate.OUTPUT_DIR.glob("application-*.md"))
+    if not sources:
+        print("  [!] no output/application-*.md files to copy; skipped")
+        return True
+    ok = True
+    saved = (tracker.OUTPUT_DIR, tracker.SCAN_MANIFEST_PATH, tracker.ROOT,
+             tracker.TRACKER_PATH, tracker.TRACKER_DB_PATH)
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker.ROOT = Path(tmp)
+        tracker.OUTPUT_DIR = Path(tmp) / "output"
+        tracker.SCAN_MANIFEST_PATH = Path(tmp) / ".cache" / "scan-outputs.json"
+        tracker.TRACKER_PATH = tracker.OUTPUT_DIR / "tracker.yaml"
+        tracker.TRACKER_DB_PATH = tracker.OUTPUT_DIR / "tracker.db"
+        tracker.OUTPUT_DIR.mkdir()
+        try:
+            _write_outputs(tracker.OUTPUT_DIR, sources, 0, SCAN_FILES)
+            _captured(tracker.scan_outputs)
+            _write_outputs(tracker.OUTPUT_DIR, sources, SCAN_FILES, SCAN_NEW_FILES)
+
+            # An incremental scan must add exactly what a full rescan adds
+            snapshot = tracker.TRACKER_PATH.read_bytes()
+            manifest = tracker.SCAN_MANIFEST_PATH.read_bytes()
+            _captured(tracker.scan_outputs)
+            incremental = tracker.load_tracker()["applications"]
+            tracker.TRACKER_PATH.write_bytes(snapshot)
+            _captured(tracker.scan_outputs, False, None, True)
+            full = tracker.load_tracker()["applications"]
+            if incremental != full or len(full) != SCAN_FILES + SCAN_NEW_FILES:
+                ok = False
+                print("  [!] incremental scan and full rescan added different entries")
+
+            # Time dry runs against an SQLite store so tracker I/O does not dominate
+            tracker.TRACKER_PATH.write_bytes(snapshot)
+            tracker.SCAN_MANIFEST_PATH.write_bytes(manifest)
+            with tracker.TrackerDB() as db:
+                db.import_data(tracker.load_tracker())
+                rounds = max(1, repeat // 10)
+                before = _time_per_call(lambda: _captured(tracker.scan_outputs, True, db, True), rounds)
+                after = _time_per_call(lambda: _captured(tracker.scan_outputs, True, db), rounds)
+            _report(f"rescan with {SCAN_NEW_FILES} new files", before, after)
+        finally:
+            (tracker.OUTPUT_DIR, tracker.SCAN_MANIFEST_PATH, tracker.ROOT,
+             tracker.TRACKER_PATH, tracker.TRACKER_DB_PATH) = saved
+
+    print(f"  Incremental and full scans agree: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: concurrent writers ----------------------------------------------
+
+STRESS_WRITERS = 8
+STRESS_ENTRIES = 10
+
+
+def _legacy_add_application(entry: dict) -> None:
+    """Reference copy of the unlocked load → append → rewrite in place."""
+    data = tracker.load_tracker()
+    data["applications"].append(entry)
+    data["metadata"] = {"last_updated": str(date.today())}
+    with open(tracker.TRACKER_PATH, "w", encoding="utf-8") as f:
+        tracker.yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+
+def _legacy_append_gap_entries(entries: list[dict]) -> None:
+    skill_dev = evaluate.load_yaml(evaluate.SKILL_DEV_PATH)
+    skill_dev.setdefault("gap_tracking_log", []).extend(entries)
+    evaluate.save_yaml(evaluate.SKILL_DEV_PATH, skill_dev)
+
+
+def _legacy_update_manifest(entries: dict[str, dict[str, dict]]) -> None:
+    manifest = build_cache.load_manifest()
+    for target, stages in entries.items():
+        manifest["targets"].setdefault(target, {}).update(stages)
+    build_cache.save_manifest(manifest)
+
+
+def _stress_writer(job: tuple) -> int:
+    """One writer process: add its entries to the tracker, gap log and build manifest one at a time."""
+    tracker_path, skill_dev_path, writer, legacy = job
+    tracker.TRACKER_PATH = Path(tracker_path)
+    tracker.TRACKER_DB_PATH = Path(tracker_path).with_suffix(".db")
+    evaluate.SKILL_DEV_PATH = Path(skill_dev_path)
+    build_cache.BUILD_DIR = Path(tracker_path).parent / "build"
+    build_cache.MANIFEST_PATH = build_cache.BUILD_DIR / "manifest.json"
+    errors = 0
+    for i in range(STRESS_ENTRIES):
+        entry = tracker.build_entry(f"Writer {writer} Company {i}", "Solutions Engineer",
+                                    7.0, "APPLY", "applied")
+        gap = {"evaluation_date": "2026-01-01", "company": entry["company"], "role": entry["role"],
+               "source_file": "", "gaps_identified": ["Spark"]}
+        build = {f"archive/job-desc-writer-{writer}-{i}.txt": {"parse": {"key": f"{writer}-{i}", "inputs": {}}}}
+        try:
+            if legacy:
+                _legacy_add_application(entry)
+                _legacy_append_gap_entries([gap])
+                _legacy_update_manifest(build)
+            else:
+                tracker.add_applications([entry])
+                evaluate.append_gap_entries([gap])
+                build_cache.update_manifest(build)
+        except Exception:
+            errors += 1  # e.g. a half-written file that does not parse
+    return errors
+
+
+def _run_writers(tmp: Path, legacy: bool) -> tuple[int, int, int, int, float]:
+    """
+    Run the writers on fresh files; returns (tracker entries, gap entries,
+    manifest targets, errors, seconds).
+    """
+    tracker_path, skill_dev_path = tmp / "tracker.yaml", tmp / "skill-development.yaml"
+    tracker_path.write_text("applications: []\n", encoding="utf-8")
+    skill_dev_path.write_text("gap_tracking_log: []\n", encoding="utf-8")
+    (tmp / "build" / "manifest.json").unlink(missing_ok=True)
+    jobs = [(str(tracker_path), str(skill_dev_path), w, legacy) for w in range(STRESS_WRITERS)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(STRESS_WRITERS) as pool:
+        errors = sum(pool.map(_stress_writer, jobs))
+    elapsed = time.perf_counter() - start
+    try:
+        targets = len(json.loads((tmp / "build" / "manifest.json").read_text(encoding="utf-8"))["targets"])
+    except (OSError, ValueError):
+        targets = -1
+    return (_count_entries(tracker_path, "applications"),
+            _count_entries(skill_dev_path, "gap_tracking_log"), targets, errors, elapsed)
+
+
+def _count_entries(path: Path, key: str) -> int:
+    """Entries under key in a YAML file; -1 if the file was left corrupt."""
+    try:
+        return len(evaluate.load_yaml(path).get(key) or [])
+    except tracker.yaml.YAMLError:
+        return -1
+
+
+def suite_writers(jd_paths: list[Path], repeat: int) -> bool:
+    expected = STRESS_WRITERS * STRESS_ENTRIES
+    print(f"\n[writers] {STRESS_WRITERS} processes x {STRESS_ENTRIES} tracker + gap-log + build-manifest "
+          f"writes: unlocked vs locked")
+    if not tracker.FCNTL_AVAILABLE:
+        print("  (fcntl not available: locked writes use optimistic retries)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for legacy in (True, False):
+            apps, gaps, targets, errors, elapsed = _run_writers(Path(tmp), legacy)
+            label = "unlocked (previous)" if legacy else "locked"
+            counts = [f"{n:>4}/{expected}" if n >= 0 else "corrupt" for n in (apps, gaps, targets)]
+            print(f"  {label:<22} tracker {counts[0]:>9}  gap log {counts[1]:>9}  manifest {counts[2]:>9}  "
+                  f"errors {errors:>3}  {elapsed:6.2f} s")
+    ok = apps == gaps == targets == expected and errors == 0
+    print(f"  No locked write lost: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Local stand-in job board ------------------------------------------------
+
+class StandInBoard:
+    """
+    A local HTTP/1.1 server standing in for one job board host. It serves
+    pages[path] as (content type, body) with an ETag and Last-Modified, answers
+    304 to a matching If-None-Match, sleeps `latency` per request, answers 503
+    once for each path in fail_once and a 302 without Location for each path in
+    bare_redirects, and records connections, request start times, body bytes
+    sent and the peak number of requests in flight.
+    """
+
+    def __init__(self, pages: dict[str, tuple[str, bytes]], latency: float = 0.0):
+        self.pages, self.latency = pages, latency
+        self.fail_once: set[str] = set()
+        self.bare_redirects: set[str] = set()
+        self.connections: set[tuple] = set()
+        self.starts: list[float] = []
+        self.in_flight = self.peak = self.bytes_sent = 0
+        self.lock = threading.Lock()
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with board.lock:
+                    board.connections.add(self.client_address)
+                    board.starts.append(time.monotonic())
+                    board.in_flight += 1
+                    board.peak = max(board.peak, board.in_flight)
+                    fail = urlsplit(self.path).path in board.fail_once
+                    board.fail_once.discard(urlsplit(self.path).path)
+                try:
+                    time.sleep(board.latency)
+                    board.respond(self, fail)
+                finally:
+                    with board.lock:
+                        board.in_flight -= 1
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def respond(self, handler: BaseHTTPRequestHandler, fail: bool) -> None:
+        page = None if fail else self.pages.get(urlsplit(handler.path).path)
+        status = 503 if fail else (200 if page else 404)
+        content_type, body = page or ("text/plain", b"unavailable" if fail else b"not found")
+        if urlsplit(handler.path).path in self.bare_redirects:
+            page, status, content_type, body = None, 302, "text/html", b"<html><body><p>Moved</p></body></html>"
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if page and handler.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        if page:
+            handler.send_header("ETag", etag)
+            handler.send_header("Last-Modified", "Thu, 01 Oct 2026 00:00:00 GMT")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+        with self.lock:
+            self.bytes_sent += len(body)
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.connections.clear()
+            self.starts.clear()
+            self.peak = self.bytes_sent = 0
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _posting_html(board: int, job: int) -> bytes:
+    title = ("Solutions Engineer", "Data Engineer", "Analytics Engineer")[job % 3]
+    return f"""<!DOCTYPE html><html><head><title>{title}</title>
+<script>window.__STATE__ = {{"job": {job}}};</script><style>body {{ color: #333; }}</style></head>
+<body><nav><a href="/">All jobs</a></nav><main id="job-description">
+<h1>{title} &amp; Integrations</h1><p>Board {board} is hiring a {title} to own customer
+data pipelines.</p><h2>Requirements</h2><ul><li>5+ years of SQL &amp; Python</li>
+<li>Experience with dbt, Airflow and Snowflake</li><li>REST API integrations</li></ul>
+<p>Posting {board}-{job}. Salary &#36;150k&ndash;&#36;180k.</p></main>
+<footer>Apply for this job</footer></body></html>""".encode("utf-8")
+
+
+# ---- Suite: bulk JD fetching ------------------------------------------------
+
+FETCH_BOARDS = 3
+FETCH_JOBS_PER_BOARD = 20
+FETCH_LATENCY = 0.1
+FETCH_PER_HOST = 2
+FETCH_HOST_RATE = 40.0
+
+
+def suite_fetch(jd_paths: list[Path], repeat: int) -> bool:
+    total = FETCH_BOARDS * FETCH_JOBS_PER_BOARD
+    print(f"\n[fetch] {total} postings on {FETCH_BOARDS} stand-in boards "
+          f"({FETCH_LATENCY * 1e3:.0f} ms latency): one by one vs --urls-file")
+    boards = [StandInBoard({f"/jobs/{j}": ("text/html; charset=utf-8", _posting_html(b, j))
+                            for j in range(FETCH_JOBS_PER_BOARD)}, FETCH_LATENCY)
+              for b in range(FETCH_BOARDS)]
+    entries = [(f"{board.url}/jobs/{j}", f"Board {b}", None)
+               for j in range(FETCH_JOBS_PER_BOARD) for b, board in enumerate(boards)]
+    ok = True
+    saved_archive = fetch_jd.ARCHIVE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetch_jd.ARCHIVE_DIR = Path(tmp)
+            start = time.perf_counter()
+            expected = {url: fetch_jd.html_to_text(fetch_jd.fetch_html(url)) for url, _, _ in entries}
+            before = time.perf_counter() - start
+
+            for board in boards:
+                board.reset_stats()
+                board.fail_once = {"/jobs/0"}
+            start = time.perf_counter()
+            results, (opened, sent, _) = fetch_jd.fetch_many(
+                entries, workers=8, per_host=FETCH_PER_HOST, host_rate=FETCH_HOST_RATE, overwrite="skip")
+            after = time.perf_counter() - start
+            _report(f"fetch {total} postings", before, after)
+            print(f"  {'':<34} {sent} requests over {opened} connection(s); "
+                  f"peak in flight per host {max(b.peak for b in boards)}")
+
+            for r in results:
+                if r["status"] != "saved" or r["path"].read_text(encoding="utf-8") != expected[r["url"]]:
+                    ok = False
+                    print(f"  [!] {r['url']}: {r['status']} {r['note']}")
+            if len({r["path"] for r in results}) != total:
+                ok = False
+                print("  [!] postings were saved to colliding paths")
+            if max(b.peak for b in boards) > FETCH_PER_HOST or opened > FETCH_BOARDS * FETCH_PER_HOST:
+                ok = False
+                print("  [!] per-host concurrency cap or connection reuse not respected")
+            # Server-side start times jitter by a few ms; check the mean rate and a loose minimum gap
+            for board in boards:
+                rate = (len(board.starts) - 1) / (board.starts[-1] - board.starts[0])
+                min_gap = min(b - a for a, b in zip(board.starts, board.starts[1:]))
+                if rate > FETCH_HOST_RATE * 1.05 or min_gap < 0.5 / FETCH_HOST_RATE:
+                    ok = False
+                    print(f"  [!] per-host rate cap not respected ({rate:.1f} req/s, "
+                          f"min gap {min_gap * 1e3:.1f} ms)")
+            if sum(r["attempts"] for r in results) != total + FETCH_BOARDS:
+                ok = False
+                print("  [!] the scripted 503s were not retried exactly once")
+
+            # A second run with --overwrite skip must not touch the network
+            for board in boards:
+                board.reset_stats()
+            again, _ = fetch_jd.fetch_many(entries, overwrite="skip")
+            if any(r["status"] != "skipped" for r in again) or any(b.starts for b in boards):
+                ok = False
+                print("  [!] --overwrite skip re-fetched existing postings")
+
+            # A redirect with nowhere to go fails instead of saving its body as the JD
+            boards[0].bare_redirects = {"/moved"}
+            archived = set(Path(tmp).iterdir())
+            moved, _ = fetch_jd.fetch_many([(f"{boards[0].url}/moved", "Board 0", "Moved")], overwrite="skip")
+            if moved[0]["status"] != "failed" or set(Path(tmp).iterdir()) != archived:
+                ok = False
+                print(f"  [!] a 302 without Location was {moved[0]['status']}: {moved[0]['note']}")
+    finally:
+        fetch_jd.ARCHIVE_DIR = saved_archive
+        for board in boards:
+            board.close()
+
+    print(f"  Bulk and single fetches agree; caps, retries, skip policy and redirects held: "
+          f"{'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: conditional HTTP cache ------------------------------------------
+
+HTTPCACHE_JOBS = 40
+HTTPCACHE_PAGE_KB = 200  # real board pages carry this much inline script and markup
+
+
+def _heavy_posting_html(job: int) -> bytes:
+    filler = b"<script>" + b"window.__BOOT__.push({});" * (HTTPCACHE_PAGE_KB * 40) + b"</script>"
+    return _posting_html(0, job).replace(b"</body>", filler + b"</body>")
+
+
+def suite_httpcache(jd_paths: list[Path], repeat: int) -> bool:
+    print(f"\n[httpcache] {HTTPCACHE_JOBS} postings re-fetched with --overwrite overwrite: "
+          f"no cache vs conditional requests")
+    board = StandInBoard({f"/jobs/{j}": ("text/html; charset=utf-8", _heavy_posting_html(j))
+                          for j in range(HTTPCACHE_JOBS)}, FETCH_LATENCY / 10)
+    entries = [(f"{board.url}/jobs/{j}?utm_source=feed", "Board 0", None) for j in range(HTTPCACHE_JOBS)]
+    ok = True
+    saved_archive = fetch_jd.ARCHIVE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetch_jd.ARCHIVE_DIR = Path(tmp) / "archive"
+            fetch_jd.ARCHIVE_DIR.mkdir()
+            cache = fetch_jd.HttpCache(Path(tmp) / "http")
+            run = lambda c: fetch_jd.fetch_many(entries, workers=8, per_host=4, host_rate=1000,
+                                                overwrite="overwrite", cache=c)
+
+            first, _ = run(cache)
+            if any(r["status"] != "saved" for r in first):
+                ok = False
+                print("  [!] first run did not save every posting")
+            mtimes = {r["path"]: r["path"].stat().st_mtime_ns for r in first}
+
+            board.reset_stats()
+            start = time.perf_counter()
+            plain, _ = run(None)
+            before, bytes_before = time.perf_counter() - start, board.bytes_sent
+
+            board.reset_stats()
+            start = time.perf_counter()
+            cached, _ = run(cache)
+            after, bytes_after = time.perf_counter() - start, board.bytes_sent
+            _report(f"re-fetch {HTTPCACHE_JOBS} postings", before, after)
+            print(f"  {'':<34} body bytes sent: {bytes_before:,} → {bytes_after:,}")
+
+            if any(r["status"] != "unchanged" for r in plain):
+                ok = False
+                print("  [!] identical text without the cache was not reported unchanged")
+            if any(r["status"] != "unchanged" or r["http"] != 304 for r in cached) or bytes_after:
+                ok = False
+                print("  [!] cached re-fetch was not answered with 304s")
+            if any(p.stat().st_mtime_ns != m for p, m in mtimes.items()):
+                ok = False
+                print("  [!] unchanged postings were rewritten")
+
+            # A changed posting is saved again and its cache entry replaced
+            path = "/jobs/3"
+            board.pages[path] = ("text/html; charset=utf-8", _heavy_posting_html(3).replace(b"SQL", b"Go"))
+            changed, _ = run(cache)
+            target = [r for r in changed if r["url"].split("?")[0].endswith(path)]
+            if [r["status"] for r in changed].count("saved") != 1 or target[0]["status"] != "saved" \
+                    or "Go" not in target[0]["path"].read_text(encoding="utf-8"):
+                ok = False
+                print("  [!] a changed posting was not re-saved")
+            if cache.body(f"{board.url}{path}") != board.pages[path][1]:
+                ok = False
+                print("  [!] cache entry was not refreshed after a change")
+
+            # Size-based LRU: a small cache keeps only the most recently used bodies
+            size = len(board.pages["/jobs/0"][1])
+            small = fetch_jd.HttpCache(Path(tmp) / "small", max_bytes=size * 10)
+            for url, _, _ in entries:
+                small.store(url, {"etag": '"x"'}, board.pages[urlsplit(url).path][1])
+                time.sleep(0.002)  # distinct mtimes for the LRU order
+            kept = sum(p.stat().st_size for p in small.dir.glob("*.body"))
+            if kept > small.max_bytes or small.lookup(entries[-1][0]) is None or small.lookup(entries[0][0]):
+                ok = False
+                print(f"  [!] LRU eviction kept {kept:,} bytes (cap {small.max_bytes:,})")
+    finally:
+        fetch_jd.ARCHIVE_DIR = saved_archive
+        board.close()
+
+    print(f"  304s leave archive files untouched; changes re-saved; LRU cap held: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: ATS job APIs ----------------------------------------------------
+
+# Recorded-shape API payloads in fixtures/ats/: (platform, board, posting id, fixture,
+# API path, expected requirements / responsibilities lines once parsed)
+ATS_FIXTURES = [
+    ("greenhouse", "northwindanalytics", "4012345", "greenhouse-job.json",
+     "/v1/boards/northwindanalytics/jobs/4012345", 4, 6),
+    ("lever", "tidewater", "5c3d9e21-7a4b-4f0e-9b61-2a8f1c7d4e90", "lever-posting.json",
+     "/v0/postings/tidewater/5c3d9e21-7a4b-4f0e-9b61-2a8f1c7d4e90", 4, 5),
+    ("ashby", "harbor-ai", "9b2f4c1e-3d7a-4e8b-a1c2-6f5e4d3c2b1a", "ashby-board.json",
+     "/posting-api/job-board/harbor-ai", 3, 3),
+]
+ATS_POSTING_URLS = {
+    "greenhouse": "https://boards.greenhouse.io/{board}/jobs/{id}",
+    "lever": "https://jobs.lever.co/{board}/{id}",
+    "ashby": "https://jobs.ashbyhq.com/{board}/{id}",
+}
+
+
+def _description_html(platform: str, data: dict, job_id: str) -> tuple[str, str]:
+    """(title, description HTML) of a fixture posting, as its rendered page would show them."""
+    if platform == "greenhouse":
+        return data["title"], html.unescape(data["content"])
+    if platform == "lever":
+        lists = "".join(f"<h3>{e['text']}</h3><ul>{e['content']}</ul>" for e in data["lists"])
+        return data["text"], data["description"] + lists + data["additional"]
+    job = next(j for j in data["jobs"] if j["id"] == job_id)
+    return job["title"], job["descriptionHtml"]
+
+
+def _rendered_page(title: str, description: str) -> bytes:
+    """A career-site page around a description: inline app state, styles, nav and footer."""
+    filler = "window.__BOOT__.push({});" * (HTTPCACHE_PAGE_KB * 40)
+    return f"""<!DOCTYPE html><html><head><title>{html.escape(title)}</title>
+<style>body {{ font-family: sans-serif; }}</style><script>{filler}</script></head>
+<body><nav><a href="/">All jobs</a></nav><main><h1>{html.escape(title)}</h1>{description}</main>
+<footer>Apply for this job</footer></body></html>""".encode("utf-8")
+
+
+def suite_ats(jd_paths: list[Path], repeat: int) -> bool:
+    print(f"\n[ats] {len(ATS_FIXTURES)} postings from fixtures/ats/: rendered page vs job API")
+    pages, payloads = {}, []
+    for platform, board, job_id, fixture, api_path, _, _ in ATS_FIXTURES:
+        body = (FIXTURES_DIR / "ats" / fixture).read_bytes()
+        title, description = _description_html(platform, json.loads(body), job_id)
+        pages[api_path] = ("application/json; charset=utf-8", body)
+        pages[f"/page/{platform}"] = ("text/html; charset=utf-8", _rendered_page(title, description))
+        payloads.append((platform, board, job_id, body, pages[f"/page/{platform}"][1]))
+    server = StandInBoard(pages)
+
+    html_bytes = sum(len(p[4]) for p in payloads)
+    api_bytes = sum(len(p[3]) for p in payloads)
+    before = sum(_time_per_call(lambda: fetch_jd.html_to_text(page.decode("utf-8")), repeat)
+                 for _, _, _, _, page in payloads)
+    after = sum(_time_per_call(lambda: fetch_jd.posting_to_text(
+                    fetch_jd.ats_extract(platform, board, job_id, json.loads(body))), repeat)
+                for platform, board, job_id, body, _ in payloads)
+    _report(f"extract {len(payloads)} postings", before, after)
+    print(f"  {'':<34} bytes per run: {html_bytes:,} → {api_bytes:,}")
+
+    ok = True
+    saved = (fetch_jd.ARCHIVE_DIR, fetch_jd.GREENHOUSE_API, fetch_jd.LEVER_API, fetch_jd.ASHBY_API)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetch_jd.ARCHIVE_DIR = Path(tmp)
+            fetch_jd.GREENHOUSE_API = fetch_jd.LEVER_API = fetch_jd.ASHBY_API = server.url
+            entries = [(ATS_POSTING_URLS[platform].format(board=board, id=job_id), None, None)
+                       for platform, board, job_id, *_ in ATS_FIXTURES]
+            entries += [(f"{server.url}/page/{platform}", None, platform) for platform, *_ in ATS_FIXTURES]
+            results, _ = fetch_jd.fetch_many(entries, host_rate=1000)
+            api_results, page_results = results[:len(ATS_FIXTURES)], results[len(ATS_FIXTURES):]
+
+            print(f"  {'Platform':<11} {'Output':<58} {'Req':>7} {'Resp':>7}")
+            for fixture, r, page_r in zip(ATS_FIXTURES, api_results, page_results):
+                platform, board, job_id, name, _, want_req, want_resp = fixture
+                if r["status"] != "saved" or page_r["status"] != "saved":
+                    ok = False
+                    print(f"  [!] {platform}: {r['status']} {r['note']} / {page_r['status']} {page_r['note']}")
+                    continue
+                posting = fetch_jd.ats_extract(platform, board, job_id,
+                                               json.loads((FIXTURES_DIR / "ats" / name).read_bytes()))
+                text = r["path"].read_text(encoding="utf-8")
+                want_path = fetch_jd.build_output_path(posting["company"], posting["role"])
+                doc = jd_parser.JDDocument(text)
+                page_doc = jd_parser.JDDocument(page_r["path"].read_text(encoding="utf-8"))
+                req, resp = len(doc.sections["requirements"]), len(doc.sections["responsibilities"])
+                print(f"  {platform:<11} {r['path'].name:<58} "
+                      f"{len(page_doc.sections['requirements']):>2} → {req:<2} "
+                      f"{len(page_doc.sections['responsibilities']):>2} → {resp:<2}")
+                if text != fetch_jd.posting_to_text(posting) or r["path"] != want_path:
+                    ok = False
+                    print(f"  [!] {platform}: saved text or path differs from the extracted posting")
+                if (req, resp) != (want_req, want_resp) or not text.startswith(
+                        f"Company: {posting['company']}\nTitle: {posting['role']}\n"):
+                    ok = False
+                    print(f"  [!] {platform}: expected {want_req}/{want_resp} requirement/responsibility lines")
+    finally:
+        fetch_jd.ARCHIVE_DIR, fetch_jd.GREENHOUSE_API, fetch_jd.LEVER_API, fetch_jd.ASHBY_API = saved
+        server.close()
+
+    print(f"  API postings saved with company, title and sections: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: HTML to text ----------------------------------------------------
+
+HTML_PAGE_MB = 1.5  # fixtures are padded with inline app state to a real career page's size
+HTML_PEAK_MB = 0.5  # streaming bound: script bodies are dropped as they arrive, not buffered
+HTML_RANDOM_SPLITS = 300  # random chunkings per page, on top of every split around an end tag
+# End tags a plain "</script>" search would misread: a decoy, whitespace, case, a trailing "/"
+HTML_END_TAG_EDGES = (b'<p>one</p><script>var s = "</scripts>";</script  \n><p>two</p>'
+                      b'<STYLE>p { color: red }</Style ><p>three</p><script></script/><p>four</p>')
+
+
+def _legacy_html_to_text(html: str, use_bs4: bool) -> str:
+    """fetch_jd.html_to_text before the streaming extractor: a bs4 tree, or regex passes."""
+    if use_bs4:
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup(["script", "style", "nav", "header", "footer", "meta", "noscript"]):
+            tag.decompose()
+        main = (
+            soup.find("main") or
+            soup.find(id=re.compile(r"job|content|description|posting", re.I)) or
+            soup.find(class_=re.compile(r"job|content|description|posting", re.I)) or
+            soup.body or
+            soup
+        )
+        text = main.get_text(separator="\n")
+    else:
+        text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r"<[^>]+>", " ", text)
+        text = re.sub(r"&nbsp;", " ", text)
+        text = re.sub(r"&amp;", "&", text)
+        text = re.sub(r"&lt;", "<", text)
+        text = re.sub(r"&gt;", ">", text)
+        text = re.sub(r"&#\d+;", "", text)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    text = "\n".join(lines)
+    for pattern in fetch_jd.BOILERPLATE_PATTERNS:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def _streamed(body: bytes) -> str:
+    """Feed body to the extractor in network-sized chunks, as fetch_page_text does."""
+    extractor = fetch_jd.HTMLTextExtractor()
+    for i in range(0, len(body), fetch_jd.CHUNK_SIZE):
+        extractor.feed(body[i:i + fetch_jd.CHUNK_SIZE])
+    return extractor.close()
+
+
+def _fed_at(body: bytes, cuts: list[int]) -> str:
+    """Feed body to the extractor split at the given offsets."""
+    extractor = fetch_jd.HTMLTextExtractor()
+    start = 0
+    for cut in sorted(cuts) + [len(body)]:
+        extractor.feed(body[start:cut])
+        start = cut
+    return extractor.close()
+
+
+def _peak_bytes(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _text_quality(text: str, expected: dict) -> tuple[int, int]:
+    """(expected lines found, unwanted snippets leaked); '- ' bullets count as their text."""
+    lines = {line[2:] if line.startswith("- ") else line for line in text.splitlines()}
+    lines |= {" ".join(line.split()) for line in lines}
+    return (sum(1 for line in expected["lines"] if line in lines),
+            sum(1 for snippet in expected["absent"] if snippet in text))
+
+
+def suite_html(jd_paths: list[Path], repeat: int) -> bool:
+    pages_dir = FIXTURES_DIR / "pages"
+    expected = json.loads((pages_dir / "expected.json").read_text(encoding="utf-8"))
+    extractors = {"regex": lambda b: _legacy_html_to_text(b.decode("utf-8"), False)}
+    if BS4_AVAILABLE:
+        extractors["bs4"] = lambda b: _legacy_html_to_text(b.decode("utf-8"), True)
+    extractors["stream"] = _streamed
+    print(f"\n[html] {len(expected)} stored pages from fixtures/pages/: "
+          f"{' / '.join(extractors)} (lines found / snippets leaked)")
+
+    ok = True
+    print(f"  {'Page':<24}" + "".join(f" {name:>10}" for name in extractors))
+    for name, want in expected.items():
+        body = (pages_dir / name).read_bytes()
+        scores = {label: _text_quality(fn(body), want) for label, fn in extractors.items()}
+        print(f"  {name:<24}" + "".join(f" {f'{found}/{leaks}':>10}" for found, leaks in scores.values()))
+        found, leaks = scores["stream"]
+        if found != len(want["lines"]) or leaks:
+            ok = False
+            print(f"  [!] {name}: {len(want['lines']) - found} line(s) missing, {leaks} snippet(s) leaked")
+        if any(found < f or leaks > l for label, (f, l) in scores.items() if label != "stream"):
+            ok = False
+            print(f"  [!] {name}: streaming extractor scored below the previous one")
+
+    # Chunk boundaries must not change the text: every split around a script/style
+    # end tag (where the extractor drops the element body), then random chunk sizes
+    import random
+    rng = random.Random(24)
+    chunked_ok = True
+    pages = {name: (pages_dir / name).read_bytes() for name in expected}
+    pages["(end-tag edge cases)"] = HTML_END_TAG_EDGES
+    for name, body in pages.items():
+        whole = _fed_at(body, [])
+        ends = [m.start() for m in re.finditer(rb"</(?:script|style)", body, re.I)]
+        offsets = sorted({i for end in ends for i in range(max(0, end - 16), min(len(body), end + 16))})
+        splits = [[i] for i in offsets] + [
+            list(range(0, len(body), size)) for size in (1, 7, 64, 4096)] + [
+            [rng.randrange(len(body)) for _ in range(rng.randint(1, 40))] for _ in range(HTML_RANDOM_SPLITS)]
+        broken = sum(1 for cuts in splits if _fed_at(body, cuts) != whole)
+        if broken:
+            chunked_ok = ok = False
+            print(f"  [!] {name}: {broken} of {len(splits)} chunkings changed the extracted text")
+    print(f"  Same text for every split near a script/style end tag and {HTML_RANDOM_SPLITS} random "
+          f"chunkings per page: {'OK' if chunked_ok else 'FAILED'}")
+
+    # Padded to career-page size: time and peak memory against the previous extractor
+    legacy = "bs4" if BS4_AVAILABLE else "regex"
+    for name in expected:
+        body = (pages_dir / name).read_bytes()
+        filler = b"<script>window.__APP_STATE__ = [" + b'{"id": 1, "html": "<div>x</div>"},' * int(
+            HTML_PAGE_MB * 2 ** 20 / 34) + b"];</script>"
+        padded = body.replace(b"</body>", filler + b"</body>")
+        before = _time_per_call(lambda: extractors[legacy](padded), max(1, repeat // 10))
+        after = _time_per_call(lambda: _streamed(padded), max(1, repeat // 10))
+        _report(f"{Path(name).stem} ({len(padded) / 2 ** 20:.1f} MB)", before, after)
+        peak_before = _peak_bytes(lambda: extractors[legacy](padded))
+        peak_after = _peak_bytes(lambda: _streamed(padded))
+        print(f"  {'':<34} peak memory {peak_before / 2 ** 20:.1f} MB → {peak_after / 2 ** 20:.2f} MB ({legacy})")
+        if peak_after > HTML_PEAK_MB * 2 ** 20:
+            ok = False
+            print(f"  [!] {name}: the inline script was buffered whole ({peak_after / 2 ** 20:.2f} MB peak); "
+                  "html.parser's raw-text handling may have changed")
+        if _streamed(padded) != _streamed(body):
+            ok = False
+            print(f"  [!] {name}: padding the page changed the extracted text")
+
+    print(f"  Streaming extractor finds every line with no leaks: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: board crawler ---------------------------------------------------
+
+CRAWL_JOBS_PER_BOARD = 30
+CRAWL_LATENCY = 0.02
+# Posting titles cycled on every stand-in board; the first three match recommended_titles
+CRAWL_TITLES = ("Senior Solutions Engineer", "Analytics Engineer II", "Staff Data Engineer",
+                "Account Executive, Mid-Market", "Implementation Manager", "Security Engineer")
+CRAWL_TARGETS = [
+    {"platform": "greenhouse", "board": "northwindanalytics", "company": "Northwind Analytics"},
+    {"platform": "lever", "board": "tidewater", "company": "Tidewater"},
+    {"platform": "ashby", "board": "harbor-ai", "company": "Harbor AI"},
+]
+
+
+def _crawl_boards_data() -> dict[str, list[dict]]:
+    """Per-platform postings for the stand-in boards, built from the fixtures/ats/ payloads."""
+    fixtures = {name: json.loads((FIXTURES_DIR / "ats" / name).read_bytes())
+                for name in ("greenhouse-job.json", "lever-posting.json", "ashby-board.json")}
+    data = {"greenhouse": [], "lever": [], "ashby": []}
+    for n in range(CRAWL_JOBS_PER_BOARD):
+        title = CRAWL_TITLES[n % len(CRAWL_TITLES)]
+        gh = dict(fixtures["greenhouse-job.json"], id=4100000 + n, title=title,
+                  absolute_url=f"https://boards.greenhouse.io/northwindanalytics/jobs/{4100000 + n}")
+        gh["content"] += html.escape(f"<p>Requisition {n}.</p>")
+        lever = dict(fixtures["lever-posting.json"], id=f"lever-{n:04d}", text=title,
+                     hostedUrl=f"https://jobs.lever.co/tidewater/lever-{n:04d}")
+        lever["description"] += f"<p>Requisition {n}.</p>"
+        ashby = dict(fixtures["ashby-board.json"]["jobs"][0], id=f"ashby-{n:04d}", title=title,
+                     jobUrl=f"https://jobs.ashbyhq.com/harbor-ai/ashby-{n:04d}")
+        ashby["descriptionHtml"] += f"<p>Requisition {n}.</p>"
+        data["greenhouse"].append(gh)
+        data["lever"].append(lever)
+        data["ashby"].append(ashby)
+    return data
+
+
+def _crawl_pages(data: dict[str, list[dict]]) -> dict[str, tuple[str, bytes]]:
+    """API responses for the stand-in boards: Greenhouse listing and details, Lever and Ashby boards."""
+    as_json = lambda obj: ("application/json; charset=utf-8", json.dumps(obj).encode("utf-8"))
+    listing = [{k: job[k] for k in ("id", "title", "updated_at", "absolute_url", "location")}
+               for job in data["greenhouse"]]
+    pages = {"/v1/boards/northwindanalytics/jobs": as_json({"jobs": listing, "meta": {"total": len(listing)}}),
+             "/v0/postings/tidewater": as_json(data["lever"]),
+             "/posting-api/job-board/harbor-ai": as_json({"apiVersion": "1", "jobs": data["ashby"]})}
+    for job in data["greenhouse"]:
+        pages[f"/v1/boards/northwindanalytics/jobs/{job['id']}"] = as_json(job)
+    return pages
+
+
+def _matching(data: dict[str, list[dict]]) -> dict[str, set[str]]:
+    title_key = {"greenhouse": "title", "lever": "text", "ashby": "title"}
+    return {platform: {str(p["id"]) for p in posts if p[title_key[platform]] in CRAWL_TITLES[:3]}
+            for platform, posts in data.items()}
+
+
+def suite_crawl(jd_paths: list[Path], repeat: int) -> bool:
+    total = CRAWL_JOBS_PER_BOARD * len(CRAWL_TARGETS)
+    print(f"\n[crawl] {total} postings on {len(CRAWL_TARGETS)} stand-in boards "
+          f"({CRAWL_LATENCY * 1e3:.0f} ms latency): full re-fetch vs delta sync")
+    data = _crawl_boards_data()
+    server = StandInBoard(_crawl_pages(data), CRAWL_LATENCY)
+    _, titles = crawl_boards.load_targets()
+    ok = True
+
+    def check(condition: bool, message: str) -> None:
+        nonlocal ok
+        if not condition:
+            ok = False
+            print(f"  [!] {message}")
+
+    saved = (fetch_jd.ARCHIVE_DIR, fetch_jd.GREENHOUSE_API, fetch_jd.LEVER_API, fetch_jd.ASHBY_API,
+             crawl_boards.STATE_DIR, tracker.EVAL_QUEUE_PATH)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetch_jd.ARCHIVE_DIR = Path(tmp) / "archive"
+            fetch_jd.GREENHOUSE_API = fetch_jd.LEVER_API = fetch_jd.ASHBY_API = server.url
+            crawl_boards.STATE_DIR = Path(tmp) / "boards"
+            tracker.EVAL_QUEUE_PATH = Path(tmp) / "eval-queue.txt"
+            cache = fetch_jd.HttpCache(Path(tmp) / "http")
+
+            def crawl(may_fail: bool = False, **kwargs) -> dict[str, dict]:
+                kwargs.setdefault("cache", cache)
+                rows, _ = crawl_boards.crawl_boards(CRAWL_TARGETS, titles, per_host=4, host_rate=1000, **kwargs)
+                for r in rows:
+                    check(may_fail or r["status"] != "failed", f"{r['board']}: {r['note']}")
+                    if not kwargs.get("dry_run"):
+                        tracker.enqueue_jds(r["queued"])
+                return {r["board"].split("/")[0]: r for r in rows}
+
+            # First crawl: every matching posting is new, written once and queued
+            first = crawl()
+            matching = _matching(data)
+            written = [p for r in first.values() for p in r["queued"]]
+            for platform, r in first.items():
+                check(r["new"] == len(matching[platform]) and r["matched"] == r["new"]
+                      and r["listed"] == CRAWL_JOBS_PER_BOARD,
+                      f"{platform}: first crawl found {r['new']} new of {len(matching[platform])} matching")
+            check(len(set(written)) == len(written) == len(tracker.load_eval_queue()),
+                  "postings were written to colliding paths or not all queued")
+            texts = " ".join(p.read_text(encoding="utf-8").split("\n", 2)[1] for p in written)
+            check(not any(t in texts for t in CRAWL_TITLES[3:]), "non-matching titles were written")
+            gh = data["greenhouse"][0]
+            posting = dict(fetch_jd.ats_extract("greenhouse", "northwindanalytics", str(gh["id"]), gh),
+                           company="Northwind Analytics")
+            check(written[0].read_text(encoding="utf-8") == fetch_jd.posting_to_text(posting),
+                  "crawled text differs from the extracted posting")
+            mtimes = {p: p.stat().st_mtime_ns for p in written}
+
+            # Nothing changed: one conditional listing request per board, no bodies, no writes
+            server.reset_stats()
+            start = time.perf_counter()
+            second = crawl()
+            after, bytes_after, requests_after = time.perf_counter() - start, server.bytes_sent, len(server.starts)
+            check(all(r["status"] == "unchanged" and r["requests"] == 1 for r in second.values())
+                  and requests_after == len(CRAWL_TARGETS) and not bytes_after,
+                  "an unchanged board was not answered with a single 304")
+            check(all(p.stat().st_mtime_ns == m for p, m in mtimes.items()), "unchanged postings were rewritten")
+
+            server.reset_stats()
+            start = time.perf_counter()
+            crawl(cache=None, full=True, dry_run=True)
+            before, bytes_before, requests_before = time.perf_counter() - start, server.bytes_sent, len(server.starts)
+            _report(f"re-crawl {len(CRAWL_TARGETS)} unchanged boards", before, after)
+            print(f"  {'':<34} requests: {requests_before} → {requests_after}; "
+                  f"body bytes sent: {bytes_before:,} → {bytes_after:,}")
+
+            # A posting added, one re-dated without edits, one edited and one closed
+            gh_ids = sorted(matching["greenhouse"], key=int)
+            added = dict(data["greenhouse"][0], id=4199999,
+                         absolute_url="https://boards.greenhouse.io/northwindanalytics/jobs/4199999")
+            data["greenhouse"].append(added)
+            bumped = next(j for j in data["greenhouse"] if str(j["id"]) == gh_ids[1])
+            bumped["updated_at"] = "2026-10-17T09:00:00-04:00"
+            edited = next(p for p in data["lever"] if p["id"] in matching["lever"])
+            edited["description"] += "<p>Now also hiring in Denver.</p>"
+            closed = next(j for j in data["ashby"] if j["id"] in matching["ashby"])
+            data["ashby"].remove(closed)
+            server.pages = _crawl_pages(data)
+            tracker.dequeue_jds(written)  # as evaluate.py --queue does once they are evaluated
+
+            server.reset_stats()
+            third = crawl()
+            check((third["greenhouse"]["new"], third["greenhouse"]["changed"], third["greenhouse"]["requests"])
+                  == (1, 0, 3), f"greenhouse delta: {third['greenhouse']['new']} new, "
+                  f"{third['greenhouse']['changed']} changed, {third['greenhouse']['requests']} requests "
+                  "(expected 1, 0 and listing + 2 details)")
+            check((third["lever"]["new"], third["lever"]["changed"]) == (0, 1), "the edited Lever posting was missed")
+            check((third["ashby"]["new"], third["ashby"]["changed"], third["ashby"]["closed"]) == (0, 0, 1),
+                  "the closed Ashby posting was not reported")
+            check(len(tracker.load_eval_queue()) == 2, "the delta was not queued exactly once")
+            check("Denver" in third["lever"]["queued"][0].read_text(encoding="utf-8"),
+                  "the edited posting was not rewritten in place")
+            unchanged = [p for p in written if p not in third["lever"]["queued"]]
+            check(all(p.stat().st_mtime_ns == mtimes[p] for p in unchanged), "postings outside the delta were rewritten")
+            state = crawl_boards.load_state("ashby", "harbor-ai")["postings"]
+            check(closed["id"] not in state and len(state) == len(matching["ashby"]) - 1,
+                  "the closed posting is still in the board state")
+            print(f"  {'':<34} delta crawl: {len(server.starts)} requests for "
+                  f"{sum(r['new'] + r['changed'] + r['closed'] for r in third.values())} changed postings")
+
+            # A dry run sees an edit but must leave it for the next real crawl,
+            # even though that crawl's listing request is answered with a 304
+            edited["description"] += "<p>Austin office opening.</p>"
+            server.pages = _crawl_pages(data)
+            cached_files = {p.name: p.stat().st_mtime_ns for p in cache.dir.iterdir()}
+            dry = crawl(dry_run=True)
+            check(dry["lever"]["changed"] == 1 and "Austin" not in third["lever"]["queued"][0].read_text(
+                encoding="utf-8"), "the dry run missed the edit or wrote it")
+            check({p.name: p.stat().st_mtime_ns for p in cache.dir.iterdir()} == cached_files,
+                  "the dry run wrote to the HTTP cache")
+            real = crawl()
+            check(real["lever"]["changed"] == 1 and real["lever"]["status"] == "ok"
+                  and "Austin" in real["lever"]["queued"][0].read_text(encoding="utf-8"),
+                  f"the crawl after a dry run missed the edit ({real['lever']['status']}, "
+                  f"{real['lever']['changed']} changed: {real['lever']['note']})")
+
+            # A crawl that fails after its listing was cached must not hide the delta either
+            late = dict(data["greenhouse"][0], id=4199998,
+                        absolute_url="https://boards.greenhouse.io/northwindanalytics/jobs/4199998")
+            data["greenhouse"].append(late)
+            server.pages = _crawl_pages(data)
+            detail = server.pages.pop(f"/v1/boards/northwindanalytics/jobs/{late['id']}")
+            failed = crawl(may_fail=True)
+            server.pages[f"/v1/boards/northwindanalytics/jobs/{late['id']}"] = detail
+            retried = crawl()
+            check(failed["greenhouse"]["status"] == "failed" and retried["greenhouse"]["new"] == 1,
+                  f"the posting of a failed crawl was lost ({failed['greenhouse']['status']}, then "
+                  f"{retried['greenhouse']['new']} new: {retried['greenhouse']['note']})")
+    finally:
+        (fetch_jd.ARCHIVE_DIR, fetch_jd.GREENHOUSE_API, fetch_jd.LEVER_API, fetch_jd.ASHBY_API,
+         crawl_boards.STATE_DIR, tracker.EVAL_QUEUE_PATH) = saved
+        server.close()
+
+    print(f"  Delta sync fetches and queues only new or changed postings: {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+# ---- Suite: evaluate pipeline -----------------------------------------------
+
+PROMPT_MODES = ("fit-eval", "resume", "cover-letter")
+
+# Prompt assembly iterates over sets in places; pin the hash seed so both
+# chains order them the same way and the outputs can be compared byte for byte.
+SEEDED_ENV = dict(os.environ, PYTHONHASHSEED="0")
+
+
+def _subprocess_chain(jd_path: Path, role: str, out_dir: Path) -> None:
+    """The evaluate.py chain as it used to run: one interpreter per stage, YAML in between."""
+    script = lambda name: str(ROOT / "scripts" / name)
+    parsed_out = out_dir / f"{jd_path.stem}-parsed.yaml"
+    scores_out = out_dir / f"{jd_path.stem}-scores.yaml"
+    subprocess.run([sys.executable, script("jd_parser.py"), "--job", str(jd_path),
+                    "--output", str(parsed_out)], capture_output=True, check=True, env=SEEDED_ENV)
+    subprocess.run([sys.executable, script("scorer.py"), "--jd", str(jd_path),
+                    "--parsed-jd", str(parsed_out), "--output", str(scores_out)],
+                   capture_output=True, check=True, env=SEEDED_ENV)
+    for mode in PROMPT_MODES:
+        cmd = [sys.executable, script("generate_resume.py"), "--job", str(jd_path),
+               "--role", role, "--mode", mode, "--parsed-jd", str(parsed_out),
+               "--pre-scores", str(scores_out), "--output", str(out_dir / f"{mode}.md")]
+        if mode == "resume":
+            cmd += ["--bullet-bank", str(evaluate.BULLET_BANK_PATH)]
+        if mode == "cover-letter":
+            cmd += ["--fit-eval", str(out_dir / "fit-eval.md"),
+                    "--paragraph-bank", str(evaluate.PARAGRAPH_BANK_PATH)]
+        subprocess.run(cmd, capture_output=True, check=True, env=SEEDED_ENV)
+
+
+def _in_process_chain(jd_path: Path, role: str, out_dir: Path) -> None:
+    """The same chain through evaluate.py's in-process stages, artifacts included."""
+    doc = jd_parser.JDDocument.from_path(jd_path)
+    parsed_out = out_dir / f"{jd_path.stem}-parsed.yaml"
+    parsed = jd_parser.parse_jd(jd_path, doc=doc)
+    evaluate.save_yaml(parsed_out, parsed)
+    skill_scores, summary = scorer.run_scoring(
+        jd_path, parsed_out, doc=doc, skill_index=scorer.load_skill_index(), parsed_jd=parsed
+    )
+    scores = scorer.build_scores_output(jd_path, parsed_out, skill_scores, summary)
+    evaluate.save_yaml(out_dir / f"{jd_path.stem}-scores.yaml", scores)
+
+    inputs = generate_resume.load_prompt_inputs(role)
+    bullet_bank, paragraph_bank = evaluate.load_content_banks()
+    fit_eval = evaluate.run_generate(doc.text, role, "fit-eval", parsed, scores, inputs)
+    resume = evaluate.run_generate(doc.text, role, "resume", parsed, scores, inputs,
+                                   bullet_bank=bullet_bank)
+    cover_letter = evaluate.run_generate(doc.text, role, "cover-letter", parsed, scores, inputs,
+                                         fit_eval_text=fit_eval, paragraph_bank=paragraph_bank)
+    for mode, prompt in zip(PROMPT_MODES, (fit_eval, resume, cover_letter)):
+        (out_dir / f"{mode}.md").write_text(prompt, encoding="utf-8")
+
+
+def _run_in_process_chain(jd_path: Path, role: str, out_dir: Path) -> None:
+    """Run _in_process_chain in a fresh interpreter so startup cost is counted."""
+    code = (
+        "import sys; from pathlib import Path; "
+        f"sys.path.insert(0, {str(ROOT / 'scripts')!r}); import benchmark; "
+        f"benchmark._in_process_chain(Path({str(jd_path)!r}), {role!r}, Path({str(out_dir)!r}))"
+    )
+    subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, env=SEEDED_ENV)
+
+
+def suite_evaluate(jd_paths: list[Path], repeat: int) -> bool:
+    print("\n[evaluate] one --no-interact run: subprocess chain vs in-process pipeline")
+    print("  (parse + score + 3 prompts; tracker and gap sync excluded to keep the repo clean)")
+    runs = max(1, repeat // 10)
+
+    ok = True
+    before_total = after_total = 0.0
+    for path in jd_paths:
+        role, _ = evaluate.auto_detect_role(path.read_text(encoding="utf-8"))
+        with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as new_dir:
+            before = _time_per_call(lambda: _subprocess_chain(path, role, Path(legacy_dir)), runs)
+            after = _time_per_call(lambda: _run_in_process_chain(path, role, Path(new_dir)), runs)
+            for name in [f"{m}.md" for m in PROMPT_MODES] + [f"{path.stem}-scores.yaml"]:
+                if (Path(legacy_dir) / name).read_bytes() != (Path(new_dir) / name).read_bytes():
+                    ok = False
+                    print(f"  [!] MISMATCH for {path.name}: {name}")
+        _report(path.name[:34], before, after)
+        before_total += before
+        after_total += after
+
+    _report("mean per JD", before_total / len(jd_paths), after_total / len(jd_paths))
+    print(f"  Equivalence on {len(jd_paths)} JD(s): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+SUITES = {
+    "skills": suite_skills,
+    "scoring": suite_scoring,
+    "index": suite_index,
+    "batch": suite_batch,
+    "roles": suite_roles,
+    "candidate": suite_candidate,
+    "banks": suite_banks,
+    "selection": suite_selection,
+    "vectors": suite_vectors,
+    "tracker": suite_tracker,
+    "scan": suite_scan,
+    "writers": suite_writers,
+    "fetch": suite_fetch,
+    "httpcache": suite_httpcache,
+    "ats": suite_ats,
+    "html": suite_html,
+    "crawl": suite_crawl,
+    "evaluate": suite_evaluate,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark pipeline hot paths against their previous implementations"
+    )
+    parser.add_argument(
+        "--suite",
+        choices=list(SUITES) + ["all"],
+        default="all",
+        help="Benchmark suite to run (default: all)",
+    )
+    parser.add_argument(
+        "--jobs-glob",
+        dest="jobs_glob",
+        default="archive/job-desc-*.txt",
+        help="Glob of JD files to benchmark against, relative to repo root",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=50, help="Timed repetitions per measurement (default: 50)"
+    )
+    args = parser.parse_args()
+
+    jd_paths = _load_jds(args.jobs_glob)
+    suites = SUITES if args.suite == "all" else {args.suite: SUITES[args.suite]}
+
+    ok = True
+    for fn in suites.values():
+        ok = fn(jd_paths, args.repeat) and ok
+
+    print()
+    if not ok:
+        print("  [!] One or more suites produced results that differ from the reference.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
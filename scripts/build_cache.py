@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Build Cache — content-addressed, make-style caching for the evaluate pipeline.
+
+Each pipeline stage (parse, score, fit-eval, resume, cover-letter) declares
+its inputs as a mapping of name → content digest: the JD text, the YAML and
+template files it reads, the scripts that implement it, and the keys of the
+upstream stages it consumes. The stage key is a hash of those digests; the
+stage's result is stored under that key in .cache/build/, so a stage only
+re-runs when one of its inputs actually changed.
+
+.cache/build/manifest.json records, per JD and stage, the key and input
+digests of the last build. It is used to explain why a stage was rebuilt
+("bullet-bank changed"), not for cache lookups, and to bound the cache: an
+artifact replaced by a newer build of the same JD and stage is deleted when no
+other manifest entry uses it, and --prune removes every artifact the manifest
+no longer references (and the entries of JDs that no longer exist).
+
+Usage:
+    python scripts/build_cache.py --status
+    python scripts/build_cache.py --prune
+    python scripts/build_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import pickle
+from pathlib import Path
+
+from fileio import atomic_write, file_lock
+
+ROOT = Path(__file__).resolve().parent.parent
+BUILD_DIR = ROOT / ".cache" / "build"
+MANIFEST_PATH = BUILD_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+# Digest cache keyed by (path, mtime_ns, size) so unchanged files are hashed once per process
+_FILE_DIGESTS: dict[tuple, str] = {}
+
+
+# ---- Digests ----------------------------------------------------------------
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def file_digest(path: Path) -> str:
+    """Content digest of a file; 'missing' if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return "missing"
+    memo_key = (str(path), st.st_mtime_ns, st.st_size)
+    digest = _FILE_DIGESTS.get(memo_key)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+        _FILE_DIGESTS[memo_key] = digest
+    return digest
+
+
+def stage_key(stage: str, inputs: dict[str, str]) -> str:
+    """Hash a stage name and its input digests into the key its result is stored under."""
+    h = hashlib.sha256(f"{stage}\nv{MANIFEST_VERSION}\n".encode("utf-8"))
+    for name in sorted(inputs):
+        h.update(f"{name}={inputs[name]}\n".encode("utf-8"))
+    return h.hexdigest()[:24]
+
+
+# ---- Artifact store ---------------------------------------------------------
+
+def _artifact_path(stage: str, key: str) -> Path:
+    return BUILD_DIR / f"{stage}-{key}.pkl"
+
+
+def load_artifact(stage: str, key: str):
+    """Return the stored result for (stage, key), or None if it was never built."""
+    path = _artifact_path(stage, key)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def store_artifact(stage: str, key: str, value) -> None:
+    """Store a stage result atomically; safe to call from parallel worker processes and stage threads."""
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write(_artifact_path(stage, key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+# ---- Manifest ---------------------------------------------------------------
+
+def load_manifest() -> dict:
+    if not MANIFEST_PATH.exists():
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write(MANIFEST_PATH, json.dumps(manifest, indent=1, sort_keys=True))
+
+
+def update_manifest(entries: dict[str, dict[str, dict]]) -> None:
+    """
+    Merge {target: {stage: entry}} into the manifest with a single write, then
+    delete the artifacts of the replaced entries that nothing references.
+    Holds the manifest lock, so concurrent evaluate.py processes merge their
+    targets instead of dropping each other's.
+    """
+    if not entries:
+        return
+    with file_lock(MANIFEST_PATH):
+        manifest = load_manifest()
+        replaced = []
+        for target, stages in entries.items():
+            current = manifest["targets"].setdefault(target, {})
+            for stage, entry in stages.items():
+                old_key = (current.get(stage) or {}).get("key")
+                if old_key and old_key != entry.get("key"):
+                    replaced.append(_artifact_path(stage, old_key))
+            current.update(stages)
+        save_manifest(manifest)
+        referenced = referenced_artifacts(manifest)
+        for path in replaced:
+            if path not in referenced:
+                path.unlink(missing_ok=True)
+
+
+def referenced_artifacts(manifest: dict) -> set[Path]:
+    """Artifact paths named by any manifest entry."""
+    return {_artifact_path(stage, entry["key"]) for stages in manifest["targets"].values()
+            for stage, entry in stages.items() if entry.get("key")}
+
+
+def prune() -> tuple[int, int, int]:
+    """
+    Drop manifest targets whose JD file is gone, then delete every artifact
+    the manifest does not reference, under the manifest lock. Returns
+    (targets dropped, artifacts removed, bytes freed).
+    """
+    with file_lock(MANIFEST_PATH):
+        manifest = load_manifest()
+        gone = [t for t in manifest["targets"] if not (ROOT / t).exists()]  # ROOT / absolute → absolute
+        for target in gone:
+            del manifest["targets"][target]
+        if gone:
+            save_manifest(manifest)
+        referenced = referenced_artifacts(manifest)
+        removed = freed = 0
+        for path in BUILD_DIR.glob("*.pkl") if BUILD_DIR.exists() else []:
+            if path not in referenced:
+                try:
+                    size = path.stat().st_size
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+                removed += 1
+                freed += size
+    return len(gone), removed, freed
+
+
+def changed_inputs(previous: dict | None, inputs: dict[str, str]) -> list[str]:
+    """Names of inputs whose digest differs from the previous build's manifest entry."""
+    if not previous:
+        return []
+    before = previous.get("inputs", {})
+    return sorted(name for name in set(before) | set(inputs) if before.get(name) != inputs.get(name))
+
+
+# ---- CLI --------------------------------------------------------------------
+
+def cmd_status() -> None:
+    manifest = load_manifest()
+    artifacts = list(BUILD_DIR.glob("*.pkl")) if BUILD_DIR.exists() else []
+    size = sum(p.stat().st_size for p in artifacts)
+    print(f"Build cache: {BUILD_DIR}")
+    print(f"  Targets in manifest : {len(manifest['targets'])}")
+    print(f"  Stored artifacts    : {len(artifacts)}  ({size / 1024:.0f} KB)")
+    by_stage: dict[str, int] = {}
+    for p in artifacts:
+        stage = p.stem.rsplit("-", 1)[0]
+        by_stage[stage] = by_stage.get(stage, 0) + 1
+    for stage, count in sorted(by_stage.items()):
+        print(f"    {stage:<14} {count}")
+
+
+def cmd_prune() -> None:
+    dropped, removed, freed = prune()
+    print(f"Dropped {dropped} target(s) whose JD is gone; removed {removed} unreferenced "
+          f"artifact(s) ({freed / 1024:.0f} KB) from {BUILD_DIR}")
+
+
+def cmd_clear() -> None:
+    removed = 0
+    if BUILD_DIR.exists():
+        with file_lock(MANIFEST_PATH):
+            for p in BUILD_DIR.iterdir():
+                if p.is_file() and p.suffix != ".lock":  # others may be waiting on it
+                    p.unlink()
+                    removed += 1
+    print(f"Removed {removed} file(s) from {BUILD_DIR}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect, prune or clear the evaluate build cache")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--status", action="store_true", help="Show manifest and artifact counts")
+    group.add_argument("--prune", action="store_true",
+                       help="Delete artifacts no manifest entry references and entries of deleted JDs")
+    group.add_argument("--clear", action="store_true", help="Delete every cached artifact and the manifest")
+    args = parser.parse_args()
+
+    if args.status:
+        cmd_status()
+    elif args.prune:
+        cmd_prune()
+    elif args.clear:
+        cmd_clear()
+
+
+if __name__ == "__main__":
+    main()
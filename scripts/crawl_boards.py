@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Board Crawler — list every open posting on the company job boards in
+job-search/search-strategy.yaml and fetch only what changed since last time.
+
+Each target_boards entry names a Greenhouse, Lever or Ashby board. A crawl
+lists the board through the platform's public job API, keeps the postings
+whose title matches a recommended_titles entry (the deprioritize group is
+ignored), and compares them with the board's state file in .cache/boards/.
+Postings that are new or changed since the last crawl are written to
+archive/ in the fetch_jd.py API layout and appended to the evaluation queue
+(output/eval-queue.txt); postings gone from the board are reported as closed.
+
+Greenhouse lists postings without descriptions, so only new postings and
+those with a newer updated_at are fetched in full. Lever and Ashby return the
+whole board in one payload, which is requested conditionally through
+fetch_jd's HTTP cache: an unchanged board costs one 304. The state records
+the validator of the listing it was built from, so a 304 for a listing that
+a dry run or failed crawl cached since is still diffed; dry runs never write
+to the cache.
+
+Usage:
+    python scripts/crawl_boards.py
+    python scripts/crawl_boards.py --board databricks --dry-run
+    python scripts/crawl_boards.py --all-titles --full
+    python scripts/evaluate.py --queue --no-interact
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    print("PyYAML is required. Install with: pip install pyyaml")
+    sys.exit(1)
+
+import fetch_jd
+import tracker
+from fileio import atomic_write
+
+ROOT = Path(__file__).resolve().parent.parent
+SEARCH_STRATEGY_PATH = ROOT / "job-search" / "search-strategy.yaml"
+STATE_DIR = ROOT / ".cache" / "boards"
+STATE_VERSION = 1
+
+SKIPPED_TITLE_GROUPS = {"deprioritize"}
+
+
+# ---- Targets ----------------------------------------------------------------
+
+def load_targets(path: Path | None = None) -> tuple[list[dict], list[str]]:
+    """(target_boards entries with a supported platform, recommended titles) from search-strategy.yaml."""
+    with open(path or SEARCH_STRATEGY_PATH, "r", encoding="utf-8") as f:
+        strategy = yaml.safe_load(f) or {}
+    boards = []
+    for entry in strategy.get("target_boards") or []:
+        if entry.get("platform") not in fetch_jd.ATS_POSTING_PATTERNS or not entry.get("board"):
+            print(f"  [!] Skipping target board {entry!r}: needs platform greenhouse/lever/ashby and board")
+            continue
+        boards.append({"platform": entry["platform"], "board": str(entry["board"]),
+                       "company": entry.get("company") or fetch_jd.board_company(str(entry["board"]))})
+    titles = [title for group, spec in (strategy.get("recommended_titles") or {}).items()
+              if group not in SKIPPED_TITLE_GROUPS for title in (spec or {}).get("titles", [])]
+    return boards, titles
+
+
+def _title_words(title: str) -> frozenset[str]:
+    return frozenset(re.findall(r"[a-z0-9]+", title.lower()))
+
+
+def title_matcher(titles: list[str]):
+    """match(posting title) → the first recommended title whose words all appear in it, or None."""
+    wanted = [(title, _title_words(title)) for title in titles]
+
+    def match(posting_title: str) -> str | None:
+        words = _title_words(posting_title)
+        for title, need in wanted:
+            if need and need <= words:
+                return title
+        return None
+
+    return match
+
+
+# ---- Board state ------------------------------------------------------------
+
+def state_path(platform: str, board: str) -> Path:
+    return STATE_DIR / f"{platform}-{fetch_jd.slugify(board)}.json"
+
+
+def load_state(platform: str, board: str) -> dict:
+    """
+    The last completed crawl of a board: {"listing": validator of the listing
+    it was built from, "postings": {posting id: {title, updated, digest, path,
+    url, first_seen, last_changed}}}.
+    """
+    try:
+        state = json.loads(state_path(platform, board).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {"listing": {}, "postings": {}}
+    return {"listing": state.get("listing") or {}, "postings": state.get("postings", {})}
+
+
+def save_state(platform: str, board: str, postings: dict, listing: dict) -> None:
+    path = state_path(platform, board)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps({"version": STATE_VERSION, "crawled": date.today().isoformat(),
+                                   "listing": listing, "postings": postings}, indent=1, sort_keys=True))
+
+
+# ---- Crawling ---------------------------------------------------------------
+
+def listing_url(platform: str, board: str) -> str:
+    if platform == "greenhouse":
+        # Without ?content=true: ids, titles and updated_at only; descriptions are fetched per delta
+        return f"{fetch_jd.GREENHOUSE_API}/v1/boards/{board}/jobs"
+    return fetch_jd.ats_api_url(platform, board)
+
+
+def _get_json(fetcher, cache, url: str) -> tuple[object, int, bool, dict]:
+    """
+    (decoded payload, attempts, not_modified, validator) of a conditional API
+    GET; validator is the ETag and Last-Modified of the payload returned.
+    Raises FetchError.
+    """
+    status, headers, body, attempts, not_modified = fetch_jd.conditional_get(fetcher, cache, url)
+    if status >= 400:
+        raise fetch_jd.FetchError(f"HTTP {status} from {url}", status)
+    if not_modified:
+        meta = cache.lookup(url) or {}
+        validator = {"etag": meta.get("etag", ""), "last_modified": meta.get("last_modified", "")}
+    else:
+        validator = {"etag": headers.get("etag", ""), "last_modified": headers.get("last-modified", "")}
+    return json.loads(fetch_jd.decode_body(body, headers)), attempts, not_modified, validator
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else str(path)
+
+
+def _output_path(company: str, posting: dict, taken: set[str]) -> Path:
+    """archive/ path for a posting first seen now; suffixed with its id if the name is taken."""
+    for role in (posting["role"], f"{posting['role']} {posting['id'][:8]}", f"{posting['role']} {posting['id']}"):
+        path = fetch_jd.build_output_path(company, role)
+        if _rel(path) not in taken and not path.exists():
+            break
+    taken.add(_rel(path))
+    return path
+
+
+def crawl_board(fetcher, cache, target: dict, match, details: ThreadPoolExecutor,
+                full: bool = False, dry_run: bool = False) -> dict:
+    """
+    Crawl one board and write its new or changed matching postings; never
+    raises. Returns a summary row; row["queued"] lists the written JD paths.
+    """
+    platform, board, company = target["platform"], target["board"], target["company"]
+    start = time.perf_counter()
+    row = {"board": f"{platform}/{board}", "status": "failed", "listed": 0, "matched": 0, "new": 0,
+           "changed": 0, "closed": 0, "requests": 0, "queued": [], "note": ""}
+    try:
+        state = load_state(platform, board)
+        known = state["postings"]
+        data, attempts, not_modified, validator = _get_json(fetcher, cache, listing_url(platform, board))
+        row["requests"] += attempts
+        # A 304 only says the listing matches the cached copy; that copy is the one the
+        # state was built from unless a dry run or failed crawl cached a newer one since
+        if not_modified and known and not full and validator == state["listing"]:
+            row.update(status="unchanged", listed=None, matched=len(known), note="board not modified")
+            return row
+
+        if platform == "greenhouse":
+            listed = [{"id": str(j.get("id", "")), "role": (j.get("title") or "").strip(),
+                       "updated": j.get("updated_at") or ""} for j in data.get("jobs", [])]
+        else:
+            listed = fetch_jd.ats_postings(platform, board, data)
+        matched = [p for p in listed if match(p["role"])]
+        row.update(listed=len(listed), matched=len(matched))
+
+        if platform == "greenhouse":
+            # Only postings that are new or carry a newer updated_at are fetched in full
+            stale = [p for p in matched if full or known.get(p["id"], {}).get("updated") != p["updated"]]
+
+            def detail(p: dict) -> tuple[dict, int]:
+                payload, tries, _, _ = _get_json(fetcher, cache, fetch_jd.ats_api_url(platform, board, p["id"]))
+                return fetch_jd.ats_extract(platform, board, p["id"], payload), tries
+
+            fetched = {}
+            for posting, tries in details.map(detail, stale):
+                fetched[posting["id"]] = posting
+                row["requests"] += tries
+        else:
+            fetched = {p["id"]: p for p in matched}
+
+        today = date.today().isoformat()
+        postings, taken = {}, {entry["path"] for entry in known.values()}
+        for p in matched:
+            previous = known.get(p["id"])
+            posting = fetched.get(p["id"])
+            if posting is None:  # Greenhouse, same updated_at: unchanged without a fetch
+                postings[p["id"]] = previous
+                continue
+            posting["company"] = company
+            text = fetch_jd.posting_to_text(posting)
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+            entry = dict(previous or {"first_seen": today, "last_changed": today},
+                         title=posting["role"], updated=p["updated"], digest=digest, url=posting["url"])
+            postings[p["id"]] = entry
+            if previous and previous.get("digest") == digest and not full:
+                continue
+            path = ROOT / previous["path"] if previous else _output_path(company, posting, taken)
+            entry.update(path=_rel(path), last_changed=today)
+            row["changed" if previous else "new"] += 1
+            row["queued"].append(path)
+            if not dry_run:
+                fetch_jd.ARCHIVE_DIR.mkdir(exist_ok=True)
+                path.write_text(text, encoding="utf-8")
+
+        row["closed"] = sum(1 for pid in known if pid not in {p["id"] for p in listed})
+        if not dry_run:
+            save_state(platform, board, postings, validator)
+        row["status"] = "ok"
+    except fetch_jd.FetchError as e:
+        row["note"] = str(e)
+    except Exception as e:
+        row["note"] = f"{type(e).__name__}: {e}"
+    finally:
+        row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def crawl_boards(
+    targets: list[dict],
+    titles: list[str] | None,
+    workers: int = fetch_jd.DEFAULT_WORKERS,
+    per_host: int = fetch_jd.DEFAULT_PER_HOST,
+    host_rate: float = fetch_jd.DEFAULT_HOST_RATE,
+    cache: "fetch_jd.HttpCache | None" = None,
+    full: bool = False,
+    dry_run: bool = False,
+) -> tuple[list[dict], tuple[int, int, int]]:
+    """
+    Crawl every target board concurrently (titles None keeps every posting).
+    Returns the summary rows in target order and the fetcher's (connections
+    opened, requests sent, body bytes received).
+    """
+    match = title_matcher(titles) if titles is not None else (lambda title: title)
+    if dry_run and cache is not None and not cache.read_only:
+        # Conditional requests still apply, but nothing a dry run fetched may be cached
+        cache = fetch_jd.HttpCache(cache.dir, cache.max_bytes, read_only=True)
+    fetcher = fetch_jd.Fetcher(per_host=per_host, host_rate=host_rate)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as details, \
+                ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets) or 1))) as boards:
+            rows = list(boards.map(
+                lambda t: crawl_board(fetcher, cache, t, match, details, full, dry_run), targets))
+    finally:
+        fetcher.close()
+    return rows, fetcher.stats()
+
+
+def print_crawl_summary(rows: list[dict], stats: tuple[int, int, int], elapsed: float) -> None:
+    print()
+    print(f"  {'Board':<32} {'Status':<10} {'Listed':>6} {'Match':>6} {'New':>4} {'Chg':>4} "
+          f"{'Closed':>6} {'Reqs':>5}  Note")
+    print(f"  {'-' * 96}")
+    for r in rows:
+        listed = "-" if r["listed"] is None else r["listed"]
+        print(f"  {r['board'][:32]:<32} {r['status']:<10} {listed:>6} {r['matched']:>6} {r['new']:>4} "
+              f"{r['changed']:>4} {r['closed']:>6} {r['requests']:>5}  {r['note']}")
+    opened, sent, received = stats
+    print(f"  {'-' * 96}")
+    print(f"  {len(rows)} board(s) in {elapsed:.2f}s: {sum(r['new'] for r in rows)} new, "
+          f"{sum(r['changed'] for r in rows)} changed, {sum(r['closed'] for r in rows)} closed  "
+          f"({sent} request(s) over {opened} connection(s), {received / 1024:,.0f} KB)")
+
+
+# ---- CLI --------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Crawl the target job boards in search-strategy.yaml and fetch new or changed postings"
+    )
+    parser.add_argument("--board", action="append", dest="boards",
+                        help="Only crawl boards with this token or company (repeatable)")
+    parser.add_argument("--all-titles", action="store_true", dest="all_titles",
+                        help="Keep every posting instead of filtering by recommended_titles")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-fetch and rewrite every matching posting, not just new or changed ones")
+    parser.add_argument("--dry-run", action="store_true", dest="dry_run",
+                        help="Report the delta without writing archive files, state, the queue or the HTTP cache")
+    parser.add_argument("--workers", type=int, default=fetch_jd.DEFAULT_WORKERS,
+                        help=f"Concurrent boards and posting fetches (default: {fetch_jd.DEFAULT_WORKERS})")
+    parser.add_argument("--per-host", type=int, default=fetch_jd.DEFAULT_PER_HOST, dest="per_host",
+                        help=f"Max requests in flight per host (default: {fetch_jd.DEFAULT_PER_HOST})")
+    parser.add_argument("--host-rate", type=float, default=fetch_jd.DEFAULT_HOST_RATE, dest="host_rate",
+                        help=f"Max request starts per second per host (default: {fetch_jd.DEFAULT_HOST_RATE:g})")
+    parser.add_argument("--no-cache", action="store_true", dest="no_cache",
+                        help="Fetch without the HTTP cache (no conditional requests)")
+    args = parser.parse_args()
+
+    targets, titles = load_targets()
+    if args.boards:
+        wanted = {b.lower() for b in args.boards}
+        targets = [t for t in targets if t["board"].lower() in wanted or t["company"].lower() in wanted]
+    if not targets:
+        print(f"  [!] No matching target_boards in {SEARCH_STRATEGY_PATH}")
+        sys.exit(1)
+
+    print(f"  Crawling {len(targets)} board(s)"
+          + ("" if args.all_titles else f" for {len(titles)} recommended title(s)")
+          + (" [DRY RUN]" if args.dry_run else ""))
+    start = time.perf_counter()
+    cache = None if args.no_cache else fetch_jd.HttpCache()
+    rows, stats = crawl_boards(targets, None if args.all_titles else titles, args.workers,
+                               args.per_host, args.host_rate, cache, args.full, args.dry_run)
+    print_crawl_summary(rows, stats, time.perf_counter() - start)
+
+    queued = [path for r in rows for path in r["queued"]]
+    for path in queued:
+        print(f"  {'[DRY RUN] ' if args.dry_run else ''}Queued: {_rel(path)}")
+    if queued and not args.dry_run:
+        added = tracker.enqueue_jds(queued)
+        print(f"\n  {added} JD(s) added to {_rel(tracker.EVAL_QUEUE_PATH)}")
+        print("Next step: python scripts/evaluate.py --queue --no-interact")
+    sys.exit(1 if any(r["status"] == "failed" for r in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
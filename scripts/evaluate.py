@@ -2,20 +2,34 @@
 """
 Evaluate — unified orchestrator for the jamesbot application pipeline.
 
-Runs the full workflow in a single command:
-    1. Parse the raw JD (jd_parser.py)
-    2. Pre-score skills against taxonomy (scorer.py)
+Runs the full workflow in a single command and a single process — each
+stage is imported and called directly, passing data in memory:
+    1. Parse the raw JD (jd_parser.parse_jd)
+    2. Pre-score skills against taxonomy (scorer.run_scoring)
     3. Auto-detect best role template (or accept --role override)
     4. Print pre-score summary and ask what to generate
-    5. Run generate_resume.py with pre-computed context injected
-    6. Auto-append the application to output/tracker.yaml
+    5. Assemble prompts with pre-computed context injected (generate_resume.build_prompt)
+    6. Auto-append the application to output/tracker.yaml (or tracker.db)
     7. Scan output for skill gaps and append to skill-development.yaml log
 
+Parse, score and each prompt are cached by a content hash of their inputs
+(JD text, taxonomy, role structure, banks, templates, script sources) and
+only re-run when one of them changes — editing bullet-bank.yaml redoes just
+the resume prompt. See build_cache.py; --rebuild forces every stage. When a
+stage runs, the parsed JD and scores are also written to archive/ unless
+--no-artifacts is passed.
+
 Usage:
     python scripts/evaluate.py --job archive/job-desc-hibob-implementation-manager.txt
     python scripts/evaluate.py --job archive/job-desc-hibob.txt --role solutions-engineer
     python scripts/evaluate.py --job archive/job-desc-hibob.txt --mode fit-only
     python scripts/evaluate.py --job archive/job-desc-hibob.txt --mode all --no-interact
+    python scripts/evaluate.py --job archive/job-desc-hibob.txt --no-interact --no-artifacts
+    python scripts/evaluate.py --job archive/job-desc-hibob.txt --jobs 1   # strictly sequential
+    python scripts/evaluate.py --job archive/job-desc-hibob.txt --rebuild  # ignore the build cache
+    python scripts/evaluate.py --jobs-glob "archive/job-desc-*.txt" --no-interact --workers 8
+    python scripts/evaluate.py --jobs-glob "archive/job-desc-*.txt" --cache-friendly --cache-marker
+    python scripts/evaluate.py --queue --no-interact    # JDs queued by crawl_boards.py
 
 Modes:
     all         Run fit-eval → resume → cover-letter (default)
@@ -25,9 +39,16 @@ Modes:
 """
 
 import argparse
+import glob
+import hashlib
+import io
+import multiprocessing
+import os
+import pickle
 import re
-import subprocess
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import redirect_stdout
 from datetime import date
 from pathlib import Path
 
@@ -37,13 +58,28 @@ except ImportError:
     print("PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+import build_cache
+import generate_resume
+import jd_parser
+import scorer
+import tracker
+from fileio import atomic_write
+from jd_parser import JDDocument
+
 ROOT = Path(__file__).resolve().parent.parent
 STRUCTURES_DIR = ROOT / "templates" / "structures"
 SKILL_DEV_PATH = ROOT / "portfolio" / "skill-development.yaml"
 OUTPUT_DIR = ROOT / "output"
 ARCHIVE_DIR = ROOT / "archive"
+CACHE_DIR = ROOT / ".cache"
+ROLE_CLASSIFIER_VERSION = 1
+
+BULLET_BANK_PATH = ROOT / "portfolio" / "bullet-bank.yaml"
+PARAGRAPH_BANK_PATH = ROOT / "portfolio" / "paragraph-bank.yaml"
+
+# The widest level of the stage graph has three independent stages
+DEFAULT_JOBS = 3
 
-PYTHON = sys.executable
 
 
 # ---- YAML helpers -----------------------------------------------------------
@@ -60,142 +96,274 @@ def save_yaml(path: Path, data: dict) -> None:
 
 # ---- Role auto-detection ----------------------------------------------------
 
-def auto_detect_role(jd_text: str) -> tuple[str, float]:
-    """
-    Score each role template against the JD text and return the best match.
-    Returns: (role_slug, confidence_0_to_10)
-    """
-    jd_lower = jd_text.lower()
-    best_role = "solutions-engineer"
-    best_score = 0.0
+# Classifiers already loaded in this process, keyed by structure-file digest
+_ROLE_CLASSIFIERS: dict[str, "RoleClassifier"] = {}
 
+def load_structures() -> dict[str, dict]:
+    """Load every role structure, keyed by role slug, in STRUCTURES_DIR glob order."""
+    structures = {}
     for struct_path in STRUCTURES_DIR.glob("*.yaml"):
         try:
-            structure = load_yaml(struct_path)
+            structures[struct_path.stem] = load_yaml(struct_path)
         except Exception:
             continue
+    return structures
+
+
+class RoleClassifier:
+    """
+    Role detector compiled from the structure files.
+
+    Every role variant and keyword target across all structures is folded
+    into one table of unique lowercased literals, each mapped to the
+    (role, weight) pairs it contributes: 2 per role variant, 1 per
+    must-include keyword and 0.5 per should-include keyword. A JD is
+    lowercased once and each distinct literal is tested once, however many
+    roles list it; scores for every role are then summed from the table.
+
+    Matching keeps the substring semantics of the original `kw in jd_lower`
+    test. A single regex automaton over the literals was measured slower
+    than C-level substring search for this, so the table is tested directly.
+    """
+
+    def __init__(self, roles: list[str], weights: dict[str, list[tuple[int, float]]]):
+        self.roles = roles
+        self.weights = weights
+
+    @classmethod
+    def from_structures(cls, structures: dict[str, dict]) -> "RoleClassifier":
+        weights: dict[str, list[tuple[int, float]]] = {}
+        for i, structure in enumerate(structures.values()):
+            kt = structure.get("keyword_targets", {})
+            for literals, weight in (
+                (structure.get("role_variants", []), 2.0),
+                (kt.get("must_include", []), 1.0),
+                (kt.get("should_include", []), 0.5),
+            ):
+                for lit in literals:
+                    weights.setdefault(lit.lower(), []).append((i, weight))
+        return cls(list(structures), weights)
+
+    def scores(self, jd_text: str) -> dict[str, float]:
+        """Return the raw score of every role for one JD, in structure order."""
+        jd_lower = jd_text.lower()
+        totals = [0.0] * len(self.roles)
+        for lit, contributions in self.weights.items():
+            if lit in jd_lower:
+                for i, weight in contributions:
+                    totals[i] += weight
+        return dict(zip(self.roles, totals))
+
+    def scores_batch(self, jd_texts: list[str]) -> list[dict[str, float]]:
+        """Return scores() for each JD in order."""
+        return [self.scores(text) for text in jd_texts]
+
+    def classify(self, jd_text: str) -> tuple[str, float]:
+        """Return (role_slug, confidence_0_to_10) for the best-scoring role.
+
+        Ties go to the role listed first; with no hits the default is
+        solutions-engineer.
+        """
+        best_role = "solutions-engineer"
+        best_score = 0.0
+        for role_slug, score in self.scores(jd_text).items():
+            if score > best_score:
+                best_score = score
+                best_role = role_slug
+
+        # Normalize to 0–10
+        confidence = round(min(10.0, best_score), 1)
+        return best_role, confidence
+
+
+def load_role_classifier() -> RoleClassifier:
+    """Return the RoleClassifier for the current structure files, using the on-disk cache.
+
+    The role/weight tables are pickled under .cache/ keyed by a hash of the
+    structure files' names and bytes, so the structures are only re-parsed
+    when one of them changes.
+    """
+    h = hashlib.sha256(f"v{ROLE_CLASSIFIER_VERSION}".encode())
+    for struct_path in STRUCTURES_DIR.glob("*.yaml"):
+        h.update(struct_path.name.encode("utf-8") + b"\0" + struct_path.read_bytes() + b"\0")
+    digest = h.hexdigest()[:16]
+
+    classifier = _ROLE_CLASSIFIERS.get(digest)
+    if classifier is not None:
+        return classifier
 
-        score = 0.0
-        # Role variants: strong signal (2 pts each)
-        for variant in structure.get("role_variants", []):
-            if variant.lower() in jd_lower:
-                score += 2.0
+    cache_path = CACHE_DIR / f"role-classifier-{digest}.pkl"
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                roles, weights = pickle.load(f)
+            classifier = RoleClassifier(roles, weights)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            classifier = None  # Corrupt or partial cache file; rebuild below
 
-        # Must-include keywords (1 pt each)
-        kt = structure.get("keyword_targets", {})
-        for kw in kt.get("must_include", []):
-            if kw.lower() in jd_lower:
-                score += 1.0
+    if classifier is None:
+        classifier = RoleClassifier.from_structures(load_structures())
+        CACHE_DIR.mkdir(exist_ok=True)
+        for stale in CACHE_DIR.glob("role-classifier-*.pkl"):
+            stale.unlink(missing_ok=True)
+        atomic_write(cache_path, pickle.dumps((classifier.roles, classifier.weights),
+                                              protocol=pickle.HIGHEST_PROTOCOL))
 
-        # Should-include keywords (0.5 pt each)
-        for kw in kt.get("should_include", []):
-            if kw.lower() in jd_lower:
-                score += 0.5
+    _ROLE_CLASSIFIERS[digest] = classifier
+    return classifier
 
-        if score > best_score:
-            best_score = score
-            best_role = struct_path.stem
 
-    # Normalize to 0–10
-    confidence = round(min(10.0, best_score), 1)
-    return best_role, confidence
+def auto_detect_role(jd_text: str, classifier: RoleClassifier | None = None) -> tuple[str, float]:
+    """
+    Score each role template against the JD text and return the best match.
+    Pass a classifier from load_role_classifier() to skip the cache lookup.
+    Returns: (role_slug, confidence_0_to_10)
+    """
+    if classifier is None:
+        classifier = load_role_classifier()
+    return classifier.classify(jd_text)
 
 
 def list_available_roles() -> list[str]:
     return [p.stem for p in STRUCTURES_DIR.glob("*.yaml")]
 
 
-# ---- Subprocess runners -----------------------------------------------------
+# ---- Pipeline stages --------------------------------------------------------
 
-def run_parser(jd_path: Path, company: str | None = None, role_hint: str | None = None) -> Path:
-    """Run jd_parser.py and return the output path."""
-    slug = jd_path.stem.replace("job-desc-", "")
-    out = ARCHIVE_DIR / f"jd-parsed-{slug}-{date.today()}.yaml"
+def parsed_jd_path(jd_path: Path) -> Path:
+    """Today's archive/ path for a JD's parsed YAML."""
+    return ARCHIVE_DIR / f"jd-parsed-{jd_path.stem.replace('job-desc-', '')}-{date.today()}.yaml"
 
-    if out.exists():
-        print(f"  [cache] Parsed JD already exists: {out.name}  (delete to re-parse)")
-        return out
 
-    cmd = [PYTHON, str(ROOT / "scripts" / "jd_parser.py"), "--job", str(jd_path)]
-    if company:
-        cmd += ["--company", company]
-    if role_hint:
-        cmd += ["--role", role_hint]
-    cmd += ["--output", str(out)]
+def scores_path(jd_path: Path) -> Path:
+    """Today's archive/ path for a JD's skill scores YAML."""
+    return ARCHIVE_DIR / f"jd-scores-{jd_path.stem.replace('job-desc-', '')}-{date.today()}.yaml"
 
-    print("  [1/7] Parsing job description...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  [!] Parser error:\n{result.stderr}")
-        sys.exit(1)
-    print(f"       {result.stdout.strip().splitlines()[-1] if result.stdout else out}")
-    return out
 
+def run_parser(
+    jd_path: Path,
+    company: str | None = None,
+    role_hint: str | None = None,
+    doc: JDDocument | None = None,
+    save: bool = True,
+) -> tuple[dict, Path]:
+    """Parse the JD in-process. Returns (parsed_jd, artifact_path)."""
+    out = parsed_jd_path(jd_path)
 
-def run_scorer(jd_path: Path, parsed_jd_path: Path) -> Path:
-    """Run scorer.py and return the output path."""
-    slug = jd_path.stem.replace("job-desc-", "")
-    out = ARCHIVE_DIR / f"jd-scores-{slug}-{date.today()}.yaml"
+    print("  [1/7] Parsing job description...")
+    parsed_jd = jd_parser.parse_jd(jd_path, company, role_hint, doc=doc)
+    if save:
+        ARCHIVE_DIR.mkdir(exist_ok=True)
+        save_yaml(out, parsed_jd)
+        print(f"       Parsed JD written to: {out}")
+    else:
+        print(f"       Parsed: {parsed_jd['company']} — {parsed_jd['inferred_role']}")
+    return parsed_jd, out
 
-    if out.exists():
-        print(f"  [cache] Scores already exist: {out.name}  (delete to re-score)")
-        return out
 
-    cmd = [
-        PYTHON, str(ROOT / "scripts" / "scorer.py"),
-        "--jd", str(jd_path),
-        "--parsed-jd", str(parsed_jd_path),
-        "--output", str(out),
-    ]
+def run_scorer(
+    jd_path: Path,
+    parsed_jd_path: Path,
+    parsed_jd: dict,
+    doc: JDDocument | None = None,
+    save: bool = True,
+    skill_index: list[dict] | None = None,
+) -> tuple[dict, Path]:
+    """Score skills in-process. Returns (scores, artifact_path)."""
+    out = scores_path(jd_path)
 
     print("  [2/7] Scoring skills against taxonomy...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  [!] Scorer error:\n{result.stderr}")
-        sys.exit(1)
-    print(f"       {result.stdout.strip().splitlines()[-1] if result.stdout else out}")
-    return out
+    skill_scores, summary = scorer.run_scoring(
+        jd_path, parsed_jd_path,
+        doc=doc,
+        skill_index=skill_index if skill_index is not None else scorer.load_skill_index(),
+        parsed_jd=parsed_jd,
+    )
+    scores = scorer.build_scores_output(jd_path, parsed_jd_path, skill_scores, summary)
+    if save:
+        ARCHIVE_DIR.mkdir(exist_ok=True)
+        save_yaml(out, scores)
+        print(f"       Scores written to: {out}")
+    else:
+        print(f"       Estimated fit: {summary['estimated_fit_score']}/10")
+    return scores, out
+
+
+def load_content_banks() -> tuple[dict | None, dict | None]:
+    """Load the bullet and paragraph banks if they exist."""
+    bullet_bank = load_yaml(BULLET_BANK_PATH) if BULLET_BANK_PATH.exists() else None
+    paragraph_bank = load_yaml(PARAGRAPH_BANK_PATH) if PARAGRAPH_BANK_PATH.exists() else None
+    return bullet_bank, paragraph_bank
 
 
 def run_generate(
-    jd_path: Path,
+    jd_text: str,
     role: str,
     mode: str,
-    parsed_jd_path: Path,
-    scores_path: Path,
-    output_path: str,
-    fit_eval_path: str | None = None,
-    use_bullet_bank: bool = True,
-    use_paragraph_bank: bool = True,
-) -> Path:
-    """Run generate_resume.py and return the output path."""
-    cmd = [
-        PYTHON, str(ROOT / "scripts" / "generate_resume.py"),
-        "--job", str(jd_path),
-        "--role", role,
-        "--mode", mode,
-        "--parsed-jd", str(parsed_jd_path),
-        "--pre-scores", str(scores_path),
-        "--output", output_path,
-    ]
-    if fit_eval_path:
-        cmd += ["--fit-eval", fit_eval_path]
-
-    # Add content banks if they exist
-    bullet_bank = ROOT / "portfolio" / "bullet-bank.yaml"
-    paragraph_bank = ROOT / "portfolio" / "paragraph-bank.yaml"
-    if use_bullet_bank and bullet_bank.exists() and mode in ("resume",):
-        cmd += ["--bullet-bank", str(bullet_bank)]
-    if use_paragraph_bank and paragraph_bank.exists() and mode in ("cover-letter",):
-        cmd += ["--paragraph-bank", str(paragraph_bank)]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  [!] generate_resume error:\n{result.stderr}")
-        sys.exit(1)
-    last_line = result.stdout.strip().splitlines()[-1] if result.stdout else output_path
-    print(f"       {last_line}")
-    return Path(output_path)
+    parsed_jd: dict,
+    scores: dict,
+    inputs: dict,
+    fit_eval_text: str | None = None,
+    bullet_bank: dict | None = None,
+    paragraph_bank: dict | None = None,
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    max_tokens: int | None = None,
+    bullet_budget: int | None = None,
+    ranking: str = "tags",
+) -> str:
+    """Assemble one prompt in-process and return its text.
+
+    Banks are only applied to the mode that uses them: bullets for the
+    resume, paragraphs for the cover letter.
+    """
+    prompt = generate_resume.build_prompt(
+        mode=mode,
+        job_text=jd_text,
+        role=role,
+        inputs=inputs,
+        parsed_jd=parsed_jd,
+        pre_scores=scores,
+        fit_eval_text=fit_eval_text,
+        bullet_bank=bullet_bank if mode == "resume" else None,
+        paragraph_bank=paragraph_bank if mode == "cover-letter" else None,
+        cache_friendly=cache_friendly,
+        cache_marker=cache_marker,
+        max_tokens=max_tokens,
+        bullet_budget=bullet_budget,
+        ranking=ranking,
+    )
+    return prompt
+
+
+def prompt_layout(cache_friendly: bool, cache_marker: bool) -> str:
+    """Name of the prompt layout, as recorded in the build cache inputs."""
+    if not cache_friendly:
+        return "default"
+    return "cache-friendly+marker" if cache_marker else "cache-friendly"
+
+
+def shared_prefix_report(prompts: dict[str, dict[str, list[str]]]) -> None:
+    """
+    Print how many leading characters the prompts of a batch have in common.
+
+    prompts maps role template -> prompt mode -> prompt texts. Prefix caches
+    only reuse an identical leading span, so this is the part of each prompt
+    a provider could serve from cache after the first request.
+    """
+    print("  Shared prompt prefix (identical leading characters):")
+    for role, by_mode in prompts.items():
+        everything = [p for texts in by_mode.values() for p in texts]
+        rows = list(by_mode.items())
+        if len(by_mode) > 1:
+            rows.append(("all modes", everything))
+        for name, texts in rows:
+            if len(texts) < 2:
+                continue
+            shared = len(os.path.commonprefix(texts))
+            mean = sum(len(t) for t in texts) / len(texts)
+            print(f"    {role:<24} {name:<14} {len(texts):>3} prompt(s)  "
+                  f"{shared:>9,} chars  ({shared / mean:.0%} of mean {mean:,.0f})")
 
 
 # ---- Tracker integration ----------------------------------------------------
@@ -208,24 +376,13 @@ def add_to_tracker(
     output_file: str,
     status: str = "applied",
 ) -> None:
-    """Append a new entry to output/tracker.yaml."""
-    cmd = [
-        PYTHON, str(ROOT / "scripts" / "tracker.py"),
-        "--add",
-        "--company", company,
-        "--role", role_title,
-        "--recommendation", recommendation,
-        "--app-status", status,
-        "--output-file", output_file,
-    ]
-    if fit_score is not None:
-        cmd += ["--fit", str(fit_score)]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode == 0:
-        print(f"  [6/7] Tracker: {result.stdout.strip()}")
+    """Append a new entry to the tracker (output/tracker.yaml, or tracker.db)."""
+    entry = tracker.build_entry(company, role_title, fit_score, recommendation, status, output_file)
+    if tracker.add_applications([entry])[0]:
+        print(f"  [6/7] Tracker: Added: {company} — {role_title}  [{status}]")
     else:
-        print(f"  [!] Tracker warning: {result.stderr.strip()}")
+        print(f"  [6/7] Tracker: Warning: Entry for {company} — {role_title} already exists. "
+              f"Use --update to modify.")
 
 
 # ---- Gap sync ---------------------------------------------------------------
@@ -249,42 +406,103 @@ def _extract_gap_mentions(text: str) -> list[str]:
     return list(dict.fromkeys(gaps))  # deduplicate while preserving order
 
 
-def sync_gaps_to_skill_development(output_file: Path, company: str, role_title: str) -> int:
+def gap_log_entry(output_file: Path, company: str, role_title: str) -> dict | None:
     """
-    Scan the output .md file for gap mentions and append them to
-    portfolio/skill-development.yaml under the gap_tracking_log section.
-    Returns number of gaps appended.
+    Build a gap_tracking_log entry from the gap mentions in an output file, or
+    None. The gaps come from the file's JSON sidecar when it is current, so the
+    Markdown is only scanned for outputs written without one.
     """
     if not output_file.exists():
-        return 0
+        return None
 
-    text = output_file.read_text(encoding="utf-8")
-    gaps = _extract_gap_mentions(text)
+    sidecar = tracker.load_sidecar(output_file)
+    if sidecar is not None and "gaps" in sidecar:
+        gaps = sidecar["gaps"]
+    else:
+        gaps = _extract_gap_mentions(output_file.read_text(encoding="utf-8"))
     if not gaps:
+        return None
+
+    return {
+        "evaluation_date": str(date.today()),
+        "company": company,
+        "role": role_title,
+        "source_file": str(output_file.relative_to(ROOT)).replace("\\", "/"),
+        "gaps_identified": gaps,
+    }
+
+
+def append_gap_entries(entries: list[dict]) -> int:
+    """
+    Append gap log entries to portfolio/skill-development.yaml under the
+    gap_tracking_log section in a single locked write (see
+    tracker.locked_update). Returns number of gaps appended.
+    """
+    if not entries:
         return 0
 
     if not SKILL_DEV_PATH.exists():
         print(f"  [!] skill-development.yaml not found; skipping gap sync.")
         return 0
 
-    skill_dev = load_yaml(SKILL_DEV_PATH)
+    def append(skill_dev: dict) -> bool:
+        # Navigate or create the gap_tracking_log section
+        if "gap_tracking_log" not in skill_dev:
+            skill_dev["gap_tracking_log"] = []
+        skill_dev["gap_tracking_log"].extend(entries)
+        return True
 
-    # Navigate or create the gap_tracking_log section
-    if "gap_tracking_log" not in skill_dev:
-        skill_dev["gap_tracking_log"] = []
+    # Locked read-modify-write so parallel evaluations do not lose entries
+    tracker.locked_update(SKILL_DEV_PATH, lambda: load_yaml(SKILL_DEV_PATH),
+                          lambda data: tracker.write_yaml_atomic(SKILL_DEV_PATH, data), append)
+    return sum(len(e["gaps_identified"]) for e in entries)
 
-    log = skill_dev["gap_tracking_log"]
-    new_entry = {
-        "evaluation_date": str(date.today()),
-        "company": company,
-        "role": role_title,
-        "source_file": str(output_file.relative_to(ROOT)).replace("\\", "/"),
-        "gaps_identified": gaps,
+
+def sync_gaps_to_skill_development(output_file: Path, company: str, role_title: str) -> int:
+    """
+    Scan the output .md file for gap mentions and append them to
+    portfolio/skill-development.yaml under the gap_tracking_log section.
+    Returns number of gaps appended.
+    """
+    entry = gap_log_entry(output_file, company, role_title)
+    return append_gap_entries([entry] if entry else [])
+
+
+# ---- Sidecar fields ---------------------------------------------------------
+
+def prescore_summary(parsed_jd: dict, scores: dict) -> dict:
+    """The pre-score summary fields stored in an application's JSON sidecar."""
+    summary = scores.get("summary", {})
+    return {
+        "seniority": parsed_jd.get("seniority", "unknown"),
+        "estimated_fit_score": summary.get("estimated_fit_score"),
+        "strong_match_count": summary.get("strong_match_count", 0),
+        "partial_match_count": summary.get("partial_match_count", 0),
+        "top_matching_skills": summary.get("top_matching_skills", []),
+        "likely_gaps": summary.get("likely_gaps", []),
     }
-    log.append(new_entry)
 
-    save_yaml(SKILL_DEV_PATH, skill_dev)
-    return len(gaps)
+
+def section_offsets(lines: list[str], sections: list[tuple[str, str]]) -> dict[str, list[int]]:
+    """
+    Byte offsets [start, end) in the UTF-8 output of each prompt section, given
+    the lines the output is joined from and (name, heading line) per section.
+    A section spans from its heading to the next section's heading (or EOF).
+    """
+    headings = {heading: name for name, heading in sections}
+    offsets: dict[str, list[int]] = {}
+    pos, current = 0, None
+    for line in lines:
+        name = headings.get(line)
+        if name is not None:
+            if current:
+                offsets[current][1] = pos
+            current = name
+            offsets[name] = [pos, pos]
+        pos += len(line.encode("utf-8")) + 1  # joined with "\n"
+    if current:
+        offsets[current][1] = pos - 1
+    return offsets
 
 
 # ---- Summary printer --------------------------------------------------------
@@ -313,63 +531,216 @@ def print_prescore_summary(parsed_jd: dict, scores: dict) -> None:
     print()
 
 
-# ---- Main -------------------------------------------------------------------
+# ---- Build cache ------------------------------------------------------------
+
+SCRIPTS_DIR = ROOT / "scripts"
+
+# Files each cached stage reads, besides the JD and upstream stage results
+STAGE_FILES = {
+    "parse": ("evaluate.py", "jd_parser.py"),
+    "score": ("evaluate.py", "jd_parser.py", "scorer.py", "taxonomy"),
+    "fit-eval": ("evaluate.py", "generate_resume.py", "portfolio", "taxonomy",
+                 "fit-eval-structure"),
+    "resume": ("evaluate.py", "generate_resume.py", "bank_vectors.py", "portfolio", "taxonomy",
+               "standards", "bullet-bank"),
+    "cover-letter": ("evaluate.py", "generate_resume.py", "bank_vectors.py", "portfolio",
+                     "taxonomy", "cover-letter-structure", "paragraph-bank"),
+}
+
+BUILD_INPUT_PATHS = {
+    "evaluate.py": SCRIPTS_DIR / "evaluate.py",
+    "jd_parser.py": SCRIPTS_DIR / "jd_parser.py",
+    "scorer.py": SCRIPTS_DIR / "scorer.py",
+    "generate_resume.py": SCRIPTS_DIR / "generate_resume.py",
+    "bank_vectors.py": SCRIPTS_DIR / "bank_vectors.py",
+    "taxonomy": generate_resume.TAXONOMY_PATH,
+    "portfolio": generate_resume.PORTFOLIO_PATH,
+    "standards": generate_resume.STANDARDS_PATH,
+    "fit-eval-structure": generate_resume.FIT_EVAL_STRUCTURE_PATH,
+    "cover-letter-structure": generate_resume.COVER_LETTER_STRUCTURE_PATH,
+    "bullet-bank": BULLET_BANK_PATH,
+    "paragraph-bank": PARAGRAPH_BANK_PATH,
+}
+
+
+def stage_inputs(stage: str, **extra: str) -> dict[str, str]:
+    """Digest every input of a cached stage: its files plus the given extra digests."""
+    inputs = {name: build_cache.file_digest(BUILD_INPUT_PATHS[name]) for name in STAGE_FILES[stage]}
+    inputs.update(extra)
+    return inputs
+
+
+def probe_stage(stage: str, inputs: dict[str, str], previous: dict | None, rebuild: bool = False):
+    """
+    Look up a stage's cached result.
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="End-to-end orchestrator: parse → score → generate → track → gap-sync"
-    )
-    parser.add_argument("--job", required=True, help="Path to raw JD text file")
-    parser.add_argument(
-        "--role",
-        choices=list_available_roles(),
-        help="Role template (auto-detected if not specified)",
-    )
-    parser.add_argument(
-        "--company", help="Company name override (default: inferred from filename)"
-    )
-    parser.add_argument(
-        "--mode",
-        choices=["all", "fit-only", "resume", "skip"],
-        default="all",
-        help="Generation mode: all (default), fit-only, resume, skip (summary only)",
-    )
-    parser.add_argument(
-        "--no-interact",
-        action="store_true",
-        dest="no_interact",
-        help="Skip interactive prompts; proceed with defaults",
-    )
-    parser.add_argument(
-        "--output",
-        help="Base output file path (default: output/application-{slug}-{date}.md)",
-    )
-    args = parser.parse_args()
+    Returns (value, manifest_entry, note): value is None when the stage has
+    to run; note says why ('cached', 'rebuilt: <changed inputs>', or '').
+    """
+    key = build_cache.stage_key(stage, inputs)
+    value = None if rebuild else build_cache.load_artifact(stage, key)
+    if value is not None:
+        built = (previous or {}).get("built") if (previous or {}).get("key") == key else None
+        return value, {"key": key, "inputs": inputs, "built": built or str(date.today())}, "cached"
+    changed = build_cache.changed_inputs(previous, inputs)
+    note = f"rebuilt: {', '.join(changed)} changed" if changed else ""
+    return None, {"key": key, "inputs": inputs, "built": str(date.today())}, note
+
+
+def _build_target(jd_path: Path) -> str:
+    """Manifest key for a JD: its path relative to the repo root when possible."""
+    resolved = jd_path.resolve()
+    try:
+        return str(resolved.relative_to(ROOT)).replace("\\", "/")
+    except ValueError:
+        return str(resolved)
 
-    jd_path = Path(args.job)
-    if not jd_path.exists():
-        print(f"Error: JD file not found: {jd_path}")
-        sys.exit(1)
 
+# ---- Stage graph ------------------------------------------------------------
+
+def run_stage_graph(stages: dict[str, tuple], jobs: int = 1) -> dict:
+    """
+    Run pipeline stages as a dependency graph.
+
+    stages maps name -> (fn, deps). Each fn is called with the results dict
+    once all of its deps have finished and returns the stage's result. Ready
+    stages run concurrently on at most `jobs` threads; with jobs=1 they run
+    one at a time in insertion order. Returns {name: result}.
+    """
+    jobs = max(1, jobs)
+    results: dict = {}
+    pending = dict(stages)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name, (fn, deps) in list(pending.items()):
+                if len(running) >= jobs:
+                    break
+                if all(dep in results for dep in deps):
+                    running[pool.submit(fn, results)] = name
+                    del pending[name]
+            if not running:
+                raise ValueError(f"Unsatisfiable stage dependencies: {', '.join(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return results
+
+
+# ---- Pipeline ---------------------------------------------------------------
+
+def evaluate_job(
+    jd_path: Path,
+    role: str | None = None,
+    company: str | None = None,
+    mode: str = "all",
+    interactive: bool = True,
+    output: str | None = None,
+    save_artifacts: bool = True,
+    jobs: int = DEFAULT_JOBS,
+    context: dict | None = None,
+    defer_writes: bool = False,
+    rebuild: bool = False,
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    max_tokens: int | None = None,
+    bullet_budget: int | None = None,
+    ranking: str = "tags",
+) -> dict | None:
+    """
+    Run the full pipeline for one JD in-process.
+
+    Returns a record of the application (output path, company, role title,
+    fit score, recommendation, tracker status, gap log entry, build manifest
+    entries), or None on skip. Pass a context from load_pipeline_context() to
+    reuse already-loaded inputs. With defer_writes, the tracker,
+    skill-development.yaml and build manifest are left untouched so the caller
+    can apply the record later (see apply_batch_writes).
+
+    The work runs as two stage graphs split by the pre-score confirmation:
+        parse → score, alongside role detection
+        {fit-eval, resume}, fit-eval → cover-letter, then merge → tracker → gap-sync
+    Independent stages run concurrently on up to `jobs` threads. Output is
+    identical for any value of jobs.
+
+    Parse, score and the three prompts are cached by the digest of their
+    inputs (see build_cache.py) and only re-run when an input changed, or
+    when rebuild is set. cache_friendly selects the prefix-stable prompt
+    layout (see generate_resume.cache_friendly_layout); max_tokens compacts
+    each prompt to an estimated token budget (see generate_resume.compact_prompt);
+    bullet_budget fits the resume bullets to a word budget
+    (see generate_resume.select_bullets_within_budget); ranking picks how bank
+    bullets and paragraphs are scored (see generate_resume.bank_relevance).
+    """
     print(f"\njamesbot evaluate: {jd_path.name}")
     print("-" * 60)
 
-    # ---- Step 1: Parse JD ---------------------------------------------------
-    parsed_jd_path = run_parser(jd_path, args.company)
-    parsed_jd = load_yaml(parsed_jd_path)
+    # Tokenize once; parser and scorer share the document
+    doc = JDDocument.from_path(jd_path)
+    jd_text = doc.text
+    jd_digest = build_cache.text_digest(jd_text)
+
+    target = _build_target(jd_path)
+    manifest = context["manifest"] if context else build_cache.load_manifest()["targets"]
+    previous = manifest.get(target, {})
+    build_entries: dict[str, dict] = {}
+    stages_run: list[str] = []
+
+    # ---- Steps 1–2: Parse JD, score skills (cached) -------------------------
+    parse_inputs = stage_inputs("parse", jd=jd_digest, jd_name=jd_path.name, company=company or "")
+    parse_cached, build_entries["parse"], parse_note = probe_stage(
+        "parse", parse_inputs, previous.get("parse"), rebuild)
+
+    # Artifacts hold results only; the dated archive/ paths are today's, not the build day's
+    def parse(r: dict) -> tuple[dict, Path]:
+        if parse_cached is not None:
+            print(f"  [cache] Parsed JD up to date  (built {build_entries['parse']['built']})")
+            out = parsed_jd_path(jd_path)
+            if save_artifacts and not out.exists():  # the scores name it as their source
+                ARCHIVE_DIR.mkdir(exist_ok=True)
+                save_yaml(out, parse_cached)
+            return parse_cached, out
+        if parse_note:
+            print(f"  [build] parse {parse_note}")
+        parsed, out = run_parser(jd_path, company, doc=doc, save=save_artifacts)
+        build_cache.store_artifact("parse", build_entries["parse"]["key"], parsed)
+        stages_run.append("parse")
+        return parsed, out
+
+    def score(r: dict) -> tuple[dict, Path]:
+        inputs = stage_inputs("score", jd=jd_digest, parse=build_entries["parse"]["key"])
+        cached, build_entries["score"], note = probe_stage("score", inputs, previous.get("score"), rebuild)
+        if cached is not None:
+            print(f"  [cache] Scores up to date  (built {build_entries['score']['built']})")
+            out = scores_path(jd_path)
+            if save_artifacts and not out.exists():  # alongside today's parsed JD
+                ARCHIVE_DIR.mkdir(exist_ok=True)
+                save_yaml(out, dict(cached, parsed_jd=r["parse"][1].name))
+            return cached, out
+        if note:
+            print(f"  [build] score {note}")
+        parsed, parsed_path = r["parse"]
+        scores, out = run_scorer(jd_path, parsed_path, parsed, doc=doc, save=save_artifacts,
+                                 skill_index=context and context["skill_index"])
+        build_cache.store_artifact("score", build_entries["score"]["key"], scores)
+        stages_run.append("score")
+        return scores, out
+
+    # ---- Steps 1–3: Parse JD, score skills, detect role ---------------------
+    analysis = run_stage_graph({
+        "parse": (parse, ()),
+        "score": (score, ("parse",)),
+        "detect-role": (lambda r: auto_detect_role(jd_text, context and context["classifier"]), ()),
+    }, jobs)
+    parsed_jd, _ = analysis["parse"]
+    scores, _ = analysis["score"]
+    detected_role, detect_confidence = analysis["detect-role"]
     company = parsed_jd.get("company", "Unknown")
     role_title = parsed_jd.get("inferred_role", "Unknown")
 
-    # ---- Step 2: Score skills -----------------------------------------------
-    scores_path = run_scorer(jd_path, parsed_jd_path)
-    scores = load_yaml(scores_path)
-
-    # ---- Step 3: Auto-detect role -------------------------------------------
-    jd_text = jd_path.read_text(encoding="utf-8")
-    detected_role, detect_confidence = auto_detect_role(jd_text)
-
-    if args.role:
-        chosen_role = args.role
+    if role:
+        chosen_role = role
         print(f"  [3/7] Role: {chosen_role}  (user-specified; auto-detected: {detected_role})")
     else:
         chosen_role = detected_role
@@ -380,8 +751,7 @@ def main():
     fit_estimate = scores.get("summary", {}).get("estimated_fit_score", 0)
 
     # ---- Step 5: Confirm generation mode ------------------------------------
-    mode = args.mode
-    if not args.no_interact and mode == "all":
+    if interactive and mode == "all":
         print(f"  Pre-score: {fit_estimate}/10  |  Suggested role: {chosen_role}")
         print()
         print("  Generate: [a]ll  [f]it-only  [r]esume  [s]kip  [role: type name]")
@@ -401,133 +771,534 @@ def main():
             print(f"  Role overridden to: {chosen_role}")
 
     if mode == "skip":
+        if not defer_writes:
+            build_cache.update_manifest({target: build_entries})
         print("\n  [skip] Stopping after pre-score summary. No output generated.")
-        return
+        return None
 
     # ---- Output file naming -------------------------------------------------
     slug = jd_path.stem.replace("job-desc-", "")
-    if args.output:
-        base_output = args.output
+    if output:
+        base_output = output
     else:
         base_output = str(OUTPUT_DIR / f"application-{slug}-{date.today()}.md")
 
-    # ---- Step 5a: Fit evaluation --------------------------------------------
-    fit_eval_path = None
+    # ---- Step 5a–5c: Prompt stages (cached) ---------------------------------
+    prompt_sections = []
     if mode in ("all", "fit-only", "resume"):
-        print(f"\n  [4/7] Generating fit evaluation  →  {Path(base_output).name}")
-        # Write fit-eval to a temp file, then we'll merge into the main output
-        fit_eval_out = str(OUTPUT_DIR / f"_tmp-fit-eval-{slug}.md")
-        run_generate(
-            jd_path=jd_path,
-            role=chosen_role,
-            mode="fit-eval",
-            parsed_jd_path=parsed_jd_path,
-            scores_path=scores_path,
-            output_path=fit_eval_out,
-        )
-        fit_eval_path = fit_eval_out
-
-    # ---- Step 5b: Resume ----------------------------------------------------
+        prompt_sections.append(("fit-eval", "[4/7] Fit evaluation prompt", "## FIT EVALUATION PROMPT\n"))
     if mode in ("all", "resume"):
-        print(f"\n  [5a/7] Generating resume prompt  →  {Path(base_output).name}")
-        resume_out = str(OUTPUT_DIR / f"_tmp-resume-{slug}.md")
-        run_generate(
-            jd_path=jd_path,
-            role=chosen_role,
-            mode="resume",
-            parsed_jd_path=parsed_jd_path,
-            scores_path=scores_path,
-            output_path=resume_out,
-            use_bullet_bank=True,
-        )
-
-    # ---- Step 5c: Cover letter ----------------------------------------------
+        prompt_sections.append(("resume", "[5a/7] Resume prompt", "## RESUME PROMPT\n"))
     if mode == "all":
-        print(f"\n  [5b/7] Generating cover letter prompt  →  {Path(base_output).name}")
-        cl_out = str(OUTPUT_DIR / f"_tmp-cover-letter-{slug}.md")
-        run_generate(
-            jd_path=jd_path,
-            role=chosen_role,
-            mode="cover-letter",
-            parsed_jd_path=parsed_jd_path,
-            scores_path=scores_path,
-            output_path=cl_out,
-            fit_eval_path=fit_eval_path,
-            use_paragraph_bank=True,
+        prompt_sections.append(("cover-letter", "[5b/7] Cover letter prompt", "## COVER LETTER PROMPT\n"))
+
+    shared_inputs = {
+        "jd": jd_digest,
+        "score": build_entries["score"]["key"],
+        "role": chosen_role,
+        "structure": build_cache.file_digest(STRUCTURES_DIR / f"{chosen_role}.yaml"),
+    }
+    layout = prompt_layout(cache_friendly, cache_marker)
+    if layout != "default":
+        shared_inputs["layout"] = layout
+    if max_tokens:
+        shared_inputs["max-tokens"] = str(max_tokens)
+    prompts: dict[str, str] = {}
+    notes: dict[str, str] = {}
+    for name, _, _ in prompt_sections:
+        extra = dict(shared_inputs)
+        if name == "cover-letter":
+            extra["fit-eval"] = build_entries["fit-eval"]["key"]
+        if name == "resume" and bullet_budget:
+            extra["bullet-budget"] = str(bullet_budget)
+        if name in ("resume", "cover-letter") and ranking != "tags":
+            extra["ranking"] = ranking
+        cached, build_entries[name], notes[name] = probe_stage(
+            name, stage_inputs(name, **extra), previous.get(name), rebuild)
+        if cached is not None:
+            prompts[name] = cached
+
+    def prompt_text(r: dict, name: str) -> str:
+        return r[name] if name in r else prompts[name]
+
+    def generate(r: dict, prompt_mode: str, **kwargs) -> str:
+        prompt = run_generate(jd_text, chosen_role, prompt_mode, parsed_jd, scores,
+                              r["load-inputs"], cache_friendly=cache_friendly,
+                              cache_marker=cache_marker, max_tokens=max_tokens,
+                              bullet_budget=bullet_budget, ranking=ranking, **kwargs)
+        build_cache.store_artifact(prompt_mode, build_entries[prompt_mode]["key"], prompt)
+        stages_run.append(prompt_mode)
+        return prompt
+
+    # Only stages whose inputs changed run; inputs are loaded only if one does
+    stale = [name for name, _, _ in prompt_sections if name not in prompts]
+    stages = {}
+    if stale:
+        stages["load-inputs"] = (lambda r: context["prompt_inputs"][chosen_role] if context
+                                 else generate_resume.load_prompt_inputs(chosen_role), ())
+    if "resume" in stale or "cover-letter" in stale:
+        stages["load-banks"] = (lambda r: context["banks"] if context else load_content_banks(), ())
+    if "fit-eval" in stale:
+        stages["fit-eval"] = (lambda r: generate(r, "fit-eval"), ("load-inputs",))
+    if "resume" in stale:
+        stages["resume"] = (
+            lambda r: generate(r, "resume", bullet_bank=r["load-banks"][0]),
+            ("load-inputs", "load-banks"),
+        )
+    if "cover-letter" in stale:
+        stages["cover-letter"] = (
+            lambda r: generate(r, "cover-letter", fit_eval_text=prompt_text(r, "fit-eval"),
+                               paragraph_bank=r["load-banks"][1]),
+            ("load-inputs", "load-banks") + (("fit-eval",) if "fit-eval" in stale else ()),
         )
 
-    # ---- Step 5d: Merge all prompt files into one output --------------------
-    print(f"\n  [5c/7] Assembling prompts → {base_output}")
-    combined = []
-    combined.append(f"# Application: {company} — {role_title}")
-    combined.append(f"**Date evaluated:** {date.today()}")
-    combined.append(f"**Pre-score estimate:** {fit_estimate}/10")
-    combined.append(f"**Role template used:** {chosen_role}")
-    combined.append("")
-    combined.append("---")
-    combined.append("")
-
-    tmp_files = []
-    if mode in ("all", "fit-only", "resume") and fit_eval_path:
-        combined.append("## FIT EVALUATION PROMPT\n")
-        tmp_files.append(fit_eval_path)
-        combined.append(Path(fit_eval_path).read_text(encoding="utf-8"))
-        combined.append("\n---\n")
-    if mode in ("all", "resume"):
-        resume_f = str(OUTPUT_DIR / f"_tmp-resume-{slug}.md")
-        if Path(resume_f).exists():
-            combined.append("## RESUME PROMPT\n")
-            tmp_files.append(resume_f)
-            combined.append(Path(resume_f).read_text(encoding="utf-8"))
-            combined.append("\n---\n")
-    if mode == "all":
-        cl_f = str(OUTPUT_DIR / f"_tmp-cover-letter-{slug}.md")
-        if Path(cl_f).exists():
-            combined.append("## COVER LETTER PROMPT\n")
-            tmp_files.append(cl_f)
-            combined.append(Path(cl_f).read_text(encoding="utf-8"))
+    # ---- Step 5d: Merge all prompts into one output -------------------------
+    def merge(r: dict) -> Path:
+        print()
+        for name, label, _ in prompt_sections:
+            note = f"  ({notes[name]})" if notes[name] else ""
+            if cache_friendly:
+                prefix = generate_resume.static_prefix_length(prompt_text(r, name))
+                note = f"  static prefix {prefix:,}{note}"
+            if max_tokens:
+                tokens = generate_resume.estimate_tokens(prompt_text(r, name))
+                note = f"  ~{tokens:,}/{max_tokens:,} tokens{note}"
+            print(f"  {label:<30} {len(prompt_text(r, name)):>9,} characters{note}")
+        print(f"\n  [5c/7] Assembling prompts → {base_output}")
+        combined = []
+        combined.append(f"# Application: {company} — {role_title}")
+        combined.append(f"**Date evaluated:** {date.today()}")
+        combined.append(f"**Pre-score estimate:** {fit_estimate}/10")
+        combined.append(f"**Role template used:** {chosen_role}")
+        combined.append("")
+        combined.append("---")
+        combined.append("")
+        for name, _, heading in prompt_sections:
+            combined.append(heading)
+            combined.append(prompt_text(r, name))
+            if name != "cover-letter":
+                combined.append("\n---\n")
+
+        text = "\n".join(combined)
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        Path(base_output).write_text(text, encoding="utf-8")
+        tracker.write_sidecar(Path(base_output), {
+            "company": company,
+            "role": role_title,
+            "role_template": chosen_role,
+            "date_evaluated": str(date.today()),
+            "fit_score": fit_estimate,
+            "recommendation": record["recommendation"],
+            "gaps": _extract_gap_mentions(text),
+            "prescore": prescore_summary(parsed_jd, scores),
+            "sections": section_offsets(combined, [(name, heading) for name, _, heading in prompt_sections]),
+        })
+        print(f"       Written: {base_output}")
+        return Path(base_output)
+
+    record = {
+        "jd": jd_path.name,
+        "output": base_output,
+        "output_file": None,
+        "company": company,
+        "role_title": role_title,
+        "role_template": chosen_role,
+        "fit_score": fit_estimate,
+        "recommendation": f"Pre-score {fit_estimate}/10",
+        "status": "applied" if fit_estimate >= 6.5 else "skipped",
+        "gap_entry": None,
+        "build": {target: build_entries},
+        "stages_run": stages_run,
+    }
 
-    Path(base_output).write_text("\n".join(combined), encoding="utf-8")
-    print(f"       Written: {base_output}")
+    # ---- Step 6: Add to tracker ---------------------------------------------
+    def track(r: dict) -> str | None:
+        status = record["status"]
+        if interactive:
+            ans = input(f"\n  [6/7] Add to tracker as [{status}]? [y/n/status]: ").strip().lower()
+            if ans and ans not in ("y", "yes"):
+                status = ans if ans in tracker.VALID_STATUSES else None
+        record["status"] = status
+
+        if status:
+            record["output_file"] = str(Path(base_output).relative_to(ROOT)).replace("\\", "/")
+        if status and not defer_writes:
+            add_to_tracker(company, role_title, fit_estimate, record["recommendation"],
+                           record["output_file"], status)
+        return status
 
-    # Clean up temp files
-    for tf in tmp_files:
-        try:
-            Path(tf).unlink()
-        except Exception:
-            pass
+    # ---- Step 7: Sync gaps to skill-development.yaml ------------------------
+    def gap_sync(r: dict) -> int:
+        print(f"  [7/7] Scanning output for skill gaps...")
+        record["gap_entry"] = gap_log_entry(r["merge"], company, role_title)
+        if defer_writes:
+            return 0
+        n_gaps = append_gap_entries([record["gap_entry"]] if record["gap_entry"] else [])
+        if n_gaps:
+            print(f"       Appended {n_gaps} gap(s) to portfolio/skill-development.yaml")
+        else:
+            print(f"       No gap patterns detected in output.")
+        return n_gaps
+
+    stages["merge"] = (merge, tuple(stale))
+    stages["tracker"] = (track, ("merge",))
+    stages["gap-sync"] = (gap_sync, ("tracker",))
+    run_stage_graph(stages, jobs)
+    if not defer_writes:
+        build_cache.update_manifest(record["build"])
 
-    # ---- Step 6: Add to tracker ---------------------------------------------
-    rec = f"Pre-score {fit_estimate}/10"
-    status = "applied" if fit_estimate >= 6.5 else "skipped"
-    if not args.no_interact:
-        ans = input(f"\n  [6/7] Add to tracker as [{status}]? [y/n/status]: ").strip().lower()
-        if ans and ans not in ("y", "yes"):
-            if ans in ("n", "no"):
-                status = None
-            elif ans in ("applied", "interviewing", "offer", "rejected", "ghosted", "skipped",
-                         "pending_application", "pending_evaluation"):
-                status = ans
-            else:
-                status = None
+    print()
+    print(f"  Done! Output: {base_output}")
+    print(f"  View tracker: python scripts/tracker.py --status")
+    print()
+    return record
 
-    if status:
-        add_to_tracker(company, role_title, fit_estimate, rec,
-                       str(Path(base_output).relative_to(ROOT)).replace("\\", "/"),
-                       status)
 
-    # ---- Step 7: Sync gaps to skill-development.yaml ------------------------
-    print(f"  [7/7] Scanning output for skill gaps...")
-    n_gaps = sync_gaps_to_skill_development(Path(base_output), company, role_title)
-    if n_gaps:
-        print(f"       Appended {n_gaps} gap(s) to portfolio/skill-development.yaml")
+# ---- Batch mode -------------------------------------------------------------
+
+# Set in each worker process by _init_worker (inherited directly under fork)
+_WORKER_CONTEXT: dict | None = None
+
+
+def load_pipeline_context() -> dict:
+    """
+    Load everything a pipeline run reads that does not depend on the JD:
+    the skill index, every role structure, the role classifier, the prompt
+    inputs for every role, the content banks and the build manifest. Loaded
+    once and shared across a batch.
+    """
+    structures = load_structures()
+    shared_inputs = generate_resume.load_prompt_inputs(next(iter(structures)))
+    return {
+        "skill_index": scorer.load_skill_index(),
+        "structures": structures,
+        "classifier": load_role_classifier(),
+        "prompt_inputs": {
+            role: dict(shared_inputs, structure=structure)
+            for role, structure in structures.items()
+        },
+        "banks": load_content_banks(),
+        "manifest": build_cache.load_manifest()["targets"],
+    }
+
+
+def _init_worker(context: dict) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _evaluate_worker(job: dict) -> dict:
+    """Evaluate one JD in a worker, capturing its log. Returns its record or an error."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            record = evaluate_job(
+                Path(job["jd_path"]),
+                role=job["role"],
+                mode=job["mode"],
+                interactive=False,
+                save_artifacts=job["save_artifacts"],
+                jobs=1,
+                context=_WORKER_CONTEXT,
+                defer_writes=True,
+                rebuild=job["rebuild"],
+                cache_friendly=job["cache_friendly"],
+                cache_marker=job["cache_marker"],
+                max_tokens=job["max_tokens"],
+                bullet_budget=job["bullet_budget"],
+                ranking=job["ranking"],
+            )
+    except Exception as exc:
+        return {"jd": Path(job["jd_path"]).name, "error": f"{type(exc).__name__}: {exc}"}
+    return record or {"jd": Path(job["jd_path"]).name, "skipped": True}
+
+
+def apply_batch_writes(records: list[dict]) -> tuple[int, int]:
+    """
+    Apply the tracker additions, gap log entries and build manifest entries
+    of a batch, in input order, with one write to each file.
+    Returns (tracker_added, gaps_appended).
+    """
+    to_track = [r for r in records if r.get("status")]
+    added_flags = tracker.add_applications([
+        tracker.build_entry(r["company"], r["role_title"], r["fit_score"], r["recommendation"],
+                            r["status"], r["output_file"])
+        for r in to_track
+    ]) if to_track else []
+    for r, was_added in zip(to_track, added_flags):
+        if not was_added:
+            print(f"  [!] Tracker: {r['company']} — {r['role_title']} already exists; not added.")
+    added = sum(added_flags)
+
+    n_gaps = append_gap_entries([r["gap_entry"] for r in records if r.get("gap_entry")])
+
+    build_entries = {}
+    for r in records:
+        build_entries.update(r.get("build", {}))
+    build_cache.update_manifest(build_entries)
+    return added, n_gaps
+
+
+def evaluate_batch(
+    pattern: str | list[Path],
+    workers: int,
+    role: str | None = None,
+    mode: str = "all",
+    save_artifacts: bool = True,
+    rebuild: bool = False,
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    max_tokens: int | None = None,
+    bullet_budget: int | None = None,
+    ranking: str = "tags",
+) -> list[dict]:
+    """
+    Evaluate every JD matching pattern (or in a list of paths) on a pool of
+    worker processes.
+
+    Each worker writes its own application-*.md; tracker additions and gap
+    sync are collected and applied once at the end, in input order. The
+    summary reports the prompt prefix shared across the batch.
+    """
+    if isinstance(pattern, str):
+        jd_paths, source = sorted(Path(p) for p in glob.glob(pattern)), pattern
     else:
-        print(f"       No gap patterns detected in output.")
+        jd_paths, source = list(pattern), "the queue"
+    if not jd_paths:
+        print(f"Error: no JD files match {pattern}")
+        sys.exit(1)
+
+    workers = max(1, min(workers, len(jd_paths)))
+    print(f"\njamesbot evaluate: {len(jd_paths)} JD(s) from {source}  ({workers} worker(s))")
+    print("-" * 60)
+
+    context = load_pipeline_context()
+    jobs = [
+        {"jd_path": str(p), "role": role, "mode": mode,
+         "save_artifacts": save_artifacts, "rebuild": rebuild,
+         "cache_friendly": cache_friendly, "cache_marker": cache_marker,
+         "max_tokens": max_tokens, "bullet_budget": bullet_budget, "ranking": ranking}
+        for p in jd_paths
+    ]
+
+    if workers == 1:
+        _init_worker(context)
+        results = map(_evaluate_worker, jobs)
+        pool = None
+    else:
+        # fork lets workers inherit the loaded context without pickling it
+        methods = multiprocessing.get_all_start_methods()
+        mp_context = multiprocessing.get_context("fork") if "fork" in methods else None
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=(context,),
+        )
+        results = pool.map(_evaluate_worker, jobs)
+
+    records = []
+    try:
+        for i, record in enumerate(results, 1):
+            records.append(record)
+            prefix = f"  [{i}/{len(jobs)}] {record['jd']:<50}"
+            if "error" in record:
+                print(f"{prefix} FAILED  {record['error']}")
+            elif record.get("skipped"):
+                print(f"{prefix} skipped")
+            else:
+                ran = [st for st in STAGE_FILES if st in record["stages_run"]]
+                print(f"{prefix} {record['fit_score']:>4}/10  {record['role_template']:<22} "
+                      f"[{record['status'] or 'untracked'}]  ran: {', '.join(ran) or 'nothing (cached)'}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    completed = [r for r in records if "error" not in r and not r.get("skipped")]
+    added, n_gaps = apply_batch_writes(completed)
+    failed = sum(1 for r in records if "error" in r)
 
     print()
-    print(f"  Done! Output: {base_output}")
+    print(f"  Evaluated {len(completed)} of {len(records)} JD(s)"
+          + (f"; {failed} failed" if failed else ""))
+    print(f"  Tracker: {added} application(s) added")
+    print(f"  Gap sync: {n_gaps} gap(s) appended to portfolio/skill-development.yaml")
+
+    # Prompts are read back from the build cache rather than sent from the workers
+    prompts: dict[str, dict[str, list[str]]] = {}
+    for r in completed:
+        for entries in r["build"].values():
+            for name in ("fit-eval", "resume", "cover-letter"):
+                if name in entries:
+                    text = build_cache.load_artifact(name, entries[name]["key"])
+                    if text is not None:
+                        prompts.setdefault(r["role_template"], {}).setdefault(name, []).append(text)
+    if prompts:
+        shared_prefix_report(prompts)
     print(f"  View tracker: python scripts/tracker.py --status")
     print()
+    return records
+
+
+# ---- Main -------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="End-to-end orchestrator: parse → score → generate → track → gap-sync"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--job", help="Path to raw JD text file")
+    source.add_argument(
+        "--jobs-glob",
+        dest="jobs_glob",
+        help="Glob of JD files to evaluate as a batch (never interactive), "
+             "e.g. 'archive/job-desc-*.txt'",
+    )
+    source.add_argument(
+        "--queue",
+        action="store_true",
+        help="Evaluate the JDs queued in output/eval-queue.txt (e.g. by crawl_boards.py) "
+             "as a batch; evaluated JDs are removed from the queue",
+    )
+    parser.add_argument(
+        "--role",
+        choices=list_available_roles(),
+        help="Role template (auto-detected if not specified)",
+    )
+    parser.add_argument(
+        "--company", help="Company name override (default: inferred from filename)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["all", "fit-only", "resume", "skip"],
+        default="all",
+        help="Generation mode: all (default), fit-only, resume, skip (summary only)",
+    )
+    parser.add_argument(
+        "--no-interact",
+        action="store_true",
+        dest="no_interact",
+        help="Skip interactive prompts; proceed with defaults",
+    )
+    parser.add_argument(
+        "--no-artifacts",
+        action="store_true",
+        dest="no_artifacts",
+        help="Keep the parsed JD and scores in memory instead of writing them to archive/",
+    )
+    parser.add_argument(
+        "--output",
+        help="Base output file path (default: output/application-{slug}-{date}.md)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Maximum pipeline stages to run concurrently (default: {DEFAULT_JOBS}; 1 = sequential)",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore the build cache and re-run every stage",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --jobs-glob (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-friendly",
+        action="store_true",
+        dest="cache_friendly",
+        help="Lay prompts out as a static prefix (candidate data, instructions) shared by "
+             "every JD for the role, followed by the job-specific content",
+    )
+    parser.add_argument(
+        "--cache-marker",
+        action="store_true",
+        dest="cache_marker",
+        help="With --cache-friendly, mark the cache breakpoint between prefix and job content",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        dest="max_tokens",
+        help="Compact each prompt's candidate data to fit this many (estimated) tokens; "
+             "with --cache-friendly only in ways every JD shares (no per-JD skill drops)",
+    )
+    parser.add_argument(
+        "--bullet-budget",
+        type=int,
+        nargs="?",
+        const=generate_resume.DEFAULT_BULLET_WORD_BUDGET,
+        dest="bullet_budget",
+        help="Choose resume bullets across all companies to fit this many words "
+             f"(default with no value: {generate_resume.DEFAULT_BULLET_WORD_BUDGET})",
+    )
+    parser.add_argument(
+        "--ranking",
+        choices=generate_resume.RANKINGS,
+        default="tags",
+        help="Score bank bullets/paragraphs by tag overlap (default) or TF-IDF text similarity",
+    )
+    args = parser.parse_args()
+    if args.cache_marker and not args.cache_friendly:
+        parser.error("--cache-marker requires --cache-friendly")
+
+    if args.queue:
+        queued = [ROOT / entry for entry in tracker.load_eval_queue()]
+        missing = [p for p in queued if not p.exists()]
+        for p in missing:
+            print(f"  [!] Queued JD not found, dropped: {p}")
+        if missing:
+            tracker.dequeue_jds(missing)
+        queued = [p for p in queued if p.exists()]
+        if not queued:
+            print(f"Nothing queued in {tracker.EVAL_QUEUE_PATH}")
+            return
+        args.jobs_glob = queued
+
+    if args.jobs_glob:
+        if args.output:
+            parser.error("--output cannot be combined with --jobs-glob or --queue")
+        records = evaluate_batch(
+            args.jobs_glob,
+            args.workers,
+            role=args.role,
+            mode=args.mode,
+            save_artifacts=not args.no_artifacts,
+            rebuild=args.rebuild,
+            cache_friendly=args.cache_friendly,
+            cache_marker=args.cache_marker,
+            max_tokens=args.max_tokens,
+            bullet_budget=args.bullet_budget,
+            ranking=args.ranking,
+        )
+        if args.queue:
+            failed = {r["jd"] for r in records if "error" in r}
+            tracker.dequeue_jds([p for p in args.jobs_glob if p.name not in failed])
+        return
+
+    jd_path = Path(args.job)
+    if not jd_path.exists():
+        print(f"Error: JD file not found: {jd_path}")
+        sys.exit(1)
+
+    evaluate_job(
+        jd_path,
+        role=args.role,
+        company=args.company,
+        mode=args.mode,
+        interactive=not args.no_interact,
+        output=args.output,
+        save_artifacts=not args.no_artifacts,
+        jobs=args.jobs,
+        rebuild=args.rebuild,
+        cache_friendly=args.cache_friendly,
+        cache_marker=args.cache_marker,
+        max_tokens=args.max_tokens,
+        bullet_budget=args.bullet_budget,
+        ranking=args.ranking,
+    )
 
 
 if __name__ == "__main__":
@@ -6,26 +6,68 @@ Replaces the manual copy-paste step. Supports LinkedIn, Lever, Greenhouse,
 Ashby, and most company career pages. Falls back gracefully when JavaScript
 rendering is required.
 
+Greenhouse, Lever and Ashby posting URLs are read from the platforms' public
+JSON job APIs instead of the rendered page: the title, location, department
+and description sections map straight to the archive layout (Company:, Title:
+... then one UPPERCASE: header per section), and the file is named after the
+posting's company and title.
+
 Usage:
     python scripts/fetch_jd.py --url "https://jobs.lever.co/company/abc123"
     python scripts/fetch_jd.py --url "https://..." --company "Merge" --role "Solutions Engineer"
     python scripts/fetch_jd.py --url "https://..." --output archive/job-desc-merge-se.txt
+    python scripts/fetch_jd.py --urls-file job-search/urls.txt --overwrite skip
+    python scripts/fetch_jd.py --urls-file job-search/urls.txt --workers 16 --per-host 4 --host-rate 8
+    python scripts/fetch_jd.py --urls-file job-search/urls.txt --overwrite overwrite   # re-validate
+
+Bulk mode (--urls-file) reads one URL per line, optionally followed by
+", company, role"; blank lines and # comments are skipped. URLs are fetched on
+a thread pool over keep-alive connections pooled per host, with at most
+--per-host requests in flight and --host-rate request starts per second to
+each host. Failed requests (connection errors, 429 and 5xx) are retried with
+exponential backoff. Existing files are handled by --overwrite instead of a
+prompt, and the run ends with a summary table.
+
+Bulk fetches go through an on-disk HTTP cache (.cache/http/, LRU-evicted
+beyond --cache-mb). A posting fetched before is re-requested with
+If-None-Match / If-Modified-Since; a 304, or a 200 whose text matches the
+archive file, leaves the file untouched and is reported as "unchanged".
+Use --overwrite overwrite to re-validate postings already in archive/.
+
+Pages are converted to text in one streaming pass of html.parser (no bs4):
+script, style, nav, footer and page-level header subtrees are dropped, block
+elements become line breaks, list items become "- " bullets, and when the page
+has a main / job-description container only its text is kept.
 
 Requirements:
-    pip install requests beautifulsoup4
-    (bs4 is optional but strongly recommended for cleaner text extraction)
+    pip install requests
+    (optional; falls back to stdlib urllib)
 """
 
 import argparse
+import codecs
+import hashlib
+import html
+import http.client
+import json
+import os
 import re
 import sys
+import threading
+import time
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from html.parser import HTMLParser
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from fileio import atomic_write
 
 ROOT = Path(__file__).resolve().parent.parent
 ARCHIVE_DIR = ROOT / "archive"
+HTTP_CACHE_DIR = ROOT / ".cache" / "http"
 
 # ---- Optional imports -------------------------------------------------------
 try:
@@ -34,12 +76,6 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-
 
 # ---- URL patterns for known ATS platforms -----------------------------------
 ATS_PATTERNS = {
@@ -103,52 +139,191 @@ def fetch_html(url: str, timeout: int = 15) -> str:
             raise RuntimeError(f"urllib fetch failed: {e}")
 
 
-def html_to_text(html: str) -> str:
-    """Convert HTML to clean plain text."""
-    if BS4_AVAILABLE:
-        soup = BeautifulSoup(html, "html.parser")
-        # Remove script and style tags
-        for tag in soup(["script", "style", "nav", "header", "footer", "meta", "noscript"]):
-            tag.decompose()
-
-        # Find main content container (best-effort heuristics)
-        main = (
-            soup.find("main") or
-            soup.find(id=re.compile(r"job|content|description|posting", re.I)) or
-            soup.find(class_=re.compile(r"job|content|description|posting", re.I)) or
-            soup.body or
-            soup
-        )
-
-        text = main.get_text(separator="\n")
+def fetch_page_text(url: str, timeout: int = 15) -> str:
+    """Fetch a page and convert it to text as the response streams in."""
+    if REQUESTS_AVAILABLE:
+        try:
+            with requests.get(url, headers=HEADERS, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                extractor = HTMLTextExtractor(body_charset(response.headers))
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    extractor.feed(chunk)
+                return extractor.close()
+        except requests.RequestException as e:
+            raise RuntimeError(f"requests fetch failed: {e}")
     else:
-        # Naive HTML strip with regex
-        text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"&nbsp;", " ", text)
-        text = re.sub(r"&amp;", "&", text)
-        text = re.sub(r"&lt;", "<", text)
-        text = re.sub(r"&gt;", ">", text)
-        text = re.sub(r"&#\d+;", "", text)
-
-    # Normalize whitespace
-    lines = []
-    for line in text.splitlines():
-        line = line.strip()
-        if line:
-            lines.append(line)
+        req = urllib.request.Request(url, headers=HEADERS)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                extractor = HTMLTextExtractor(body_charset(resp.headers))
+                while chunk := resp.read(CHUNK_SIZE):
+                    extractor.feed(chunk)
+                return extractor.close()
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"urllib fetch failed: {e}")
 
-    text = "\n".join(lines)
 
-    # Remove common boilerplate
-    for pattern in BOILERPLATE_PATTERNS:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
+# ---- HTML to text -----------------------------------------------------------
 
-    # Collapse 3+ blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+CHUNK_SIZE = 64 * 1024
+MIN_REGION_CHARS = 200  # a content container smaller than this is not the posting
 
-    return text.strip()
+BOILERPLATE_RE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+CONTENT_ATTR_RE = re.compile(r"job|content|description|posting", re.IGNORECASE)
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Streaming HTML-to-text: feed() str or bytes chunks as they arrive, then
+    close() returns the text. Keeps only the finished text lines and the open
+    element stack, never a document tree.
+
+    Subtrees of SKIP_TAGS are dropped (header only outside main/article, where
+    it is site chrome rather than the posting's own header). Block elements
+    end the current line and list items start a "- " bullet; entities are
+    decoded by the parser and lines matching BOILERPLATE_PATTERNS are cut as
+    they are finished. Content containers (main, then an id, then a class
+    matching job/content/description/posting) are recorded as line ranges; the
+    first one holding MIN_REGION_CHARS of text becomes the output, otherwise
+    the whole page is.
+    """
+
+    SKIP_TAGS = frozenset("head script style noscript template svg iframe nav footer "
+                          "button select textarea".split())
+    # Raw-text elements html.parser buffers whole until their end tag
+    RAW_TEXT_TAGS = frozenset(("script", "style"))
+    BLOCK_TAGS = frozenset("address article aside blockquote br dd details dialog div dl dt fieldset "
+                           "figcaption figure form h1 h2 h3 h4 h5 h6 header hr li main ol p pre "
+                           "section summary table tbody td tfoot th thead tr ul".split())
+    VOID_TAGS = frozenset("area base br col embed hr img input link meta param source track wbr".split())
+
+    def __init__(self, encoding: str = "utf-8"):
+        super().__init__(convert_charrefs=True)
+        self.decoder = codecs.getincrementaldecoder(_codec(encoding))(errors="replace")
+        self.stack: list[tuple[str, bool, int]] = []  # (tag, skipped, region index or -1)
+        self.skipping = 0
+        self.articles = 0
+        self.raw_tag = ""  # script/style the parser has opened and not yet closed
+        self.raw_tail = ""  # last len(raw_tag)+2 characters of the page, where an end tag may start
+        self.raw_fed = 0  # how many of them (a prefix) the parser has already been given
+        self.parts: list[str] = []
+        self.bullet = False
+        self.lines: list[str] = []
+        self.regions: list[list] = []  # [priority, start line, end line]
+
+    def feed(self, chunk: str | bytes) -> None:
+        if isinstance(chunk, bytes):
+            chunk = self.decoder.decode(chunk)
+        data = chunk
+        if self.raw_tag:
+            # Inside <script>/<style> (as reported by handle_starttag): the body is
+            # skipped anyway, so hand the parser only the text from the next
+            # candidate end tag on and never a megabyte of inline app state. The
+            # tail may hold the start of that end tag, already given to the parser
+            # earlier; what it has already been given is not given twice.
+            data = self.raw_tail + chunk
+            end = data.lower().find(f"</{self.raw_tag}")
+            if end < 0:
+                self.raw_tail = data[-len(self.raw_tag) - 2:]
+                self.raw_fed = max(0, self.raw_fed - (len(data) - len(self.raw_tail)))
+                return
+            chunk = data[max(end, self.raw_fed):]
+        super().feed(chunk)
+        if self.raw_tag:
+            keep = len(self.raw_tag) + 2
+            start = data.lower().rfind(f"</{self.raw_tag}")
+            if start >= 0 and ">" not in data[start:] and not data[start + keep:start + keep + 1].strip("/ \t\n\r\f"):
+                keep = len(data) - start  # the parser may be midway through this end tag: "</script  "
+            self.raw_tail = data[-keep:]
+            self.raw_fed = len(self.raw_tail)
+
+    def close(self) -> str:
+        self.feed(self.decoder.decode(b"", final=True))
+        super().close()
+        self._break()
+        for priority in range(3):
+            for region_priority, start, end in self.regions:
+                if region_priority == priority and \
+                        sum(len(line) for line in self.lines[start:end]) >= MIN_REGION_CHARS:
+                    return "\n".join(self.lines[start:end])
+        return "\n".join(self.lines)
+
+    def _break(self) -> None:
+        """Finish the current line; a pending bullet waits for the first line with text."""
+        if self.parts:
+            line = " ".join("".join(self.parts).split())
+            self.parts = []
+            if line:
+                line = BOILERPLATE_RE.sub("", line).strip()
+            if line:
+                self.lines.append(f"- {line}" if self.bullet else line)
+                self.bullet = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.RAW_TEXT_TAGS:
+            self.raw_tag = tag
+        if tag in self.BLOCK_TAGS:
+            self._break()
+        if tag in self.VOID_TAGS:
+            return
+        skip = tag in self.SKIP_TAGS or (tag == "header" and not self.articles)
+        region = -1
+        if not skip and not self.skipping:
+            if tag == "li":
+                self.bullet = True
+            priority = 0 if tag == "main" else None
+            if priority is None:
+                attrs = dict(attrs)
+                if CONTENT_ATTR_RE.search(attrs.get("id") or ""):
+                    priority = 1
+                elif CONTENT_ATTR_RE.search(attrs.get("class") or ""):
+                    priority = 2
+            if priority is not None:
+                region = len(self.regions)
+                self.regions.append([priority, len(self.lines), None])  # end None: still open
+        self.skipping += skip
+        self.articles += tag in ("main", "article")
+        self.stack.append((tag, skip, region))
+
+    def handle_endtag(self, tag):
+        if tag == self.raw_tag:
+            self.raw_tag = ""
+        if tag in self.BLOCK_TAGS:
+            self._break()
+        if tag == "li":
+            self.bullet = False  # an empty item leaves no bullet pending
+        # Close the nearest open element with this tag, and any left unclosed inside it
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                break
+        else:
+            return
+        while len(self.stack) > i:
+            open_tag, skip, region = self.stack.pop()
+            self.skipping -= skip
+            self.articles -= open_tag in ("main", "article")
+            if region >= 0:
+                self._break()
+                self.regions[region][2] = len(self.lines)
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+
+def _codec(encoding: str) -> str:
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return "utf-8"
+
+
+def html_to_text(html: str | bytes, encoding: str = "utf-8") -> str:
+    """Convert HTML (str, or bytes in `encoding`) to clean plain text."""
+    extractor = HTMLTextExtractor(encoding)
+    for i in range(0, len(html), CHUNK_SIZE):
+        extractor.feed(html[i:i + CHUNK_SIZE])
+    return extractor.close()
 
 
 def infer_company_role_from_url(url: str) -> tuple[str, str]:
@@ -179,15 +354,240 @@ def infer_company_role_from_url(url: str) -> tuple[str, str]:
 
 def build_output_path(company: str, role: str) -> Path:
     """Build the archive/ output path from company and role."""
-    def slugify(s: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
-
     company_slug = slugify(company) if company != "unknown" else "company"
     role_slug = slugify(role) if role != "unknown" else "role"
     filename = f"job-desc-{company_slug}-{role_slug}.txt"
     return ARCHIVE_DIR / filename
 
 
+def slugify(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
+
+
+def warn_if_short(text: str) -> None:
+    if len(text) < 200:
+        print(
+            f"\n  [!] Fetched content is very short ({len(text)} chars). "
+            "The page may require JavaScript rendering.\n"
+            "  Consider manually saving the job description to archive/."
+        )
+
+
+# ---- ATS job APIs -----------------------------------------------------------
+
+# Public, unauthenticated endpoints; module-level so they can point at a stand-in server
+GREENHOUSE_API = "https://boards-api.greenhouse.io"
+LEVER_API = "https://api.lever.co"
+ASHBY_API = "https://api.ashbyhq.com"
+
+# Posting URLs with a JSON API: (board token, posting id)
+ATS_POSTING_PATTERNS = {
+    "greenhouse": re.compile(r"greenhouse\.io/(?:embed/job_app\?for=)?([\w.-]+)/jobs/(\d+)", re.IGNORECASE),
+    "lever":      re.compile(r"jobs\.lever\.co/([\w.-]+)/([0-9a-f-]{36})", re.IGNORECASE),
+    "ashby":      re.compile(r"jobs\.ashbyhq\.com/([^/?#]+)/([0-9a-f-]{36})", re.IGNORECASE),
+}
+
+
+def ats_posting(url: str) -> tuple[str, str, str] | None:
+    """(platform, board, posting id) for a Greenhouse, Lever or Ashby posting URL, else None."""
+    for platform, pattern in ATS_POSTING_PATTERNS.items():
+        m = pattern.search(url)
+        if m:
+            return platform, m.group(1), m.group(2)
+    return None
+
+
+def ats_api_url(platform: str, board: str, job_id: str = "") -> str:
+    """API URL for one posting, or for the whole board when job_id is empty."""
+    if platform == "greenhouse":
+        return f"{GREENHOUSE_API}/v1/boards/{board}/jobs/{job_id}" if job_id \
+            else f"{GREENHOUSE_API}/v1/boards/{board}/jobs?content=true"
+    if platform == "lever":
+        return f"{LEVER_API}/v0/postings/{board}/{job_id}" if job_id \
+            else f"{LEVER_API}/v0/postings/{board}?mode=json"
+    if platform == "ashby":
+        # Ashby has no per-posting endpoint; the board payload carries every description
+        return f"{ASHBY_API}/posting-api/job-board/{board}?includeCompensation=true"
+    raise ValueError(f"no job API for platform: {platform}")
+
+
+class _FragmentParser(HTMLParser):
+    """
+    Flatten a job description HTML fragment into (kind, text) blocks, kind
+    being "heading", "item" (a list item) or "para". A short block whose text
+    is all bold (<p><strong>Requirements</strong></p>) counts as a heading.
+    """
+
+    BLOCK_TAGS = frozenset("p div br li ul ol h1 h2 h3 h4 h5 h6 section blockquote tr table hr".split())
+    BOLD_TAGS = frozenset(("strong", "b"))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[tuple[str, str]] = []
+        self.parts: list[str] = []
+        self.kind = "para"
+        self.bold = 0
+        self.items = 0      # open <li> elements; blocks inside one stay list items
+        self.plain = False  # non-bold text seen in the current block
+
+    def flush(self) -> None:
+        text = " ".join("".join(self.parts).split())
+        if text:
+            kind = self.kind
+            if kind == "para" and not self.plain and len(text) < 80:
+                kind = "heading"
+            self.blocks.append((kind, text))
+        self.parts, self.plain = [], False
+        self.kind = "item" if self.items else "para"
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self.flush()
+            if tag == "li":
+                self.items += 1
+                self.kind = "item"
+            elif tag[0] == "h" and tag[1:].isdigit():
+                self.kind = "heading"
+        elif tag in self.BOLD_TAGS:
+            self.bold += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.BLOCK_TAGS:
+            if tag == "li":
+                self.items = max(0, self.items - 1)
+                self.kind = "item"  # the item's own text, flushed below
+            self.flush()
+        elif tag in self.BOLD_TAGS:
+            self.bold = max(0, self.bold - 1)
+
+    def handle_data(self, data):
+        self.parts.append(data)
+        if not self.bold and data.strip():
+            self.plain = True
+
+
+def html_blocks(fragment: str) -> list[tuple[str, str]]:
+    parser = _FragmentParser()
+    parser.feed(fragment or "")
+    parser.close()
+    parser.flush()
+    return parser.blocks
+
+
+def blocks_to_sections(blocks: list[tuple[str, str]], sections: list | None = None) -> list[tuple[str, list[str]]]:
+    """Group blocks under their headings; text before the first heading goes under ''."""
+    sections = sections if sections is not None else []
+    for kind, text in blocks:
+        if kind == "heading":
+            sections.append((text.rstrip(":").strip(), []))
+            continue
+        if not sections:
+            sections.append(("", []))
+        sections[-1][1].append(f"- {text}" if kind == "item" else text)
+    return sections
+
+
+def board_company(board: str) -> str:
+    return board.replace("-", " ").replace("_", " ").title()
+
+
+def _greenhouse_posting(job: dict, board: str) -> dict:
+    # Greenhouse returns the description HTML entity-escaped
+    sections = blocks_to_sections(html_blocks(html.unescape(job.get("content") or "")))
+    return {
+        "platform": "greenhouse",
+        "id": str(job.get("id", "")),
+        "company": job.get("company_name") or board_company(board),
+        "role": (job.get("title") or "").strip(),
+        "location": (job.get("location") or {}).get("name", ""),
+        "department": ", ".join(d.get("name", "") for d in job.get("departments") or []),
+        "employment": "",
+        "salary": "",
+        "url": job.get("absolute_url") or "",
+        "updated": job.get("updated_at") or "",
+        "sections": sections,
+    }
+
+
+def _lever_posting(post: dict, board: str) -> dict:
+    categories = post.get("categories") or {}
+    sections = blocks_to_sections(html_blocks(post.get("description") or ""))
+    for entry in post.get("lists") or []:
+        sections.append(((entry.get("text") or "").rstrip(":").strip(), []))
+        blocks_to_sections(html_blocks(entry.get("content") or ""), sections)
+    blocks_to_sections(html_blocks(post.get("additional") or ""), sections)
+    pay = post.get("salaryRange") or {}
+    salary = ""
+    if pay.get("min") and pay.get("max"):
+        salary = f"{pay.get('currency', '')} {pay['min']:,}-{pay['max']:,} {pay.get('interval', '')}".strip()
+    return {
+        "platform": "lever",
+        "id": str(post.get("id", "")),
+        "company": board_company(board),
+        "role": (post.get("text") or "").strip(),
+        "location": categories.get("location", ""),
+        "department": " / ".join(v for v in (categories.get("department"), categories.get("team")) if v),
+        "employment": categories.get("commitment", ""),
+        "salary": salary,
+        "url": post.get("hostedUrl") or "",
+        "updated": str(post.get("createdAt", "")),
+        "sections": sections,
+    }
+
+
+def _ashby_posting(job: dict, board: str) -> dict:
+    compensation = job.get("compensation") or {}
+    return {
+        "platform": "ashby",
+        "id": str(job.get("id", "")),
+        "company": board_company(board),
+        "role": (job.get("title") or "").strip(),
+        "location": job.get("location") or "",
+        "department": " / ".join(v for v in (job.get("department"), job.get("team")) if v),
+        "employment": job.get("employmentType") or "",
+        "salary": compensation.get("compensationTierSummary") or "",
+        "url": job.get("jobUrl") or "",
+        "updated": job.get("publishedAt") or "",
+        "sections": blocks_to_sections(html_blocks(job.get("descriptionHtml") or "")),
+    }
+
+
+def ats_postings(platform: str, board: str, data) -> list[dict]:
+    """Every posting in a decoded API payload (one posting or a whole board), as posting dicts."""
+    if platform == "greenhouse":
+        return [_greenhouse_posting(j, board) for j in (data.get("jobs", [data]) if isinstance(data, dict) else [])]
+    if platform == "lever":
+        return [_lever_posting(p, board) for p in (data if isinstance(data, list) else [data])]
+    if platform == "ashby":
+        return [_ashby_posting(j, board) for j in data.get("jobs", [])]
+    raise ValueError(f"no job API for platform: {platform}")
+
+
+def ats_extract(platform: str, board: str, job_id: str, data) -> dict:
+    """The posting with job_id from an API payload. Raises LookupError if it is not there."""
+    for posting in ats_postings(platform, board, data):
+        if posting["id"] == job_id:
+            return posting
+    raise LookupError(f"posting {job_id} not on {platform} board {board!r}")
+
+
+def posting_to_text(posting: dict) -> str:
+    """Render a posting in the archive layout: header fields, then one UPPERCASE: header per section."""
+    lines = [f"Company: {posting['company']}", f"Title: {posting['role']}"]
+    for label, key in (("Location", "location"), ("Department", "department"),
+                       ("Employment", "employment"), ("Salary", "salary"), ("External URL", "url")):
+        if posting.get(key):
+            lines.append(f"{label}: {posting[key]}")
+    for heading, body in posting["sections"]:
+        if not body and not heading:
+            continue
+        lines.append("")
+        if heading:
+            lines.append(f"{heading.upper()}:")
+        lines.extend(body)
+    return "\n".join(lines)
+
+
 def fetch_jd(
     url: str,
     company: str | None = None,
@@ -209,23 +609,29 @@ def fetch_jd(
             "  Then run: python scripts/jd_parser.py --job archive/job-desc-{company}-{role}.txt\n"
         )
 
-    print(f"  Fetching: {url}")
+    api = ats_posting(url)
+    fetch_url = ats_api_url(*api) if api else url
+    print(f"  Fetching: {fetch_url}")
     try:
-        html = fetch_html(url, timeout)
+        if api:
+            payload = fetch_html(fetch_url, timeout)
+        else:
+            text = fetch_page_text(fetch_url, timeout)
     except RuntimeError as e:
         # Try install hint
         if "requests" in str(e) and not REQUESTS_AVAILABLE:
-            print(f"  [!] Install requests for better fetching: pip install requests beautifulsoup4")
+            print(f"  [!] Install requests for better fetching: pip install requests")
         raise
 
-    text = html_to_text(html)
-
-    if len(text) < 200:
-        print(
-            f"\n  [!] Fetched content is very short ({len(text)} chars). "
-            "The page may require JavaScript rendering.\n"
-            "  Consider manually saving the job description to archive/."
-        )
+    if api:
+        try:
+            posting = ats_extract(*api, json.loads(payload))
+        except (ValueError, LookupError) as e:
+            raise RuntimeError(f"{api[0]} API: {e}")
+        text = posting_to_text(posting)
+        company = company or posting["company"]
+        role = role or posting["role"]
+    warn_if_short(text)
 
     # Determine company and role
     if not company or not role:
@@ -250,20 +656,533 @@ def fetch_jd(
     return output_path
 
 
+# ---- Bulk fetching ----------------------------------------------------------
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 2          # requests in flight per host
+DEFAULT_HOST_RATE = 4.0       # request starts per second per host
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF = 0.5           # seconds, doubled per attempt
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_REDIRECTS = 5
+OVERWRITE_POLICIES = ("skip", "overwrite", "rename")
+
+
+class FetchError(RuntimeError):
+    """A bulk fetch that failed after its retries; status is the last HTTP status, if any."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class HostPool:
+    """
+    Keep-alive http.client connections to one scheme://host, reused across
+    requests. At most `size` requests are in flight at once and request starts
+    are spaced at least 1/rate seconds apart.
+    """
+
+    def __init__(self, scheme: str, netloc: str, size: int, rate: float, timeout: float):
+        self.scheme, self.netloc, self.timeout = scheme, netloc, timeout
+        self.slots = threading.BoundedSemaphore(size)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.idle: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+        self.opened = 0
+        self.requests = 0
+        self.received = 0
+
+    def _wait_turn(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self.lock:
+            if self.idle:
+                return self.idle.pop(), True
+            self.opened += 1
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.netloc, timeout=self.timeout), False
+
+    def request(self, path: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """GET path; returns (status, lowercased headers, body)."""
+        with self.slots:
+            self._wait_turn()
+            conn, reused = self._checkout()
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry once on a fresh one
+                conn, _ = self._checkout()
+                try:
+                    conn.request("GET", path, headers=headers)
+                    resp = conn.getresponse()
+                    body = resp.read()
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    raise
+            with self.lock:
+                self.requests += 1
+                self.received += len(body)
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self.idle.append(conn)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, body
+
+    def close(self) -> None:
+        with self.lock:
+            for conn in self.idle:
+                conn.close()
+            self.idle.clear()
+
+
+class Fetcher:
+    """
+    Thread-safe HTTP GET client for bulk fetching: one HostPool per host,
+    redirects followed across hosts, retries with exponential backoff on
+    connection errors and on 429/5xx (honouring a numeric Retry-After).
+    """
+
+    def __init__(self, timeout: float = 15, per_host: int = DEFAULT_PER_HOST,
+                 host_rate: float = DEFAULT_HOST_RATE, retries: int = DEFAULT_RETRIES,
+                 backoff: float = RETRY_BACKOFF):
+        self.timeout, self.per_host, self.host_rate = timeout, per_host, host_rate
+        self.retries, self.backoff = retries, backoff
+        self.pools: dict[tuple[str, str], HostPool] = {}
+        self.memo: dict[str, list] = {}
+        self.lock = threading.Lock()
+
+    def pool(self, scheme: str, netloc: str) -> HostPool:
+        with self.lock:
+            pool = self.pools.get((scheme, netloc))
+            if pool is None:
+                pool = self.pools[(scheme, netloc)] = HostPool(
+                    scheme, netloc, self.per_host, self.host_rate, self.timeout)
+            return pool
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes, int]:
+        """GET url following redirects; returns (status, headers, body, attempts). Raises FetchError."""
+        request_headers = dict(HEADERS, **(headers or {}))
+        attempts = 0
+        for redirect in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise FetchError(f"unsupported URL scheme: {url}")
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            pool = self.pool(parts.scheme, parts.netloc)
+            for attempt in range(self.retries + 1):
+                attempts += 1
+                status, error, delay = None, None, self.backoff * 2 ** attempt
+                try:
+                    status, resp_headers, body = pool.request(path, request_headers)
+                except (OSError, http.client.HTTPException) as e:
+                    error = f"{type(e).__name__}: {e}"
+                if status is not None and status not in RETRY_STATUSES:
+                    break
+                if status is not None:
+                    error = f"HTTP {status}"
+                    retry_after = resp_headers.get("retry-after", "")
+                    if retry_after.isdigit():
+                        delay = max(delay, float(retry_after))
+                if attempt == self.retries:
+                    raise FetchError(f"{error} after {attempts} attempt(s)", status)
+                time.sleep(delay)
+            if status in (301, 302, 303, 307, 308):
+                if not resp_headers.get("location"):  # nowhere to go; the body is not the page
+                    raise FetchError(f"HTTP {status} without Location", status)
+                url = urljoin(url, resp_headers["location"])
+                continue
+            return status, resp_headers, body, attempts
+        raise FetchError(f"more than {MAX_REDIRECTS} redirects")
+
+    def get_once(self, url: str, headers: dict[str, str] | None = None) -> tuple[int, dict[str, str], bytes, int]:
+        """get() memoized for the life of this fetcher, so postings sharing a board payload fetch it once."""
+        with self.lock:
+            entry = self.memo.setdefault(url, [threading.Lock(), None])
+        with entry[0]:
+            if entry[1] is None:
+                entry[1] = self.get(url, headers)
+                return entry[1]
+        status, resp_headers, body, _ = entry[1]
+        return status, resp_headers, body, 0
+
+    def stats(self) -> tuple[int, int, int]:
+        """(connections opened, requests sent, body bytes received) across all hosts."""
+        return (sum(p.opened for p in self.pools.values()),
+                sum(p.requests for p in self.pools.values()),
+                sum(p.received for p in self.pools.values()))
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            pool.close()
+
+
+# ---- HTTP cache -------------------------------------------------------------
+
+DEFAULT_CACHE_MB = 100
+HTTP_CACHE_VERSION = 1
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|gh_src|gh_jid_src|lever-source|lever-origin|source|ref|src)$",
+                             re.IGNORECASE)
+
+
+def canonical_url(url: str) -> str:
+    """The cache identity of a URL: lowercase scheme/host, no fragment or tracking params, sorted query."""
+    parts = urlsplit(url.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not TRACKING_PARAMS.match(k))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+
+class HttpCache:
+    """
+    On-disk cache of response bodies and validators (ETag, Last-Modified) per
+    canonical URL: {key}.json holds the metadata and {key}.body the body.
+    Entries are touched when used; once the bodies exceed max_bytes the least
+    recently used entries are evicted. Safe to share between threads. A
+    read_only cache serves lookups and bodies but never stores or touches.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = DEFAULT_CACHE_MB * 2 ** 20,
+                 read_only: bool = False):
+        self.dir = directory or HTTP_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+        self.lock = threading.Lock()
+        self.total: int | None = None  # body bytes on disk, counted on first store
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()[:24]
+        return self.dir / f"{key}.json", self.dir / f"{key}.body"
+
+    def lookup(self, url: str) -> dict | None:
+        """Metadata of the cached response for url, or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != HTTP_CACHE_VERSION or not body_path.exists():
+            return None
+        return meta
+
+    def conditional_headers(self, meta: dict) -> dict[str, str]:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def body(self, url: str) -> bytes | None:
+        """The cached body for url, marking the entry as recently used."""
+        meta_path, body_path = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+            if not self.read_only:
+                os.utime(meta_path)
+        except OSError:
+            return None
+        return body
+
+    def store(self, url: str, headers: dict[str, str], body: bytes) -> bool:
+        """Cache a 200 response that carries a validator; returns whether it was stored."""
+        if self.read_only or not (headers.get("etag") or headers.get("last-modified")):
+            return False
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "version": HTTP_CACHE_VERSION,
+            "url": canonical_url(url),
+            "etag": headers.get("etag", ""),
+            "last_modified": headers.get("last-modified", ""),
+            "content_type": headers.get("content-type", ""),
+            "size": len(body),
+        }
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            if self.total is None:
+                self.total = sum(p.stat().st_size for p in self.dir.glob("*.body"))
+            try:
+                self.total -= body_path.stat().st_size
+            except FileNotFoundError:
+                pass
+            atomic_write(body_path, body)
+            atomic_write(meta_path, json.dumps(meta))
+            self.total += len(body)
+            if self.total > self.max_bytes:
+                self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the bodies fit in max_bytes."""
+        entries = []
+        for meta_path in self.dir.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                entries.append((meta_path.stat().st_mtime_ns, meta_path, body_path, body_path.stat().st_size))
+            except FileNotFoundError:
+                continue
+        self.total = sum(size for *_, size in entries)
+        for _, meta_path, body_path, size in sorted(entries, key=lambda e: e[0]):
+            if self.total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            self.total -= size
+
+
+def body_charset(headers) -> str:
+    """Charset from a Content-Type header (any mapping with .get), defaulting to utf-8."""
+    m = re.search(r"charset=([\w-]+)", headers.get("content-type") or headers.get("Content-Type") or "",
+                  re.IGNORECASE)
+    return m.group(1) if m else "utf-8"
+
+
+def decode_body(body: bytes, headers: dict[str, str]) -> str:
+    try:
+        return body.decode(body_charset(headers), errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def read_urls_file(path: Path) -> list[tuple[str, str | None, str | None]]:
+    """Parse a --urls-file: 'url[, company[, role]]' per line; blanks and # comments skipped."""
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = [f.strip() for f in line.split(",", 2)]
+        fields += [""] * (3 - len(fields))
+        entries.append((fields[0], fields[1] or None, fields[2] or None))
+    return entries
+
+
+def bulk_output_path(url: str, company: str | None, role: str | None) -> Path:
+    """
+    Output path for a bulk fetch. Without a role, the posting id (last URL
+    path segment) stands in for it so postings from one board do not collide.
+    """
+    inferred_company, _ = infer_company_role_from_url(url)
+    company = company or inferred_company
+    if not role:
+        segment = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+        role = segment or "unknown"
+    return build_output_path(company, role)
+
+
+class _PathClaims:
+    """Output paths claimed by this run, so concurrent fetches never share a file."""
+
+    def __init__(self):
+        self.claimed: set[Path] = set()
+        self.lock = threading.Lock()
+
+    def claim(self, path: Path, overwrite: str) -> tuple[Path | None, str]:
+        """Return (path to write or None, note) under the overwrite policy."""
+        with self.lock:
+            if path in self.claimed:
+                if overwrite != "rename":
+                    return None, "duplicate output path in this run"
+            elif not path.exists() or overwrite == "overwrite":
+                self.claimed.add(path)
+                return path, ""
+            elif overwrite == "skip":
+                return None, "exists"
+            n = 2
+            while (candidate := path.with_name(f"{path.stem}-{n}{path.suffix}")) in self.claimed \
+                    or candidate.exists():
+                n += 1
+            self.claimed.add(candidate)
+            return candidate, "renamed"
+
+
+def conditional_get(fetcher: Fetcher, cache: HttpCache | None, url: str,
+                    get=None) -> tuple[int, dict[str, str], bytes, int, bool]:
+    """
+    GET url (with fetcher.get, or `get`), conditionally on the cached
+    validators when a cache is given. Returns (status, headers, body,
+    attempts, not_modified); after a 304 the body comes from the cache.
+    """
+    get = get or fetcher.get
+    cached = cache.lookup(url) if cache else None
+    status, headers, body, attempts = get(url, cache.conditional_headers(cached) if cached else None)
+    if status == 304 and cached:
+        body = cache.body(url)
+        if body is not None:
+            return status, {"content-type": cached["content_type"]}, body, attempts, True
+        # Evicted meanwhile; fetch it again in full
+        status, headers, body, more = fetcher.get(url)
+        attempts += more
+    if cache and status == 200 and attempts:  # attempts == 0: a memoized payload, already stored
+        cache.store(url, headers, body)
+    return status, headers, body, attempts, False
+
+
+def fetch_one(fetcher: Fetcher, claims: _PathClaims, url: str, company: str | None,
+              role: str | None, overwrite: str, cache: HttpCache | None = None) -> dict:
+    """
+    Fetch and save one URL of a bulk run; never raises. Returns a summary row.
+    With a cache, the request is conditional on the cached validators; a 304
+    or unchanged text leaves an existing archive file untouched.
+    """
+    start = time.perf_counter()
+    result = {"url": url, "host": urlsplit(url).netloc, "status": "failed", "http": None,
+              "attempts": 0, "chars": 0, "path": None, "note": ""}
+    try:
+        api = ats_posting(url)
+        # An API posting is named after its title, known only once fetched (unless --role is given)
+        path = bulk_output_path(url, company, role) if not api or role else None
+        if overwrite == "skip" and path and path.exists():
+            # Decided before fetching, so re-runs cost nothing for known postings
+            result.update(status="skipped", path=path, note="exists")
+            return result
+        fetch_url = ats_api_url(*api) if api else url
+        status, headers, body, attempts, not_modified = conditional_get(
+            fetcher, cache, fetch_url, fetcher.get_once if api else fetcher.get)
+        if not_modified and path and path.exists():
+            result.update(status="unchanged", http=status, attempts=attempts, path=path,
+                          note="304 not modified")
+            return result
+        result.update(http=status, attempts=attempts)
+        if status >= 400:
+            result["note"] = f"HTTP {status}"
+            return result
+        if api:
+            posting = ats_extract(*api, json.loads(decode_body(body, headers)))
+            text = posting_to_text(posting)
+            path = path or build_output_path(company or posting["company"], posting["role"] or api[2])
+        else:
+            text = html_to_text(body, body_charset(headers))
+        if path.exists() and overwrite != "skip" and path.read_text(encoding="utf-8") == text:
+            result.update(status="unchanged", path=path, chars=len(text), note="same text")
+            return result
+        target, note = claims.claim(path, overwrite)
+        if target is None:
+            result.update(status="skipped", path=path, note=note)
+            return result
+        ARCHIVE_DIR.mkdir(exist_ok=True)
+        target.write_text(text, encoding="utf-8")
+        result.update(status="saved", path=target, chars=len(text),
+                      note=note or ("short — may need JS rendering" if len(text) < 200 else ""))
+    except FetchError as e:
+        result.update(http=e.status, note=str(e))
+    except Exception as e:
+        result["note"] = f"{type(e).__name__}: {e}"
+    finally:
+        result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def fetch_many(
+    entries: list[tuple[str, str | None, str | None]],
+    workers: int = DEFAULT_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    host_rate: float = DEFAULT_HOST_RATE,
+    retries: int = DEFAULT_RETRIES,
+    overwrite: str = "skip",
+    timeout: float = 15,
+    cache: HttpCache | None = None,
+) -> tuple[list[dict], tuple[int, int, int]]:
+    """
+    Fetch many (url, company, role) entries concurrently and save each to
+    archive/. Returns the summary rows in input order and (connections
+    opened, requests sent, body bytes received).
+    """
+    fetcher = Fetcher(timeout, per_host, host_rate, retries)
+    claims = _PathClaims()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(
+                lambda e: fetch_one(fetcher, claims, e[0], e[1], e[2], overwrite, cache), entries))
+    finally:
+        fetcher.close()
+    return results, fetcher.stats()
+
+
+def print_fetch_summary(results: list[dict], stats: tuple[int, int, int], elapsed: float) -> None:
+    print()
+    print(f"  {'Status':<8} {'HTTP':>4} {'Tries':>5} {'Time':>7} {'Chars':>8}  {'Host':<24} Output / note")
+    print(f"  {'-' * 100}")
+    for r in results:
+        target = r["path"].name if r["path"] else r["url"]
+        note = f"  ({r['note']})" if r["note"] else ""
+        print(f"  {r['status']:<8} {r['http'] or '-':>4} {r['attempts']:>5} {r['seconds']:>6.2f}s "
+              f"{r['chars']:>8,}  {r['host'][:24]:<24} {target}{note}")
+    counts = {s: sum(1 for r in results if r["status"] == s)
+              for s in ("saved", "unchanged", "skipped", "failed")}
+    opened, sent, received = stats
+    print(f"  {'-' * 100}")
+    print(f"  {len(results)} URL(s) in {elapsed:.2f}s: {counts['saved']} saved, "
+          f"{counts['unchanged']} unchanged, {counts['skipped']} skipped, {counts['failed']} failed  "
+          f"({sent} request(s) over {opened} connection(s), {received / 1024:,.0f} KB)")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fetch a job posting URL and save to archive/"
     )
-    parser.add_argument("--url", required=True, help="Job posting URL")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--url", help="Job posting URL")
+    source.add_argument("--urls-file", dest="urls_file",
+                        help="File of job posting URLs to fetch concurrently (see module docstring)")
     parser.add_argument("--company", help="Company name (overrides URL inference)")
     parser.add_argument("--role", help="Role name (overrides URL inference)")
     parser.add_argument("--output", help="Output file path (default: archive/job-desc-{company}-{role}.txt)")
     parser.add_argument("--timeout", type=int, default=15, help="HTTP timeout in seconds (default: 15)")
+
+    bulk = parser.add_argument_group("bulk mode (--urls-file)")
+    bulk.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                      help=f"Concurrent fetches (default: {DEFAULT_WORKERS})")
+    bulk.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, dest="per_host",
+                      help=f"Max requests in flight per host (default: {DEFAULT_PER_HOST})")
+    bulk.add_argument("--host-rate", type=float, default=DEFAULT_HOST_RATE, dest="host_rate",
+                      help=f"Max request starts per second per host (default: {DEFAULT_HOST_RATE:g})")
+    bulk.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                      help=f"Retries per URL on connection errors, 429 and 5xx (default: {DEFAULT_RETRIES})")
+    bulk.add_argument("--overwrite", choices=OVERWRITE_POLICIES, default="skip",
+                      help="Existing archive files: skip (default; not fetched), overwrite, "
+                           "or rename (save as -2, -3, ...)")
+    bulk.add_argument("--cache-mb", type=float, default=DEFAULT_CACHE_MB, dest="cache_mb",
+                      help=f"Size cap of the HTTP cache in .cache/http/ (default: {DEFAULT_CACHE_MB})")
+    bulk.add_argument("--no-cache", action="store_true", dest="no_cache",
+                      help="Fetch without the HTTP cache (no conditional requests)")
     args = parser.parse_args()
 
+    if args.urls_file:
+        entries = read_urls_file(Path(args.urls_file))
+        if not entries:
+            print(f"  [!] No URLs in {args.urls_file}")
+            sys.exit(1)
+        print(f"  Fetching {len(entries)} URL(s) with {args.workers} worker(s), "
+              f"{args.per_host} per host, {args.host_rate:g} req/s per host")
+        start = time.perf_counter()
+        cache = None if args.no_cache else HttpCache(max_bytes=int(args.cache_mb * 2 ** 20))
+        results, stats = fetch_many(entries, args.workers, args.per_host, args.host_rate,
+                                    args.retries, args.overwrite, args.timeout, cache)
+        print_fetch_summary(results, stats, time.perf_counter() - start)
+        saved = [r["path"] for r in results if r["status"] == "saved"]
+        if saved:
+            print(f"\nNext step: python scripts/evaluate.py --jobs-glob \"archive/job-desc-*.txt\" --no-interact")
+        sys.exit(1 if any(r["status"] == "failed" for r in results) else 0)
+
     if not REQUESTS_AVAILABLE:
         print("  [!] 'requests' not installed. Falling back to stdlib urllib (less reliable).")
-        print("  Install for better results: pip install requests beautifulsoup4\n")
+        print("  Install for better results: pip install requests\n")
 
     output_path = Path(args.output) if args.output else None
 
@@ -0,0 +1,72 @@
+"""
+File I/O — the atomic write and file lock shared by the pipeline scripts.
+
+Caches, manifests, sidecars and YAML stores are all written the same way: to a
+temp file in the target's directory, then os.replace'd over the target, so a
+reader sees either the old or the new file, never a partial one. The temp name
+carries the process id and the thread id, because the same file can be written
+concurrently by worker processes (evaluate.py --jobs-glob) and by the stage
+threads of one process (evaluate.py --jobs, fetch and crawl pools).
+
+A read-modify-write of a shared file (tracker.yaml, skill-development.yaml,
+the build manifest) holds file_lock so concurrent writers merge rather than
+overwrite each other.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False  # e.g. Windows: locked_update falls back to optimistic retries
+
+LOCK_TIMEOUT = 30.0
+
+
+def atomic_write(path: Path, data: str | bytes, fsync: bool = False) -> None:
+    """Replace path with data (str is written as UTF-8); fsync before the rename if asked."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT):
+    """
+    Hold an exclusive fcntl lock on {path}.lock, retrying with backoff until
+    timeout (TimeoutError). A no-op without fcntl.
+    """
+    if not FCNTL_AVAILABLE:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f"{path.name}.lock"), "a") as lock_file:
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not lock {path} within {timeout:.0f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.25)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -45,9 +45,38 @@ Usage:
         --role solutions-engineer \\
         --mode cover-letter \\
         --fit-eval output/application-hibob-2026-02-20.md
+
+    # Prefix-cache-friendly layout (static prefix first, job content last):
+    python scripts/generate_resume.py \\
+        --job archive/job-desc-hibob.txt \\
+        --role solutions-engineer \\
+        --cache-friendly --cache-marker
+
+    # Compact the candidate data to fit a token budget:
+    python scripts/generate_resume.py \\
+        --job archive/job-desc-hibob.txt \\
+        --role solutions-engineer \\
+        --pre-scores archive/jd-scores-hibob-2026-02-20.yaml \\
+        --max-tokens 12000
+
+    # Bullets chosen to fit a one-page budget rather than top 5 per company:
+    python scripts/generate_resume.py \\
+        --job archive/job-desc-hibob.txt \\
+        --role solutions-engineer \\
+        --bullet-bank --bullet-budget 400
+
+    # Rank bank bullets/paragraphs by TF-IDF similarity to the JD text:
+    python scripts/generate_resume.py \\
+        --job archive/job-desc-hibob.txt \\
+        --role solutions-engineer \\
+        --bullet-bank --ranking tfidf
 """
 
 import argparse
+import hashlib
+import heapq
+import pickle
+import re
 import sys
 from datetime import date
 from pathlib import Path
@@ -58,6 +87,9 @@ except ImportError:
     print("PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+import bank_vectors
+from fileio import atomic_write
+
 
 ROOT = Path(__file__).resolve().parent.parent
 
@@ -68,6 +100,13 @@ FIT_EVAL_STRUCTURE_PATH = ROOT / "templates" / "fit-evaluation-structure.yaml"
 COVER_LETTER_STRUCTURE_PATH = ROOT / "templates" / "cover-letter-structure.yaml"
 STRUCTURES_DIR = ROOT / "templates" / "structures"
 OUTPUT_DIR = ROOT / "output"
+CACHE_DIR = ROOT / ".cache"
+CANDIDATE_DATA_VERSION = 1
+
+# Used by the --cache-friendly layout: the job section header ends the static
+# prefix, and the optional marker flags the cache breakpoint just before it.
+JOB_SECTION_HEADER = "## JOB-SPECIFIC INPUT"
+CACHE_BREAKPOINT_MARKER = "<!-- CACHE BREAKPOINT -->"
 
 # Default content bank paths (used when --bullet-bank / --paragraph-bank not specified)
 DEFAULT_BULLET_BANK = ROOT / "portfolio" / "bullet-bank.yaml"
@@ -178,44 +217,194 @@ def _slug(text: str) -> str:
     return re.sub(r"[^a-z0-9 ]+", " ", text.lower()).strip()
 
 
+def _substrings(text: str, max_len: int | None = None) -> set[str]:
+    """Every substring of text (including ''), optionally capped at max_len characters."""
+    n = len(text)
+    cap = n if max_len is None else max_len
+    return {text[i:j] for i in range(n + 1) for j in range(i, min(n, i + cap) + 1)}
+
+
+class TagIndex:
+    """
+    Inverted index over the tags and clusters of content bank entries.
+
+    Scores entries against JD keywords the way the original per-entry scan
+    did — a tag or cluster t hits when any keyword kw has `t in kw or kw in t`,
+    tag hits weigh 2, cluster hits 1.5, plus a role bonus of 2 — but only
+    touches the entries that carry a matching term. Each distinct term is
+    matched against a keyword once, not once per entry: terms inside the
+    keyword are found by looking its substrings up, terms containing it
+    through a trigram index, and the result is remembered per keyword.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self.terms: dict[str, int] = {}
+        self.postings: list[list[tuple[int, float]]] = []
+        self.roles: list[list[str]] = []
+        self.entry_tags: list[tuple[int, ...]] = []  # distinct tag (not cluster) ids per entry
+        term_ids: dict[str, int] = {}  # raw tag -> term id; banks repeat tags a lot
+        for i, entry in enumerate(entries):
+            for weight, values in ((2, entry.get("tags")), (1.5, entry.get("clusters"))):
+                for value in values or []:
+                    term_id = term_ids.get(value)
+                    if term_id is None:
+                        term_id = term_ids[value] = self.terms.setdefault(_slug(value), len(self.terms))
+                    if term_id == len(self.postings):
+                        self.postings.append([])
+                    self.postings[term_id].append((i, weight))
+            self.roles.append(entry.get("applicable_roles") or [])
+            self.entry_tags.append(tuple(dict.fromkeys(term_ids[t] for t in entry.get("tags") or [])))
+
+        self.term_list = list(self.terms)
+        self.max_term_len = max(map(len, self.term_list), default=0)
+        self.trigrams: dict[str, set[int]] = {}
+        for term_id, term in enumerate(self.term_list):
+            for i in range(len(term) - 2):
+                self.trigrams.setdefault(term[i:i + 3], set()).add(term_id)
+        self._keyword_terms: dict[str, frozenset[int]] = {}
+        self._role_bonus: dict[str, list[float]] = {}
+
+    def keyword_terms(self, kw: str) -> frozenset[int]:
+        """Ids of the terms t with `t in kw or kw in t`."""
+        hit = self._keyword_terms.get(kw)
+        if hit is None:
+            # Terms containing kw: candidates share all of kw's trigrams
+            if len(kw) < 3:
+                candidates = range(len(self.term_list))
+            else:
+                grams = sorted((self.trigrams.get(kw[i:i + 3], set()) for i in range(len(kw) - 2)),
+                               key=len)
+                candidates = set.intersection(*grams)
+            ids = {t for t in candidates if kw in self.term_list[t]}
+            # Terms inside kw
+            for sub in _substrings(kw, self.max_term_len):
+                term_id = self.terms.get(sub)
+                if term_id is not None:
+                    ids.add(term_id)
+            hit = self._keyword_terms[kw] = frozenset(ids)
+        return hit
+
+    def role_bonus(self, role: str) -> list[float]:
+        """2 for each entry marked for role (or for no role), else 0, in entry order."""
+        bonus = self._role_bonus.get(role)
+        if bonus is None:
+            bonus = self._role_bonus[role] = [
+                2 if not roles or role in roles else 0 for roles in self.roles
+            ]
+        return bonus
+
+    def scores(self, kw_set: set[str], role: str) -> list[float]:
+        """Score of every entry, in entry order."""
+        scores = list(self.role_bonus(role))
+        matched: set[int] = set()
+        for kw in kw_set:
+            matched |= self.keyword_terms(kw)
+        postings = self.postings
+        for term_id in matched:
+            for i, weight in postings[term_id]:
+                scores[i] += weight
+        return scores
+
+
+# Compiled indexes keyed by (id(bank), kind); each entry holds a reference to
+# its bank so the id cannot be reused. Banks are read-only once loaded.
+_BANK_INDEXES: dict[tuple[int, str], tuple] = {}
+
+
+def _bullet_bank_index(bullet_bank: dict) -> tuple[TagIndex, list[dict], list[tuple[str, int, int]]]:
+    """(index, bullets, [(company, start, end), ...]) for a bullet bank, compiled once."""
+    cached = _BANK_INDEXES.get((id(bullet_bank), "bullets"))
+    if cached is None:
+        bullets: list[dict] = []
+        spans = []
+        for entry in bullet_bank.get("companies", []):
+            start = len(bullets)
+            bullets.extend(entry.get("bullets", []))
+            spans.append((entry.get("company", "Unknown"), start, len(bullets)))
+        cached = (TagIndex(bullets), bullets, spans, bullet_bank, {})
+        _BANK_INDEXES[(id(bullet_bank), "bullets")] = cached
+    return cached[:3]
+
+
+def _bullet_costs(bullet_bank: dict, unit: str) -> list[int]:
+    """bullet_cost of every bullet in _bullet_bank_index order, computed once per bank."""
+    _bullet_bank_index(bullet_bank)
+    _, bullets, _, _, costs = _BANK_INDEXES[(id(bullet_bank), "bullets")]
+    if unit not in costs:
+        costs[unit] = [bullet_cost(b, unit) for b in bullets]
+    return costs[unit]
+
+
+def _paragraph_bank_index(paragraph_bank: dict) -> tuple[TagIndex, list[dict]]:
+    """(index, paragraphs) for a paragraph bank, compiled once."""
+    cached = _BANK_INDEXES.get((id(paragraph_bank), "paragraphs"))
+    if cached is None:
+        paragraphs = paragraph_bank.get("paragraphs", [])
+        # Paragraphs have no clusters; drop any so they cannot score
+        cached = (TagIndex([{"tags": p.get("tags"), "applicable_roles": p.get("applicable_roles")}
+                            for p in paragraphs]), paragraphs, paragraph_bank)
+        _BANK_INDEXES[(id(paragraph_bank), "paragraphs")] = cached
+    return cached[:2]
+
+
+# How bank entries are scored against a JD: tag/cluster overlap with its
+# keywords, or TF-IDF cosine similarity of the entry text to the JD text
+RANKINGS = ("tags", "tfidf")
+# Scales the TF-IDF cosine (0-1) so a close text match outweighs the role bonus of 2
+TFIDF_WEIGHT = 10
+
+
+def bank_relevance(
+    bank: dict,
+    kind: str,
+    index: TagIndex,
+    jd_keywords: list[str],
+    role: str,
+    ranking: str = "tags",
+    jd=None,
+) -> list[float]:
+    """
+    Relevance of every entry of a bank ('bullet' or 'paragraph'), in index order.
+
+    'tags' is the TagIndex score. 'tfidf' is the role bonus plus TFIDF_WEIGHT
+    times the cosine similarity of the entry text to jd (JD text or a
+    JDDocument), using the bank's persisted vectors (see bank_vectors.py).
+    """
+    if ranking == "tfidf":
+        if jd is None:
+            raise ValueError("ranking='tfidf' needs the JD text")
+        sims = bank_vectors.vectors_for_bank(bank, kind).similarities(jd)
+        return [bonus + TFIDF_WEIGHT * sim for bonus, sim in zip(index.role_bonus(role), sims)]
+    return index.scores(set(_slug(k) for k in jd_keywords), role)
+
+
 def preselect_bullets(
     bullet_bank: dict,
     jd_keywords: list[str],
     role: str,
     max_per_company: int = 5,
+    ranking: str = "tags",
+    jd=None,
 ) -> dict[str, list[dict]]:
     """
     Score each bullet in the bank against JD keywords and return the top N
     per company, keyed by company name.
 
+    Score: 2 per tag and 1.5 per cluster overlapping a JD keyword, plus 2
+    if the bullet is marked for this role (or for none). Ties keep bank order.
+    With ranking='tfidf', bullets are scored by text similarity to jd
+    instead (see bank_relevance).
+
     Returns: {"QuotaPath": [{"text": ..., "tags": [...], "clusters": [...]}, ...], ...}
     """
-    kw_set = set(_slug(k) for k in jd_keywords)
-    result: dict[str, list[dict]] = {}
-
-    for entry in bullet_bank.get("companies", []):
-        company = entry.get("company", "Unknown")
-        bullets = entry.get("bullets", [])
-
-        scored = []
-        for b in bullets:
-            tags = [_slug(t) for t in (b.get("tags") or [])]
-            clusters = [_slug(c) for c in (b.get("clusters") or [])]
-            roles = b.get("applicable_roles") or []
-
-            # Score: tag/cluster overlap with JD keywords
-            tag_hits = sum(1 for t in tags if any(t in kw or kw in t for kw in kw_set))
-            cluster_hits = sum(1 for c in clusters if any(c in kw or kw in c for kw in kw_set))
-            # Bonus if bullet is marked for this role
-            role_bonus = 2 if not roles or role in roles else 0
-            score = tag_hits * 2 + cluster_hits * 1.5 + role_bonus
-
-            scored.append((score, b))
-
-        # Sort descending, take top N
-        scored.sort(key=lambda x: x[0], reverse=True)
-        result[company] = [b for _, b in scored[:max_per_company]]
+    index, bullets, spans = _bullet_bank_index(bullet_bank)
+    scores = bank_relevance(bullet_bank, "bullet", index, jd_keywords, role, ranking, jd)
 
+    result: dict[str, list[dict]] = {}
+    for company, start, end in spans:
+        # nlargest is stable, like the descending sort it replaces
+        top = heapq.nlargest(max_per_company, range(start, end), key=scores.__getitem__)
+        result[company] = [bullets[i] for i in top]
     return result
 
 
@@ -224,25 +413,184 @@ def preselect_paragraphs(
     jd_keywords: list[str],
     role: str,
     max_paragraphs: int = 3,
+    ranking: str = "tags",
+    jd=None,
 ) -> list[dict]:
     """
-    Score cover letter paragraph blocks against JD keywords and return the top N.
+    Score cover letter paragraph blocks against JD keywords (or, with
+    ranking='tfidf', by text similarity to jd) and return the top N.
     """
-    kw_set = set(_slug(k) for k in jd_keywords)
-    scored = []
+    index, paragraphs = _paragraph_bank_index(paragraph_bank)
+    scores = bank_relevance(paragraph_bank, "paragraph", index, jd_keywords, role, ranking, jd)
+    top = heapq.nlargest(max_paragraphs, range(len(paragraphs)), key=scores.__getitem__)
+    return [paragraphs[i] for i in top]
+
 
-    for para in paragraph_bank.get("paragraphs", []):
-        tags = [_slug(t) for t in (para.get("tags") or [])]
-        applicable = para.get("applicable_roles") or []
+# ---- Budget-aware bullet selection ------------------------------------------
 
-        tag_hits = sum(1 for t in tags if any(t in kw or kw in t for kw in kw_set))
-        role_bonus = 2 if not applicable or role in applicable else 0
-        score = tag_hits * 2 + role_bonus
+# resume-standards.md: one page, 3-5 bullets per role (2-3 for older roles).
+# Across three roles and a project that is about 15 bullets of ~27 words.
+DEFAULT_BULLET_WORD_BUDGET = 400
+# Characters per rendered bullet line on the one-page PDF, for --budget-unit lines
+BULLET_CHARS_PER_LINE = 105
 
-        scored.append((score, para))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [p for _, p in scored[:max_paragraphs]]
+def bullet_cost(bullet: dict, unit: str = "words") -> int:
+    """Space a bullet takes on the page: its word count, or its rendered line count."""
+    text = (bullet.get("text") or "").strip()
+    if unit == "lines":
+        return max(1, -(-len(text) // BULLET_CHARS_PER_LINE))
+    return len(text.split())
+
+
+def fractional_bound(values: list[float], costs: list[int], budget: int) -> float:
+    """
+    Upper bound on the relevance any selection within budget can reach: the
+    fractional knapsack optimum, which ignores every other constraint.
+    """
+    total = 0.0
+    for i in sorted(range(len(values)), key=lambda i: values[i] / max(costs[i], 1), reverse=True):
+        if values[i] <= 0 or budget <= 0:
+            break
+        take = min(1.0, budget / max(costs[i], 1))
+        total += values[i] * take
+        budget -= costs[i] * take
+    return total
+
+
+class _BulletSelection:
+    """A feasible bullet selection and the running totals its constraints need."""
+
+    def __init__(self, scores, costs, tags, company_of, minimum, budget, max_per_company, max_per_tag):
+        self.scores, self.costs, self.tags = scores, costs, tags
+        self.company_of, self.minimum = company_of, minimum
+        self.budget, self.max_per_company, self.max_per_tag = budget, max_per_company, max_per_tag
+        self.chosen: set[int] = set()
+        self.used = 0
+        self.per_company = [0] * len(minimum)
+        self.per_tag: dict[int, int] = {}
+
+    def value(self) -> float:
+        return sum(self.scores[i] for i in self.chosen)
+
+    def _take(self, i: int, sign: int) -> None:
+        self.used += sign * self.costs[i]
+        self.per_company[self.company_of[i]] += sign
+        for t in self.tags[i]:
+            self.per_tag[t] = self.per_tag.get(t, 0) + sign
+
+    def add(self, i: int) -> bool:
+        """Add bullet i if every constraint still holds."""
+        if (i in self.chosen or self.used + self.costs[i] > self.budget
+                or self.per_company[self.company_of[i]] >= self.max_per_company
+                or any(self.per_tag.get(t, 0) >= self.max_per_tag for t in self.tags[i])):
+            return False
+        self.chosen.add(i)
+        self._take(i, 1)
+        return True
+
+    def swap(self, out: int, into: int) -> bool:
+        """Replace bullet out with bullet into if every constraint still holds."""
+        c_out, c_in = self.company_of[out], self.company_of[into]
+        if self.used - self.costs[out] + self.costs[into] > self.budget:
+            return False
+        if c_out != c_in and (self.per_company[c_in] >= self.max_per_company
+                              or self.per_company[c_out] <= self.minimum[c_out]):
+            return False
+        freed = self.tags[out]
+        if any(self.per_tag.get(t, 0) - (t in freed) >= self.max_per_tag for t in self.tags[into]):
+            return False
+        self.chosen.remove(out)
+        self._take(out, -1)
+        self.chosen.add(into)
+        self._take(into, 1)
+        return True
+
+
+def select_bullets_within_budget(
+    bullet_bank: dict,
+    jd_keywords: list[str],
+    role: str,
+    budget: int = DEFAULT_BULLET_WORD_BUDGET,
+    unit: str = "words",
+    min_per_company: int = 2,
+    max_per_company: int = 5,
+    max_per_tag: int = 3,
+    ranking: str = "tags",
+    jd=None,
+) -> dict[str, list[dict]]:
+    """
+    Choose bullets across all companies at once, maximizing total JD relevance
+    (the preselect_bullets score) within a page budget.
+
+    Constraints: total bullet_cost <= budget; between min_per_company (or
+    all of a smaller company) and max_per_company bullets per company; no tag
+    on more than max_per_tag selected bullets. Minimums are filled first with
+    each company's best bullets, budget permitting.
+
+    This is a knapsack with side constraints, solved greedily with a bound:
+    the better of a fill by relevance per word and a fill by relevance (each
+    within a factor of two of the plain knapsack optimum), improved by
+    swapping in higher-scoring bullets while every constraint holds, then
+    topped up with whatever still fits. fractional_bound gives the ceiling.
+    Runs in milliseconds for thousands of bullets.
+
+    Returns {company: [bullet, ...]} in bank order, best bullet first, like
+    preselect_bullets; ranking and jd select the relevance score the same way.
+    """
+    index, bullets, spans = _bullet_bank_index(bullet_bank)
+    scores = bank_relevance(bullet_bank, "bullet", index, jd_keywords, role, ranking, jd)
+    costs = _bullet_costs(bullet_bank, unit)
+    company_of = [0] * len(bullets)
+    for c, (_, start, end) in enumerate(spans):
+        company_of[start:end] = [c] * (end - start)
+    minimum = [min(min_per_company, end - start) for _, start, end in spans]
+
+    by_value = sorted(range(len(bullets)), key=lambda i: (-scores[i], costs[i]))
+    relevant = [i for i in by_value if scores[i] > 0]
+    by_density = sorted(relevant, key=lambda i: (-scores[i] / max(costs[i], 1), costs[i]))
+
+    def fill(order: list[int]) -> _BulletSelection:
+        sel = _BulletSelection(scores, costs, index.entry_tags, company_of, minimum,
+                               budget, max_per_company, max_per_tag)
+        # Minimums first: each company's best bullets, best overall first
+        for i in by_value:
+            if sel.per_company[company_of[i]] < minimum[company_of[i]]:
+                sel.add(i)
+        for i in order:
+            sel.add(i)
+        return sel
+
+    sel = max(fill(by_density), fill(relevant), key=_BulletSelection.value)
+
+    # 1-swap improvement: replace the weakest selected bullet a candidate beats.
+    # Every swap strictly raises the total, so this terminates.
+    improved = True
+    while improved:
+        improved = False
+        weakest_first = sorted(sel.chosen, key=lambda i: (scores[i], -costs[i]))
+        floor = scores[weakest_first[0]] if weakest_first else 0
+        for into in relevant:
+            if scores[into] <= floor:
+                break
+            if into in sel.chosen:
+                continue
+            for out in weakest_first:
+                if scores[out] >= scores[into]:
+                    break
+                if sel.swap(out, into):
+                    improved = True
+                    break
+            if improved:
+                break
+    for i in by_density:
+        sel.add(i)
+
+    result: dict[str, list[dict]] = {}
+    for company, start, end in spans:
+        picked = sorted((i for i in range(start, end) if i in sel.chosen), key=lambda i: -scores[i])
+        result[company] = [bullets[i] for i in picked]
+    return result
 
 
 def format_preselected_bullets(bullets_by_company: dict[str, list[dict]]) -> str:
@@ -308,8 +656,9 @@ def filter_taxonomy_for_role(taxonomy: dict, role: str) -> dict:
 def filter_experience_for_role(portfolio: dict, structure: dict) -> list[dict]:
     """Annotate experience entries with priority themes from the role structure."""
     emphasis = structure.get("experience_bullet_emphasis", {})
-    high = set(emphasis.get("high_priority_themes", []))
-    medium = set(emphasis.get("medium_priority_themes", []))
+    # Deduplicate in listed order so the rendering is stable across runs
+    high = list(dict.fromkeys(emphasis.get("high_priority_themes", [])))
+    medium = list(dict.fromkeys(emphasis.get("medium_priority_themes", [])))
 
     entries = []
     for exp in portfolio.get("experience", []):
@@ -322,108 +671,225 @@ def filter_experience_for_role(portfolio: dict, structure: dict) -> list[dict]:
     return entries
 
 
-def format_candidate_data(
+# Candidate data blocks rendered in this process, keyed by candidate_data_key()
+_CANDIDATE_BLOCKS: dict[str, str] = {}
+
+# candidate_data_key() results for input objects already seen in this process.
+# Loaded inputs are read-only throughout the pipeline, so identity is enough;
+# the entry holds references to the objects so their ids cannot be reused.
+_CANDIDATE_KEYS: dict[tuple, tuple[str, tuple]] = {}
+
+
+def _compact_evidence(evidence: list, max_items: int | None, max_chars: int | None) -> str:
+    items = [e for e in evidence if e and not e.startswith("# TODO")]
+    if max_items is not None:
+        items = items[:max_items]
+    if max_chars is not None:
+        items = [(e[:max_chars] + "…") if len(e) > max_chars else e for e in items]
+    return "; ".join(items)
+
+
+def render_candidate_data(
     portfolio: dict,
     taxonomy: dict,
     structure: dict,
     role: str,
+    full_taxonomy: bool = True,
+    evidence_items: int | None = None,
+    evidence_chars: int | None = None,
+    drop_skills: frozenset = frozenset(),
 ) -> str:
-    """Format the candidate's data block shared by both prompt types."""
+    """Render the candidate's data block shared by all prompt types (uncached).
+
+    The keyword arguments compact the block (see COMPACTION_STEPS): without
+    full_taxonomy, the full listing only names the skills that the filtered
+    listing does not already cover; evidence is cut to evidence_items
+    entries of at most evidence_chars characters; drop_skills are omitted.
+    """
+    if drop_skills:
+        taxonomy = {"categories": [
+            dict(cat, skills=[sk for sk in cat.get("skills", []) if sk["skill"] not in drop_skills])
+            for cat in taxonomy.get("categories", [])
+        ]}
     filtered_tax = filter_taxonomy_for_role(taxonomy, role)
     annotated_exp = filter_experience_for_role(portfolio, structure)
+    personal = portfolio.get("personal", {})
+    summary = portfolio.get("summary", {})
 
-    block = f"""## CANDIDATE — PERSONAL INFO
-Name: {portfolio.get('personal', {}).get('name', 'James Mayo')}
-Location: {portfolio.get('personal', {}).get('location', 'New York, NY')}
-Email: {portfolio.get('personal', {}).get('email', '')}
-LinkedIn: {portfolio.get('personal', {}).get('linkedin', '')}
-
-## CANDIDATE — SUMMARY DATABASE
-Core: {portfolio.get('summary', {}).get('core', '')}
-Specializations: {', '.join(portfolio.get('summary', {}).get('specializations', []))}
-Secondary strengths: {', '.join(portfolio.get('summary', {}).get('secondary_strengths', []))}
+    taxonomy_heading = (
+        "## CANDIDATE — FULL SKILL TAXONOMY (all skills, with proficiency and evidence)"
+        if full_taxonomy else
+        f"## CANDIDATE — OTHER SKILLS (not applicable to {role}; names only)"
+    )
 
-## CANDIDATE — FULL SKILL TAXONOMY (all skills, with proficiency and evidence)
-"""
-    for cat in taxonomy.get("categories", []):
-        block += f"\n### {cat['category']}\n"
-        for s in cat["skills"]:
-            evidence_str = "; ".join(
-                e for e in s.get("evidence", []) if e and not e.startswith("# TODO")
-            )
-            roles_str = ", ".join(s.get("applicable_roles", []))
-            block += (
-                f"- {s['skill']} [{s['proficiency']}] ({s.get('years', '?')}yr) "
-                f"[roles: {roles_str}]: {evidence_str}\n"
-            )
+    out = [f"""## CANDIDATE — PERSONAL INFO
+Name: {personal.get('name', 'James Mayo')}
+Location: {personal.get('location', 'New York, NY')}
+Email: {personal.get('email', '')}
+LinkedIn: {personal.get('linkedin', '')}
 
-    block += f"\n## CANDIDATE — FILTERED SKILL TAXONOMY (skills applicable to {role})\n"
+## CANDIDATE — SUMMARY DATABASE
+Core: {summary.get('core', '')}
+Specializations: {', '.join(summary.get('specializations', []))}
+Secondary strengths: {', '.join(summary.get('secondary_strengths', []))}
+
+{taxonomy_heading}
+"""]
+    add = out.append
+
+    if full_taxonomy:
+        for cat in taxonomy.get("categories", []):
+            add(f"\n### {cat['category']}\n")
+            for s in cat["skills"]:
+                evidence_str = _compact_evidence(s.get("evidence", []), evidence_items, evidence_chars)
+                roles_str = ", ".join(s.get("applicable_roles", []))
+                add(
+                    f"- {s['skill']} [{s['proficiency']}] ({s.get('years', '?')}yr) "
+                    f"[roles: {roles_str}]: {evidence_str}\n"
+                )
+    else:
+        # The filtered listing below already carries the role's skills in full
+        for cat in taxonomy.get("categories", []):
+            others = [
+                f"{s['skill']} [{s['proficiency']}]" for s in cat.get("skills", [])
+                if role not in s.get("applicable_roles", [])
+            ]
+            if others:
+                add(f"- {cat['category']}: {', '.join(others)}\n")
+
+    add(f"\n## CANDIDATE — FILTERED SKILL TAXONOMY (skills applicable to {role})\n")
     for cat in filtered_tax.get("categories", []):
-        block += f"\n### {cat['category']}\n"
+        add(f"\n### {cat['category']}\n")
         for s in cat["skills"]:
-            evidence_str = "; ".join(
-                e for e in s.get("evidence", []) if e and not e.startswith("# TODO")
-            )
-            block += (
+            evidence_str = _compact_evidence(s.get("evidence", []), evidence_items, evidence_chars)
+            add(
                 f"- {s['skill']} [{s['proficiency']}] ({s.get('years', '?')}yr): "
                 f"{evidence_str}\n"
             )
 
-    block += "\n## CANDIDATE — EXPERIENCE\n"
+    add("\n## CANDIDATE — EXPERIENCE\n")
     for exp in annotated_exp:
-        block += f"\n### {exp.get('title', '')} @ {exp.get('company', '')}\n"
-        block += f"Dates: {exp.get('dates', '')}\n"
+        add(f"\n### {exp.get('title', '')} @ {exp.get('company', '')}\n")
+        add(f"Dates: {exp.get('dates', '')}\n")
         env = exp.get('environment', [])
         if env:
-            block += f"Environment: {', '.join(str(e) for e in env)}\n"
-        block += f"Priority guidance: {exp.get('_priority_note', '')}\n"
+            add(f"Environment: {', '.join(str(e) for e in env)}\n")
+        add(f"Priority guidance: {exp.get('_priority_note', '')}\n")
         if exp.get('title_progression'):
-            block += f"Progression: {exp['title_progression']}\n"
+            add(f"Progression: {exp['title_progression']}\n")
         if exp.get('direct_reports'):
-            block += f"Direct reports: {exp['direct_reports']}\n"
-        block += "Responsibilities:\n"
+            add(f"Direct reports: {exp['direct_reports']}\n")
+        add("Responsibilities:\n")
         for r in exp.get("responsibilities", []):
-            block += f"  - {r}\n"
+            add(f"  - {r}\n")
         metrics = exp.get("impact_metrics", {})
         if metrics:
             filled_metrics = {k: v for k, v in metrics.items() if v is not None}
             if filled_metrics:
-                block += "Impact metrics:\n"
+                add("Impact metrics:\n")
                 for k, v in filled_metrics.items():
-                    block += f"  - {k}: {v}\n"
+                    add(f"  - {k}: {v}\n")
         confirmed = exp.get("confirmed_contributions", [])
         if confirmed:
-            block += "Confirmed contributions:\n"
+            add("Confirmed contributions:\n")
             for c in confirmed:
-                block += f"  - {c}\n"
+                add(f"  - {c}\n")
 
     projects = portfolio.get("projects", [])
     if projects:
-        block += "\n## CANDIDATE — PROJECTS\n"
+        add("\n## CANDIDATE — PROJECTS\n")
         for p in projects:
-            block += f"\n### {p.get('name', '')}\n"
+            add(f"\n### {p.get('name', '')}\n")
             for c in p.get("contributions", []):
-                block += f"  - {c}\n"
+                add(f"  - {c}\n")
 
     education = portfolio.get("education", [])
     if education:
-        block += "\n## CANDIDATE — EDUCATION\n"
+        add("\n## CANDIDATE — EDUCATION\n")
         for e in education:
             if isinstance(e, dict):
-                block += f"- {e.get('degree', '')} — {e.get('institution', '')} ({e.get('year', '')})\n"
+                add(f"- {e.get('degree', '')} — {e.get('institution', '')} ({e.get('year', '')})\n")
 
     leadership = portfolio.get("leadership", {})
     if leadership:
-        block += "\n## CANDIDATE — LEADERSHIP & COMMUNITY\n"
+        add("\n## CANDIDATE — LEADERSHIP & COMMUNITY\n")
         for v in leadership.get("volunteer", []):
             note = f" — {v['note']}" if v.get('note') else ""
-            block += f"- {v.get('organization', '')}: {v.get('role', '')}{note}\n"
+            add(f"- {v.get('organization', '')}: {v.get('role', '')}{note}\n")
         for m in leadership.get("confirmed_mentorship", []):
-            block += f"- {m}\n"
+            add(f"- {m}\n")
+
+    return "".join(out)
+
+
+def candidate_data_key(portfolio: dict, taxonomy: dict, structure: dict, role: str) -> str:
+    """Content hash of everything the candidate data block depends on."""
+    payload = pickle.dumps((portfolio, taxonomy, structure, role), protocol=4)
+    return hashlib.sha256(payload + f"v{CANDIDATE_DATA_VERSION}".encode()).hexdigest()[:16]
 
+
+def format_candidate_data(
+    portfolio: dict,
+    taxonomy: dict,
+    structure: dict,
+    role: str,
+    compaction: dict | None = None,
+) -> str:
+    """Format the candidate's data block shared by all prompt types.
+
+    The rendering is cached in memory and under .cache/ keyed by a hash of
+    the portfolio, taxonomy, role structure and role, so the three prompt
+    modes and every JD in a batch reuse a single rendering. The hash is
+    computed once per set of input objects. Compacted renderings (compaction
+    holds render_candidate_data keyword arguments) are not cached.
+    """
+    if compaction:
+        return render_candidate_data(portfolio, taxonomy, structure, role, **compaction)
+    ident = (id(portfolio), id(taxonomy), id(structure), role)
+    seen = _CANDIDATE_KEYS.get(ident)
+    if seen is not None:
+        key = seen[0]
+    else:
+        key = candidate_data_key(portfolio, taxonomy, structure, role)
+        _CANDIDATE_KEYS[ident] = (key, (portfolio, taxonomy, structure))
+    block = _CANDIDATE_BLOCKS.get(key)
+    if block is not None:
+        return block
+
+    cache_path = CACHE_DIR / f"candidate-data-{key}.md"
+    try:
+        with open(cache_path, "r", encoding="utf-8", newline="") as f:
+            block = f.read()
+    except OSError:
+        block = render_candidate_data(portfolio, taxonomy, structure, role)
+        CACHE_DIR.mkdir(exist_ok=True)
+        atomic_write(cache_path, block)
+
+    _CANDIDATE_BLOCKS[key] = block
     return block
 
 
+# ---- Prompt layout ----------------------------------------------------------
+
+def cache_friendly_layout(static_parts: list[str], job_part: str, cache_marker: bool = False) -> str:
+    """
+    Lay out a prompt as a static prefix followed by the per-job content.
+
+    static_parts (candidate data first, then the mode's instructions) depend
+    only on the role and templates, so every prompt for the same role starts
+    with the same bytes and provider-side prefix caching can reuse them.
+    With cache_marker, CACHE_BREAKPOINT_MARKER separates the two halves.
+    """
+    marker = f"{CACHE_BREAKPOINT_MARKER}\n\n" if cache_marker else ""
+    return "\n".join(static_parts) + f"\n{marker}{JOB_SECTION_HEADER}\n\n{job_part}"
+
+
+def static_prefix_length(prompt: str) -> int:
+    """Length of the static prefix of a cache-friendly prompt (0 if it has none)."""
+    idx = prompt.find(JOB_SECTION_HEADER)
+    return max(idx, 0)
+
+
 def assemble_resume_prompt(
     job_text: str,
     role: str,
@@ -433,13 +899,17 @@ def assemble_resume_prompt(
     standards: str,
     precomputed_block: str = "",
     bullet_block: str = "",
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    compaction: dict | None = None,
 ) -> str:
     """Build the full LLM prompt for resume generation."""
     role_keywords = structure.get("keyword_targets", {})
     summary_focus = structure.get("summary_focus", {})
+    where = "below" if cache_friendly else "above"
 
     bullet_instruction = (
-        "4. For each role, PRIORITIZE bullets from the PRE-SELECTED BULLET BANK above. "
+        f"4. For each role, PRIORITIZE bullets from the PRE-SELECTED BULLET BANK {where}. "
         "Reorder by relevance, tighten wording, mirror JD keywords. Do not swap them out for "
         "generic rewrites unless evidence is weak."
     ) if bullet_block else (
@@ -449,13 +919,13 @@ def assemble_resume_prompt(
         "   - Mirror the job description's keywords naturally"
     )
 
-    prompt = f"""You are a resume generation assistant. Produce a tailored, ATS-optimized,
+    intro = """You are a resume generation assistant. Produce a tailored, ATS-optimized,
 one-page resume in Markdown format.
-
-{precomputed_block}{bullet_block}## TARGET JOB DESCRIPTION
+"""
+    job_block = f"""{precomputed_block}{bullet_block}## TARGET JOB DESCRIPTION
 {job_text}
-
-## ROLE STRUCTURE: {structure.get('role_name', role)}
+"""
+    role_block = f"""## ROLE STRUCTURE: {structure.get('role_name', role)}
 Summary focus: {summary_focus.get('identity', '')} — {summary_focus.get('tone', '')}
 Emphasis areas: {', '.join(summary_focus.get('emphasis', []))}
 Section order: {', '.join(structure.get('section_order', []))}
@@ -464,13 +934,12 @@ Section order: {', '.join(structure.get('section_order', []))}
 Must include: {', '.join(role_keywords.get('must_include', []))}
 Should include: {', '.join(role_keywords.get('should_include', []))}
 Nice to have: {', '.join(role_keywords.get('nice_to_have', []))}
-
-{format_candidate_data(portfolio, taxonomy, structure, role)}
-
-## RESUME FORMATTING STANDARDS
+"""
+    candidate_block = format_candidate_data(portfolio, taxonomy, structure, role, compaction)
+    standards_block = f"""## RESUME FORMATTING STANDARDS
 {standards}
-
-## OUTPUT INSTRUCTIONS
+"""
+    instructions = f"""## OUTPUT INSTRUCTIONS
 1. Generate a complete one-page resume in Markdown.
 2. Write a custom 2-3 sentence summary tailored to the job description.
 3. Select and order technical skills by relevance to this specific job.
@@ -482,7 +951,18 @@ Nice to have: {', '.join(role_keywords.get('nice_to_have', []))}
 6. Do NOT fabricate experience or metrics.
 7. Do NOT use first person.
 """
-    return prompt
+    if cache_friendly:
+        return cache_friendly_layout(
+            [candidate_block, intro, role_block, standards_block, instructions],
+            job_block, cache_marker,
+        )
+    return f"""{intro}
+{job_block}
+{role_block}
+{candidate_block}
+
+{standards_block}
+{instructions}"""
 
 
 def assemble_fit_eval_prompt(
@@ -493,6 +973,9 @@ def assemble_fit_eval_prompt(
     structure: dict,
     fit_eval_structure: dict,
     precomputed_block: str = "",
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    compaction: dict | None = None,
 ) -> str:
     """Build the full LLM prompt for fit evaluation."""
     sections = fit_eval_structure.get("sections", [])
@@ -504,32 +987,32 @@ def assemble_fit_eval_prompt(
             for field in sec["fields"]:
                 sections_block += f"- **{field['name']}**: {field.get('description', '')}\n"
 
+    where = "below" if cache_friendly else "above"
     precomputed_note = (
-        "The PRE-COMPUTED JD ANALYSIS above provides initial scores. "
+        f"The PRE-COMPUTED JD ANALYSIS {where} provides initial scores. "
         "Validate each score against the full evidence — adjust up or down as warranted. "
         "Do not simply echo these scores; your job is to stress-test them.\n\n"
     ) if precomputed_block else ""
 
-    prompt = f"""You are a job fit evaluation assistant. Your task is to produce a thorough,
+    intro = """You are a job fit evaluation assistant. Your task is to produce a thorough,
 honest, structured fit evaluation comparing a candidate's skills and experience
 against a specific job description.
 
 Be rigorous. Flag real gaps. Do not inflate the candidate's fit. The candidate
 uses this evaluation to decide whether to invest time applying.
-
-{precomputed_block}## TARGET JOB DESCRIPTION
+"""
+    job_block = f"""{precomputed_block}## TARGET JOB DESCRIPTION
 {job_text}
-
-## CLOSEST ROLE STRUCTURE USED FOR FILTERING: {structure.get('role_name', role)}
-
-{format_candidate_data(portfolio, taxonomy, structure, role)}
-
-## FIT EVALUATION OUTPUT STRUCTURE
+"""
+    role_block = f"""## CLOSEST ROLE STRUCTURE USED FOR FILTERING: {structure.get('role_name', role)}
+"""
+    candidate_block = format_candidate_data(portfolio, taxonomy, structure, role, compaction)
+    structure_block = f"""## FIT EVALUATION OUTPUT STRUCTURE
 
 {precomputed_note}Produce the evaluation following this exact structure:
 {sections_block}
-
-## EVALUATION RULES
+"""
+    rules = """## EVALUATION RULES
 1. Be honest and specific. Do not inflate fit.
 2. For each job requirement, cite specific evidence from the candidate's experience or mark as GAP.
 3. Rate proficiency matches using the taxonomy's own levels (expert/advanced/intermediate/foundational).
@@ -538,7 +1021,18 @@ uses this evaluation to decide whether to invest time applying.
 6. Consider domain experience gaps separately from transferable skills.
 7. Flag any red flags in the JD that might indicate poor culture fit or unrealistic expectations.
 """
-    return prompt
+    if cache_friendly:
+        return cache_friendly_layout(
+            [candidate_block, intro, role_block, structure_block, rules],
+            job_block, cache_marker,
+        )
+    return f"""{intro}
+{job_block}
+{role_block}
+{candidate_block}
+
+{structure_block}
+{rules}"""
 
 
 def assemble_cover_letter_prompt(
@@ -551,6 +1045,9 @@ def assemble_cover_letter_prompt(
     fit_eval_text: str | None = None,
     precomputed_block: str = "",
     paragraph_block: str = "",
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    compaction: dict | None = None,
 ) -> str:
     """Build the full LLM prompt for cover letter generation."""
     cl_format = cover_letter_structure.get("format", {})
@@ -574,43 +1071,43 @@ def assemble_cover_letter_prompt(
 {fit_eval_text}
 """
 
+    where = "below" if cache_friendly else "above"
     paragraph_instruction = (
-        "Use the PRE-SELECTED COVER LETTER PARAGRAPHS above as your primary source material. "
+        f"Use the PRE-SELECTED COVER LETTER PARAGRAPHS {where} as your primary source material. "
         "Connect them with natural transitions and adapt tone to the specific company voice."
     ) if paragraph_block else (
         "Write naturally and specifically. Reference real accomplishments from the candidate data."
     )
 
-    prompt = f"""You are a cover letter writing assistant. Write a tailored, compelling
+    intro = """You are a cover letter writing assistant. Write a tailored, compelling
 cover letter for a specific job application.
 
 The letter should sound like a real person — direct, confident, conversational.
 Not corporate boilerplate. Not a template with blanks filled in.
-
-{precomputed_block}{paragraph_block}## FORMAT
+"""
+    format_block = f"""## FORMAT
 - Length: {cl_format.get('length', '3-4 paragraphs, 250-400 words')}
 - Tone: {cl_format.get('tone', 'Professional but conversational')}
 - Perspective: {cl_format.get('perspective', 'First person')}
 - Address: {cl_format.get('address', 'Hiring Manager')}
-
-## TARGET JOB DESCRIPTION
+"""
+    job_description = f"""## TARGET JOB DESCRIPTION
 {job_text}
-
-## CLOSEST ROLE STRUCTURE: {structure.get('role_name', role)}
-
-{format_candidate_data(portfolio, taxonomy, structure, role)}
-{fit_eval_block}
-## COVER LETTER STRUCTURE
+"""
+    role_block = f"""## CLOSEST ROLE STRUCTURE: {structure.get('role_name', role)}
+"""
+    candidate_block = format_candidate_data(portfolio, taxonomy, structure, role, compaction)
+    structure_block = f"""## COVER LETTER STRUCTURE
 
 {paragraph_instruction}
 
 Follow this structure:
 {sections_block}
-
-## CONSTRAINTS
+"""
+    constraints_section = f"""## CONSTRAINTS
 {constraints_block}
-
-## OUTPUT INSTRUCTIONS
+"""
+    instructions = """## OUTPUT INSTRUCTIONS
 1. Write the cover letter in Markdown, ready to copy-paste.
 2. Do NOT include a subject line or email headers — just the letter body.
 3. Start with "Dear Hiring Manager," (or specific name if provided in the JD).
@@ -620,6 +1117,252 @@ Follow this structure:
    - Which gaps were addressed (if any)
    - Alternative angles that could be explored if this version doesn't land
 """
+    if cache_friendly:
+        return cache_friendly_layout(
+            [candidate_block, intro, format_block, role_block, structure_block,
+             constraints_section, instructions],
+            f"{precomputed_block}{paragraph_block}{job_description}{fit_eval_block}",
+            cache_marker,
+        )
+    return f"""{intro}
+{precomputed_block}{paragraph_block}{format_block}
+{job_description}
+{role_block}
+{candidate_block}
+{fit_eval_block}
+{structure_block}
+{constraints_section}
+{instructions}"""
+
+
+# ---- Token budget ----------------------------------------------------------
+
+# Word pieces of up to 6 characters, or single punctuation marks: a fast,
+# slightly pessimistic stand-in for a BPE tokenizer on English prose
+_TOKEN_RE = re.compile(r"\w{1,6}|[^\w\s]")
+_SECTION_RE = re.compile(r"^## (.+)$", re.MULTILINE)
+
+# Applied cumulatively, in order, until the prompt fits --max-tokens;
+# then skills are dropped in ascending order of pre-score confidence.
+COMPACTION_STEPS = [
+    ("drop duplicate taxonomy listing", {"full_taxonomy": False}),
+    ("trim evidence to 2 items of 200 chars", {"evidence_items": 2, "evidence_chars": 200}),
+    ("trim evidence to 1 item of 100 chars", {"evidence_items": 1, "evidence_chars": 100}),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer."""
+    return len(_TOKEN_RE.findall(text))
+
+
+def section_token_counts(prompt: str) -> dict[str, int]:
+    """Estimated tokens per '## ' section of a prompt, in order; text before the first is '(preamble)'."""
+    counts: dict[str, int] = {}
+    starts = [(m.start(), m.group(1).strip()) for m in _SECTION_RE.finditer(prompt)]
+    bounds = [(0, "(preamble)")] + starts
+    for i, (start, name) in enumerate(bounds):
+        end = bounds[i + 1][0] if i + 1 < len(bounds) else len(prompt)
+        counts[name] = counts.get(name, 0) + estimate_tokens(prompt[start:end])
+    return counts
+
+
+def compact_prompt(assemble, max_tokens: int, pre_scores: dict | None = None,
+                   keep_prefix: bool = False) -> tuple[str, dict]:
+    """
+    Assemble a prompt within max_tokens (estimated) by compacting the candidate data.
+
+    assemble(compaction) returns the prompt for a compaction dict of
+    render_candidate_data options. COMPACTION_STEPS are applied in order;
+    if the prompt is still over budget and pre_scores are available, skills
+    are dropped a confidence tier at a time, lowest first, keeping the top
+    tier. Stops at the first prompt that fits, or after the last step.
+
+    With keep_prefix (the cache-friendly layout, where the candidate data is
+    the shared prefix) skills are never dropped: the dropped set follows each
+    JD's pre-scores, so every JD would get its own prefix. Only the
+    JD-independent COMPACTION_STEPS apply, giving at most one prefix per step.
+
+    Returns (prompt, report) where report holds the 'before' and 'after'
+    section token counts, the 'steps' applied, whether it 'fits' and
+    whether skill drops were 'held' back to keep the prefix.
+    """
+    prompt = assemble(None)
+    before = section_token_counts(prompt)
+    steps: list[str] = []
+    compaction: dict = {}
+
+    candidates = list(COMPACTION_STEPS)
+    confidence: dict[str, float] = {}
+    for sc in (pre_scores or {}).get("scores", []):
+        confidence[sc["skill"]] = sc.get("confidence", 0)
+    tiers = sorted(set(confidence.values()))
+    for tier in ([] if keep_prefix else tiers[:-1]):
+        dropped = frozenset(name for name, c in confidence.items() if c <= tier)
+        candidates.append((f"drop {len(dropped)} skill(s) with pre-score confidence <= {tier}",
+                           {"drop_skills": dropped}))
+
+    total = sum(before.values())
+    for label, opts in candidates:
+        if total <= max_tokens:
+            break
+        # Each drop tier supersedes the previous one; report only the last
+        if "drop_skills" in opts and "drop_skills" in compaction:
+            steps.pop()
+        compaction.update(opts)
+        prompt = assemble(dict(compaction))
+        total = estimate_tokens(prompt)
+        steps.append(label)
+
+    return prompt, {
+        "before": before,
+        "after": section_token_counts(prompt),
+        "steps": steps,
+        "fits": total <= max_tokens,
+        "max_tokens": max_tokens,
+        "held": keep_prefix and len(tiers) > 1 and total > max_tokens,
+    }
+
+
+def print_compaction_report(report: dict) -> None:
+    before, after = report["before"], report["after"]
+    print(f"  Token budget: {report['max_tokens']:,} (estimated)")
+    print(f"    {'Section':<60} {'Before':>8} {'After':>8}")
+    for name in list(before) + [n for n in after if n not in before]:
+        print(f"    {name[:60]:<60} {before.get(name, 0):>8,} {after.get(name, 0):>8,}")
+    print(f"    {'TOTAL':<60} {sum(before.values()):>8,} {sum(after.values()):>8,}")
+    for step in report["steps"]:
+        print(f"    - {step}")
+    if report.get("held"):
+        print("  [!] Warning: prompt is over the token budget; skills are not dropped with "
+              "--cache-friendly, which would make the candidate prefix differ per JD")
+    elif not report["fits"]:
+        print("  [!] Warning: prompt is still over the token budget after every compaction step")
+
+
+# ---- Prompt building entry points -------------------------------------------
+
+def load_prompt_inputs(role: str) -> dict:
+    """Load the portfolio, taxonomy, role structure, and templates every prompt mode reads."""
+    return {
+        "portfolio": load_yaml(PORTFOLIO_PATH),
+        "taxonomy": load_yaml(TAXONOMY_PATH),
+        "structure": load_yaml(STRUCTURES_DIR / f"{role}.yaml"),
+        "standards": load_text(STANDARDS_PATH),
+        "fit_eval_structure": load_yaml(FIT_EVAL_STRUCTURE_PATH),
+        "cover_letter_structure": load_yaml(COVER_LETTER_STRUCTURE_PATH),
+    }
+
+
+def build_prompt(
+    mode: str,
+    job_text: str,
+    role: str,
+    inputs: dict,
+    parsed_jd: dict | None = None,
+    pre_scores: dict | None = None,
+    fit_eval_text: str | None = None,
+    bullet_bank: dict | None = None,
+    paragraph_bank: dict | None = None,
+    verbose: bool = False,
+    cache_friendly: bool = False,
+    cache_marker: bool = False,
+    max_tokens: int | None = None,
+    bullet_budget: int | None = None,
+    budget_unit: str = "words",
+    ranking: str = "tags",
+) -> str:
+    """Assemble the prompt for one mode ('resume', 'fit-eval', or 'cover-letter').
+
+    inputs comes from load_prompt_inputs(role). Content banks are only used
+    when passed; set verbose to print what was pre-selected from them.
+    cache_friendly moves everything that does not depend on the job into a
+    byte-identical prefix (see cache_friendly_layout). With max_tokens, the
+    candidate data is compacted until the estimated prompt size fits (see
+    compact_prompt; with cache_friendly only in ways every JD shares);
+    verbose then prints the per-section token counts.
+    With bullet_budget, resume bullets are chosen across all companies to fit
+    that many words or lines (see select_bullets_within_budget) instead of
+    the top bullets of each company. ranking picks how bank entries are
+    scored against the JD (see bank_relevance).
+    """
+    precomputed_block = format_precomputed_context(parsed_jd, pre_scores)
+
+    bullet_block = ""
+    paragraph_block = ""
+    jd_keywords = (parsed_jd or {}).get("raw_keywords", []) + (parsed_jd or {}).get("required_skills", [])
+
+    if bullet_bank is not None:
+        if bullet_budget:
+            bullets_by_company = select_bullets_within_budget(
+                bullet_bank, jd_keywords, role, budget=bullet_budget, unit=budget_unit,
+                ranking=ranking, jd=job_text)
+        else:
+            bullets_by_company = preselect_bullets(
+                bullet_bank, jd_keywords, role, ranking=ranking, jd=job_text)
+        bullet_block = format_preselected_bullets(bullets_by_company)
+        if verbose:
+            total = sum(len(v) for v in bullets_by_company.values())
+            print(f"  [+] Pre-selected {total} bullets from bullet bank")
+            if bullet_budget:
+                used = sum(bullet_cost(b, budget_unit) for v in bullets_by_company.values() for b in v)
+                print(f"      {used}/{bullet_budget} {budget_unit} of bullet budget used")
+
+    if paragraph_bank is not None:
+        paragraphs = preselect_paragraphs(
+            paragraph_bank, jd_keywords, role, ranking=ranking, jd=job_text)
+        paragraph_block = format_preselected_paragraphs(paragraphs)
+        if verbose:
+            print(f"  [+] Pre-selected {len(paragraphs)} cover letter paragraphs")
+
+    def assemble(compaction: dict | None) -> str:
+        if mode == "resume":
+            return assemble_resume_prompt(
+                job_text=job_text,
+                role=role,
+                portfolio=inputs["portfolio"],
+                taxonomy=inputs["taxonomy"],
+                structure=inputs["structure"],
+                standards=inputs["standards"],
+                precomputed_block=precomputed_block,
+                bullet_block=bullet_block,
+                cache_friendly=cache_friendly,
+                cache_marker=cache_marker,
+                compaction=compaction,
+            )
+        if mode == "fit-eval":
+            return assemble_fit_eval_prompt(
+                job_text=job_text,
+                role=role,
+                portfolio=inputs["portfolio"],
+                taxonomy=inputs["taxonomy"],
+                structure=inputs["structure"],
+                fit_eval_structure=inputs["fit_eval_structure"],
+                precomputed_block=precomputed_block,
+                cache_friendly=cache_friendly,
+                cache_marker=cache_marker,
+                compaction=compaction,
+            )
+        return assemble_cover_letter_prompt(
+            job_text=job_text,
+            role=role,
+            portfolio=inputs["portfolio"],
+            taxonomy=inputs["taxonomy"],
+            structure=inputs["structure"],
+            cover_letter_structure=inputs["cover_letter_structure"],
+            fit_eval_text=fit_eval_text,
+            precomputed_block=precomputed_block,
+            paragraph_block=paragraph_block,
+            cache_friendly=cache_friendly,
+            cache_marker=cache_marker,
+            compaction=compaction,
+        )
+
+    if not max_tokens:
+        return assemble(None)
+    prompt, report = compact_prompt(assemble, max_tokens, pre_scores, keep_prefix=cache_friendly)
+    if verbose:
+        print_compaction_report(report)
     return prompt
 
 
@@ -679,11 +1422,56 @@ def main():
         help="Path to paragraph-bank.yaml (default: portfolio/paragraph-bank.yaml). "
              "Pass flag with no value to use default path.",
     )
+    # --- Prompt layout flags ---
+    parser.add_argument(
+        "--cache-friendly",
+        action="store_true",
+        help="Put instructions, standards, and candidate data in a static prefix shared by "
+             "every prompt for the role, followed by the job-specific content",
+    )
+    parser.add_argument(
+        "--cache-marker",
+        action="store_true",
+        help=f"With --cache-friendly, insert {CACHE_BREAKPOINT_MARKER} between the static "
+             "prefix and the job-specific content",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        dest="max_tokens",
+        type=int,
+        help="Compact the candidate data until the prompt fits this many (estimated) tokens: "
+             "drop the duplicate taxonomy listing, trim evidence, then drop the "
+             "lowest-confidence skills from --pre-scores. With --cache-friendly skills are "
+             "not dropped, since that would make the shared candidate prefix differ per JD",
+    )
+    parser.add_argument(
+        "--bullet-budget",
+        dest="bullet_budget",
+        type=int,
+        nargs="?",
+        const=DEFAULT_BULLET_WORD_BUDGET,
+        help="Choose bullets across all companies to fit this page budget instead of the top 5 "
+             f"per company (default with no value: {DEFAULT_BULLET_WORD_BUDGET} words)",
+    )
+    parser.add_argument(
+        "--budget-unit",
+        dest="budget_unit",
+        choices=["words", "lines"],
+        default="words",
+        help="Unit of --bullet-budget (default: words)",
+    )
+    parser.add_argument(
+        "--ranking",
+        choices=RANKINGS,
+        default="tags",
+        help="Score bank bullets/paragraphs by tag overlap with JD keywords (default) or by "
+             "TF-IDF similarity of their text to the JD (see bank_vectors.py)",
+    )
     args = parser.parse_args()
+    if args.cache_marker and not args.cache_friendly:
+        parser.error("--cache-marker requires --cache-friendly")
 
-    portfolio = load_yaml(PORTFOLIO_PATH)
-    taxonomy = load_yaml(TAXONOMY_PATH)
-    structure = load_yaml(STRUCTURES_DIR / f"{args.role}.yaml")
+    inputs = load_prompt_inputs(args.role)
     job_text = load_text(Path(args.job))
 
     # ---- Load optional pre-computed context ---------------------------------
@@ -705,21 +1493,14 @@ def main():
         else:
             print(f"  [!] Warning: --pre-scores file not found: {args.pre_scores}")
 
-    precomputed_block = format_precomputed_context(parsed_jd, pre_scores)
-
     # ---- Load optional content banks ----------------------------------------
-    bullet_block = ""
-    paragraph_block = ""
-    jd_keywords = (parsed_jd or {}).get("raw_keywords", []) + (parsed_jd or {}).get("required_skills", [])
+    bullet_bank = None
+    paragraph_bank = None
 
     if args.bullet_bank:
         bb_path = Path(args.bullet_bank)
         if bb_path.exists():
             bullet_bank = load_yaml(bb_path)
-            bullets_by_company = preselect_bullets(bullet_bank, jd_keywords, args.role)
-            bullet_block = format_preselected_bullets(bullets_by_company)
-            total = sum(len(v) for v in bullets_by_company.values())
-            print(f"  [+] Pre-selected {total} bullets from bullet bank")
         else:
             print(f"  [!] Warning: --bullet-bank file not found: {args.bullet_bank}")
 
@@ -727,52 +1508,32 @@ def main():
         pb_path = Path(args.paragraph_bank)
         if pb_path.exists():
             paragraph_bank = load_yaml(pb_path)
-            paragraphs = preselect_paragraphs(paragraph_bank, jd_keywords, args.role)
-            paragraph_block = format_preselected_paragraphs(paragraphs)
-            print(f"  [+] Pre-selected {len(paragraphs)} cover letter paragraphs")
         else:
             print(f"  [!] Warning: --paragraph-bank file not found: {args.paragraph_bank}")
 
+    fit_eval_text = None
+    if args.mode == "cover-letter" and args.fit_eval_path:
+        fit_eval_text = load_text(Path(args.fit_eval_path))
+
     # ---- Assemble prompt ----------------------------------------------------
-    if args.mode == "resume":
-        standards = load_text(STANDARDS_PATH)
-        prompt = assemble_resume_prompt(
-            job_text=job_text,
-            role=args.role,
-            portfolio=portfolio,
-            taxonomy=taxonomy,
-            structure=structure,
-            standards=standards,
-            precomputed_block=precomputed_block,
-            bullet_block=bullet_block,
-        )
-    elif args.mode == "fit-eval":
-        fit_eval_structure = load_yaml(FIT_EVAL_STRUCTURE_PATH)
-        prompt = assemble_fit_eval_prompt(
-            job_text=job_text,
-            role=args.role,
-            portfolio=portfolio,
-            taxonomy=taxonomy,
-            structure=structure,
-            fit_eval_structure=fit_eval_structure,
-            precomputed_block=precomputed_block,
-        )
-    else:
-        cover_letter_structure = load_yaml(COVER_LETTER_STRUCTURE_PATH)
-        fit_eval_text = None
-        if args.fit_eval_path:
-            fit_eval_text = load_text(Path(args.fit_eval_path))
-        prompt = assemble_cover_letter_prompt(
-            job_text=job_text,
-            role=args.role,
-            portfolio=portfolio,
-            taxonomy=taxonomy,
-            structure=structure,
-            cover_letter_structure=cover_letter_structure,
-            fit_eval_text=fit_eval_text,
-            precomputed_block=precomputed_block,
-            paragraph_block=paragraph_block,
-        )
+    prompt = build_prompt(
+        mode=args.mode,
+        job_text=job_text,
+        role=args.role,
+        inputs=inputs,
+        parsed_jd=parsed_jd,
+        pre_scores=pre_scores,
+        fit_eval_text=fit_eval_text,
+        bullet_bank=bullet_bank,
+        paragraph_bank=paragraph_bank,
+        verbose=True,
+        cache_friendly=args.cache_friendly,
+        cache_marker=args.cache_marker,
+        max_tokens=args.max_tokens,
+        bullet_budget=args.bullet_budget,
+        budget_unit=args.budget_unit,
+        ranking=args.ranking,
+    )
 
     OUTPUT_DIR.mkdir(exist_ok=True)
     output_path = args.output or str(
@@ -780,8 +1541,10 @@ def main():
     )
     Path(output_path).write_text(prompt, encoding="utf-8")
     print(f"Prompt written to: {output_path}")
-    print(f"Length: {len(prompt):,} characters")
-    if precomputed_block:
+    print(f"Length: {len(prompt):,} characters (~{estimate_tokens(prompt):,} tokens)")
+    if args.cache_friendly:
+        print(f"Static prefix: {static_prefix_length(prompt):,} characters")
+    if parsed_jd or pre_scores:
         print("  [enriched mode] Pre-computed context injected — LLM will validate, not re-derive.")
 
 
@@ -16,7 +16,9 @@ Usage:
 import argparse
 import re
 import sys
+from collections import Counter
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -45,6 +47,8 @@ SECTION_PATTERNS = [
     (r"(?i)^(job requirements?|job responsibilities?|job description)", "meta"),
 ]
 
+SECTION_KEYS = ("requirements", "responsibilities", "preferred", "about", "benefits", "meta", "other")
+
 # ---- Tech keyword patterns for skill extraction -----------------------------
 TECH_SKILL_PATTERNS = [
     # Data / Warehouse
@@ -143,49 +147,212 @@ def detect_seniority(text: str) -> str:
         return "mid"
 
 
-def split_into_sections(text: str) -> dict[str, list[str]]:
-    """Split raw JD text into labeled sections using header heuristics."""
-    sections: dict[str, list[str]] = {
-        "requirements": [],
-        "responsibilities": [],
-        "preferred": [],
-        "about": [],
-        "benefits": [],
-        "other": [],
-    }
-    current = "other"
-    lines = text.splitlines()
+def _section_for_header(line: str) -> str | None:
+    """Return the section key a header line opens, or None for content lines."""
+    # Only test short lines as potential headers (headers rarely > 80 chars)
+    if len(line) < 100:
+        for pattern, section_key in SECTION_PATTERNS:
+            if re.search(pattern, line):
+                return section_key
+    return None
 
-    for line in lines:
+
+def label_lines(text: str) -> list[tuple[str, str]]:
+    """Return (stripped_line, label) for every non-empty line of the JD.
+
+    Content lines are labeled with the section they fall under; header lines
+    are labeled "header" since they are not part of any section's content.
+    """
+    labeled = []
+    current = "other"
+    for line in text.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
+        header = _section_for_header(stripped)
+        if header:
+            current = header
+            labeled.append((stripped, "header"))
+        else:
+            labeled.append((stripped, current))
+    return labeled
 
-        # Only test short lines as potential headers (headers rarely > 80 chars)
-        if len(stripped) < 100:
-            matched = False
-            for pattern, section_key in SECTION_PATTERNS:
-                if re.search(pattern, stripped):
-                    current = section_key
-                    matched = True
-                    break
-            if matched:
-                continue  # Don't add the header itself as content
-
-        sections[current].append(stripped)
 
+def split_into_sections(text: str) -> dict[str, list[str]]:
+    """Split raw JD text into labeled sections using header heuristics."""
+    sections: dict[str, list[str]] = {key: [] for key in SECTION_KEYS}
+    for line, label in label_lines(text):
+        if label != "header":  # Don't add the header itself as content
+            sections[label].append(line)
     return sections
 
 
+WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=None)
+def term_arity(term: str) -> int:
+    """Return how many word tokens a search term spans, or 0 if it needs a regex.
+
+    A term maps onto the n-gram table when it starts and ends with a word
+    character, because r"\\bterm\\b" then matches exactly where n consecutive
+    tokens and the text between them spell the term. Terms with leading or
+    trailing punctuation ("c++", ".net") and terms whose occurrences can
+    overlap ("data data") return 0, since re.findall semantics differ there.
+    """
+    if not term or not WORD_RE.fullmatch(term[0]) or not WORD_RE.fullmatch(term[-1]):
+        return 0
+    words = WORD_RE.findall(term)
+    seps = WORD_RE.split(term)[1:-1]
+    n = len(words)
+    for shift in range(1, n):
+        if words[shift:] == words[:n - shift] and seps[shift:] == seps[:n - shift - 1]:
+            return 0
+    return n
+
+
+class JDDocument:
+    """A job description read and tokenized once, shared by the parser and scorer.
+
+    Holds the raw text, its lowercased form, the whitespace-normalized form the
+    scorer matches against, the split_into_sections() result, and a stream of
+    word tokens over the normalized text with character offsets and the section
+    label of the line each token came from. Token counts are kept for the whole
+    document and per section; longer n-gram counts are built on first use, so
+    whole-word hit counting is a dictionary lookup.
+    """
+
+    def __init__(self, text: str, source: Path | None = None):
+        self.text = text
+        self.source = source
+        self.lower = text.lower()
+
+        self.sections: dict[str, list[str]] = {key: [] for key in SECTION_KEYS}
+        self.lines: list[tuple[str, str]] = []
+        self.tokens: list[tuple[str, int, int]] = []
+        self.token_sections: list[str] = []
+        offset = 0
+        for line, label in label_lines(text):
+            if label != "header":
+                self.sections[label].append(line)
+            if self.lines:
+                offset += 1  # the single space joining normalized lines
+            piece = re.sub(r"\s+", " ", line.lower())
+            for m in WORD_RE.finditer(piece):
+                self.tokens.append((m.group(), offset + m.start(), offset + m.end()))
+                self.token_sections.append(label)
+            self.lines.append((piece, label))
+            offset += len(piece)
+        # Identical to scorer._normalize(text): lowercased, whitespace collapsed
+        self.normalized = " ".join(piece for piece, _ in self.lines)
+
+        self.counts: Counter[str] = Counter(tok for tok, _, _ in self.tokens)
+        self.section_counts: dict[str, Counter[str]] = {}
+        for (tok, _, _), label in zip(self.tokens, self.token_sections):
+            self.section_counts.setdefault(label, Counter())[tok] += 1
+        self._ngram_counts: dict[int, Counter[str]] = {1: self.counts}
+        self._regex_counts: dict[tuple[str, str | None], int] = {}
+
+    @classmethod
+    def from_path(cls, path: Path) -> "JDDocument":
+        return cls(load_text(path), source=path)
+
+    def section_text(self, section: str) -> str:
+        """Return a section's content lines joined with newlines."""
+        return "\n".join(self.sections.get(section, []))
+
+    def ngram_counts(self, n: int) -> Counter[str]:
+        """Return counts of every n-token span, keyed by its exact normalized text."""
+        if n not in self._ngram_counts:
+            tokens = self.tokens
+            text = self.normalized
+            self._ngram_counts[n] = Counter(
+                text[tokens[i][1]:tokens[i + n - 1][2]] for i in range(len(tokens) - n + 1)
+            )
+        return self._ngram_counts[n]
+
+    def count(self, term: str, section: str | None = None) -> int:
+        """Count whole-word occurrences of a lowercase term, like len(re.findall(r"\\bterm\\b")).
+
+        Terms that map onto token n-grams (see term_arity) are a lookup in the
+        document's term-frequency tables. Section-scoped phrases and terms with
+        edge punctuation fall back to one regex scan, memoized per document.
+        """
+        n = term_arity(term)
+        if n == 1 and section is not None:
+            return self.section_counts.get(section, {}).get(term, 0)
+        if n and section is None:
+            return self.ngram_counts(n).get(term, 0)
+
+        key = (term, section)
+        if key not in self._regex_counts:
+            if section is None:
+                haystack = self.normalized
+            else:
+                haystack = " ".join(piece for piece, label in self.lines if label == section)
+            pattern = r"\b" + re.escape(term) + r"\b"
+            self._regex_counts[key] = len(re.findall(pattern, haystack))
+        return self._regex_counts[key]
+
+
+class KeywordMatcher:
+    """Find every literal from a fixed list in a single scan of the text.
+
+    All literals are compiled into one zero-width lookahead alternation, tried
+    longest-first at each position. A position can match several literals only
+    when the shorter ones are prefixes of the longest, so those are recovered
+    from a precomputed prefix table instead of extra scans. With
+    word_boundary=True each literal behaves like r"\\b<literal>\\b".
+    """
+
+    def __init__(self, literals: list[str], word_boundary: bool = True):
+        self.literals = sorted(set(literals), key=lambda s: (-len(s), s))
+        self.word_boundary = word_boundary
+        alternation = "|".join(re.escape(lit) for lit in self.literals)
+        if word_boundary:
+            self._regex = re.compile(rf"\b(?=({alternation})\b)")
+        else:
+            self._regex = re.compile(rf"(?=({alternation}))")
+        self._prefixes = {
+            lit: [p for p in self.literals if len(p) < len(lit) and lit.startswith(p)]
+            for lit in self.literals
+        }
+
+    @staticmethod
+    def _is_word(ch: str) -> bool:
+        return ch.isalnum() or ch == "_"
+
+    def _ends_on_boundary(self, text: str, end: int) -> bool:
+        before = end > 0 and self._is_word(text[end - 1])
+        after = end < len(text) and self._is_word(text[end])
+        return before != after
+
+    def findall(self, text: str) -> set[str]:
+        """Return the set of literals that occur in text."""
+        found: set[str] = set()
+        for m in self._regex.finditer(text):
+            lit = m.group(1)
+            found.add(lit)
+            start = m.start()
+            for prefix in self._prefixes[lit]:
+                if prefix in found:
+                    continue
+                if not self.word_boundary or self._ends_on_boundary(text, start + len(prefix)):
+                    found.add(prefix)
+        return found
+
+
+def _pattern_literal(pattern: str) -> str:
+    r"""Turn a r"\b<escaped literal>\b" pattern back into its literal text."""
+    return re.sub(r"\\(.)", r"\1", pattern[2:-2])
+
+
+TECH_SKILL_MATCHER = KeywordMatcher([_pattern_literal(p) for p in TECH_SKILL_PATTERNS])
+
+
 def extract_tech_skills(text: str) -> list[str]:
     """Return a deduplicated list of detected tech skill tokens."""
-    found: set[str] = set()
-    lower = text.lower()
-    for pattern in TECH_SKILL_PATTERNS:
-        match = re.search(pattern, lower)
-        if match:
-            found.add(match.group().strip())
-    return sorted(found)
+    return sorted(TECH_SKILL_MATCHER.findall(text.lower()))
 
 
 def extract_context_keywords(text: str) -> list[str]:
@@ -208,9 +375,12 @@ def parse_jd(
     jd_path: Path,
     company_override: str | None = None,
     role_override: str | None = None,
+    doc: JDDocument | None = None,
 ) -> dict:
-    text = load_text(jd_path)
-    sections = split_into_sections(text)
+    if doc is None:
+        doc = JDDocument.from_path(jd_path)
+    text = doc.text
+    sections = doc.sections
 
     inferred_company, inferred_role = infer_company_role_from_filename(jd_path.name)
     company = company_override or inferred_company
@@ -223,8 +393,8 @@ def parse_jd(
             title_candidate = line
             break
 
-    req_text = "\n".join(sections["requirements"])
-    pref_text = "\n".join(sections["preferred"])
+    req_text = doc.section_text("requirements")
+    pref_text = doc.section_text("preferred")
     full_text = text
 
     req_skills = extract_tech_skills(req_text)
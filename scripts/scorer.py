@@ -3,7 +3,9 @@
 JD Scorer — pre-scores a parsed job description against the skill taxonomy.
 
 Loads skill-taxonomy.yaml and a parsed JD YAML (from jd_parser.py), then
-builds a keyword index and scores each skill against JD mentions. Outputs
+builds a keyword index and scores each skill against JD mentions. The index
+is cached under .cache/ keyed by a hash of the taxonomy file, so it is only
+rebuilt when the taxonomy changes. Outputs
 a ranked match YAML that generate_resume.py injects into prompts so the LLM
 validates and refines rather than re-discovering scores from scratch.
 
@@ -11,9 +13,14 @@ Usage:
     python scripts/scorer.py --jd archive/job-desc-hibob.txt --parsed-jd archive/jd-parsed-hibob-2026-02-20.yaml
     python scripts/scorer.py --jd archive/job-desc-hibob.txt --parsed-jd archive/jd-parsed-hibob-2026-02-20.yaml --summary
     python scripts/scorer.py --jd archive/job-desc-hibob.txt --parsed-jd archive/jd-parsed-hibob-2026-02-20.yaml --output archive/jd-scores-hibob.yaml
+    python scripts/scorer.py --batch "archive/job-desc-*.txt" --output archive/jd-batch-scores
 """
 
 import argparse
+import csv
+import glob
+import hashlib
+import pickle
 import re
 import sys
 from datetime import date
@@ -25,8 +32,22 @@ except ImportError:
     print("PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import jd_parser
+from fileio import atomic_write
+from jd_parser import JDDocument
+
 ROOT = Path(__file__).resolve().parent.parent
 TAXONOMY_PATH = ROOT / "portfolio" / "skill-taxonomy.yaml"
+CACHE_DIR = ROOT / ".cache"
+
+# Bump when build_skill_index output changes shape so stale caches are ignored
+SKILL_INDEX_VERSION = 1
 
 
 def load_yaml(path: Path) -> dict:
@@ -34,11 +55,6 @@ def load_yaml(path: Path) -> dict:
         return yaml.safe_load(f)
 
 
-def load_text(path: Path) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
-
-
 def _normalize(text: str) -> str:
     """Lowercase and collapse whitespace."""
     return re.sub(r"\s+", " ", text.lower().strip())
@@ -93,32 +109,59 @@ def build_skill_index(taxonomy: dict) -> list[dict]:
                 "years": skill.get("years", 0),
                 "evidence": evidence[:3],
                 "applicable_roles": skill.get("applicable_roles", []) or [],
-                "search_tokens": list(search_tokens),
+                "search_tokens": sorted(search_tokens),
             })
     return index
 
 
-def _count_hits(tokens: list[str], text: str) -> int:
-    """Count total token occurrences in text (capped per token to avoid noise)."""
+def load_skill_index(taxonomy_path: Path = TAXONOMY_PATH) -> list[dict]:
+    """Return the compiled skill index for a taxonomy file, using the on-disk cache.
+
+    The index is pickled under .cache/ keyed by the taxonomy file's path and a
+    hash of its bytes, so repeated runs skip YAML parsing and token derivation
+    entirely. Editing the taxonomy changes the hash and the index is rebuilt
+    on next use; only that taxonomy's older indexes are removed.
+    """
+    raw = taxonomy_path.read_bytes()
+    digest = hashlib.sha256(raw + f"v{SKILL_INDEX_VERSION}".encode()).hexdigest()[:16]
+    source = hashlib.sha256(str(taxonomy_path.resolve()).encode("utf-8")).hexdigest()[:8]
+    prefix = f"skill-index-{taxonomy_path.stem}-{source}-"
+    cache_path = CACHE_DIR / f"{prefix}{digest}.pkl"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+            pass  # Corrupt, partial, or pickled by another Python or module layout; rebuild below
+
+    index = build_skill_index(yaml.safe_load(raw.decode("utf-8")) or {})
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    for stale in CACHE_DIR.glob("skill-index-*.pkl"):
+        if stale.name.startswith(prefix) or stale.name.count("-") == 2:  # or an unkeyed index of old
+            stale.unlink(missing_ok=True)
+    atomic_write(cache_path, pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+    return index
+
+
+def _count_hits(tokens: list[str], doc: JDDocument) -> int:
+    """Count total token occurrences in a document (capped per token to avoid noise)."""
     total = 0
     for token in tokens:
-        pattern = r"\b" + re.escape(token) + r"\b"
-        count = len(re.findall(pattern, text))
-        total += min(count, 3)  # cap each token at 3 to prevent one word dominating
+        total += min(doc.count(token), 3)  # cap each token at 3 to prevent one word dominating
     return total
 
 
-def score_skill(entry: dict, jd_text_lower: str, req_text: str, pref_text: str, raw_kws: list[str]) -> dict:
+def score_skill(entry: dict, jd_doc: JDDocument, req_doc: JDDocument, pref_doc: JDDocument, raw_kws: list[str]) -> dict:
     """Score a single skill against the JD."""
     tokens = entry["search_tokens"]
 
-    required_hits = _count_hits(tokens, req_text)
-    preferred_hits = _count_hits(tokens, pref_text)
-    full_hits = _count_hits(tokens, jd_text_lower)
+    required_hits = _count_hits(tokens, req_doc)
+    preferred_hits = _count_hits(tokens, pref_doc)
+    full_hits = _count_hits(tokens, jd_doc)
 
-    # Check if skill name or close variant appears in raw_keywords list
-    skill_lower = entry["skill"].lower()
-    kw_bonus = sum(1 for kw in raw_kws if skill_lower in kw or kw in skill_lower)
+    kw_bonus = _keyword_bonus(entry, raw_kws)
 
     # Weighted raw score
     raw = (required_hits * 3.0) + (preferred_hits * 1.5) + (full_hits * 0.5) + (kw_bonus * 2.0)
@@ -126,6 +169,17 @@ def score_skill(entry: dict, jd_text_lower: str, req_text: str, pref_text: str,
     # Normalize to 0–10
     confidence = round(min(10.0, raw * 1.2), 1)
 
+    return _skill_result(entry, full_hits, confidence)
+
+
+def _keyword_bonus(entry: dict, raw_kws: list[str]) -> int:
+    """Count raw_keywords that contain the skill name or are contained by it."""
+    skill_lower = entry["skill"].lower()
+    return sum(1 for kw in raw_kws if skill_lower in kw or kw in skill_lower)
+
+
+def _skill_result(entry: dict, full_hits: int, confidence: float) -> dict:
+    """Build the per-skill score record from a computed confidence."""
     if confidence >= 7:
         category = "STRONG_MATCH"
     elif confidence >= 4:
@@ -147,20 +201,36 @@ def score_skill(entry: dict, jd_text_lower: str, req_text: str, pref_text: str,
     }
 
 
-def run_scoring(jd_path: Path, parsed_jd_path: Path, taxonomy: dict) -> tuple[list[dict], dict]:
-    """Score all taxonomy skills and compute a summary."""
-    jd_text = load_text(jd_path)
-    parsed_jd = load_yaml(parsed_jd_path)
-
-    jd_lower = _normalize(jd_text)
-    req_text = _normalize(" ".join(parsed_jd.get("required_skills", [])))
-    pref_text = _normalize(" ".join(parsed_jd.get("preferred_skills", [])))
+def run_scoring(
+    jd_path: Path,
+    parsed_jd_path: Path,
+    taxonomy: dict | None = None,
+    doc: JDDocument | None = None,
+    skill_index: list[dict] | None = None,
+    parsed_jd: dict | None = None,
+) -> tuple[list[dict], dict]:
+    """Score all taxonomy skills and compute a summary.
+
+    Pass the JDDocument already built by jd_parser.parse_jd as doc to skip
+    re-reading and re-normalizing the JD, and the parse_jd result as
+    parsed_jd to skip loading it from parsed_jd_path. Without a taxonomy or
+    skill_index, the cached index for portfolio/skill-taxonomy.yaml is used.
+    """
+    if doc is None:
+        doc = JDDocument.from_path(jd_path)
+    if parsed_jd is None:
+        parsed_jd = load_yaml(parsed_jd_path)
+
+    # Required/preferred hits are counted against the parser's skill lists
+    req_doc = JDDocument(" ".join(parsed_jd.get("required_skills", [])))
+    pref_doc = JDDocument(" ".join(parsed_jd.get("preferred_skills", [])))
     raw_kws = [_normalize(k) for k in parsed_jd.get("raw_keywords", [])]
 
-    skill_index = build_skill_index(taxonomy)
+    if skill_index is None:
+        skill_index = build_skill_index(taxonomy) if taxonomy is not None else load_skill_index()
 
     scores = [
-        score_skill(entry, jd_lower, req_text, pref_text, raw_kws)
+        score_skill(entry, doc, req_doc, pref_doc, raw_kws)
         for entry in skill_index
     ]
     scores.sort(key=lambda x: x["confidence"], reverse=True)
@@ -169,6 +239,143 @@ def run_scoring(jd_path: Path, parsed_jd_path: Path, taxonomy: dict) -> tuple[li
     return scores, summary
 
 
+# ---- Batch scoring ----------------------------------------------------------
+
+def build_skill_matrix(skill_index: list[dict]) -> tuple[list[str], "np.ndarray"]:
+    """Return (terms, skill×term incidence matrix) for vectorized scoring.
+
+    Row i has a 1 in column j when terms[j] is one of skill i's search tokens.
+    The matrix only spans the index's own vocabulary, so it stays small and
+    dense even for large taxonomies.
+    """
+    terms = sorted({t for entry in skill_index for t in entry["search_tokens"]})
+    column = {t: j for j, t in enumerate(terms)}
+    matrix = np.zeros((len(skill_index), len(terms)), dtype=np.float64)
+    for i, entry in enumerate(skill_index):
+        for t in entry["search_tokens"]:
+            matrix[i, column[t]] = 1.0
+    return terms, matrix
+
+
+def _term_count_matrix(docs: list[JDDocument], terms: list[str]) -> "np.ndarray":
+    """Stack per-JD term counts into a document×term matrix, capped at 3 per term."""
+    by_arity: dict[int, list[int]] = {}
+    for j, term in enumerate(terms):
+        by_arity.setdefault(jd_parser.term_arity(term), []).append(j)
+
+    counts = np.zeros((len(docs), len(terms)), dtype=np.float64)
+    for i, doc in enumerate(docs):
+        for n, columns in by_arity.items():
+            if n == 0:
+                values = [doc.count(terms[j]) for j in columns]
+            else:
+                lookup = doc.ngram_counts(n).get
+                values = [lookup(terms[j], 0) for j in columns]
+            counts[i, columns] = values
+    return np.minimum(counts, 3.0)  # same per-token cap as _count_hits
+
+
+def score_batch(
+    jd_paths: list[Path],
+    skill_index: list[dict],
+) -> tuple["np.ndarray", list[dict]]:
+    """Score many JDs at once.
+
+    Each JD is parsed in-process, then required, preferred, and full-text
+    hits for every skill of every JD come from three matrix products against
+    the skill×term incidence matrix. Returns the JD×skill confidence matrix
+    (rows follow jd_paths, columns follow skill_index) and one summary per JD,
+    identical to what run_scoring would produce for each file.
+    """
+    terms, skill_matrix = build_skill_matrix(skill_index)
+
+    parsed_jds = []
+    full_docs, req_docs, pref_docs = [], [], []
+    for path in jd_paths:
+        doc = JDDocument.from_path(path)
+        parsed = jd_parser.parse_jd(path, doc=doc)
+        parsed_jds.append(parsed)
+        full_docs.append(doc)
+        req_docs.append(JDDocument(" ".join(parsed.get("required_skills", []))))
+        pref_docs.append(JDDocument(" ".join(parsed.get("preferred_skills", []))))
+
+    full_hits = _term_count_matrix(full_docs, terms) @ skill_matrix.T
+    required_hits = _term_count_matrix(req_docs, terms) @ skill_matrix.T
+    preferred_hits = _term_count_matrix(pref_docs, terms) @ skill_matrix.T
+    kw_bonus = np.zeros(full_hits.shape, dtype=np.float64)
+    for row, parsed in enumerate(parsed_jds):
+        raw_kws = [_normalize(k) for k in parsed.get("raw_keywords", [])]
+        kw_bonus[row] = [_keyword_bonus(entry, raw_kws) for entry in skill_index]
+
+    raw = (required_hits * 3.0) + (preferred_hits * 1.5) + (full_hits * 0.5) + (kw_bonus * 2.0)
+    confidence = np.round(np.minimum(10.0, raw * 1.2), 1)
+
+    summaries = []
+    for row, parsed in enumerate(parsed_jds):
+        scores = [
+            _skill_result(entry, int(full_hits[row, col]), float(confidence[row, col]))
+            for col, entry in enumerate(skill_index)
+        ]
+        scores.sort(key=lambda x: x["confidence"], reverse=True)
+        summary = _compute_summary(scores, parsed)
+        summary["source_jd"] = parsed["source_file"]
+        summaries.append(summary)
+
+    return confidence, summaries
+
+
+def _resolve_batch_paths(spec: str) -> list[Path]:
+    """Expand a --batch argument (directory or glob) into a sorted list of JD files."""
+    path = Path(spec)
+    if path.is_dir():
+        return sorted(path.glob("*.txt"))
+    return sorted(Path(p) for p in glob.glob(spec))
+
+
+def write_batch_outputs(
+    base_path: Path,
+    jd_paths: list[Path],
+    skill_index: list[dict],
+    confidence: "np.ndarray",
+    summaries: list[dict],
+) -> tuple[Path, Path]:
+    """Write the JD×skill confidence matrix (.npz) and a per-JD fit summary (.csv)."""
+    base_path.parent.mkdir(parents=True, exist_ok=True)
+    npz_path = base_path.with_suffix(".npz")
+    csv_path = base_path.with_suffix(".csv")
+
+    np.savez_compressed(
+        npz_path,
+        confidence=confidence,
+        jd=np.array([p.name for p in jd_paths]),
+        skill=np.array([entry["skill"] for entry in skill_index]),
+    )
+
+    fieldnames = ["source_jd", "company", "inferred_role", "estimated_fit_score",
+                  "candidate_side_score", "absence_penalty", "strong_match_count",
+                  "partial_match_count", "top_matching_skills"]
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for summary in summaries:
+            row = dict(summary)
+            row["top_matching_skills"] = "; ".join(summary["top_matching_skills"])
+            writer.writerow(row)
+
+    return npz_path, csv_path
+
+
+def build_scores_output(jd_path: Path, parsed_jd_path: Path, scores: list[dict], summary: dict) -> dict:
+    """Assemble the jd-scores YAML document written by scorer.py."""
+    return {
+        "source_jd": str(jd_path.name),
+        "parsed_jd": str(parsed_jd_path.name),
+        "scored_date": str(date.today()),
+        "summary": summary,
+        "scores": scores,
+    }
+
+
 def _find_required_but_absent(parsed_jd: dict, scores: dict) -> list[str]:
     """Find specific tech tools required by the JD that have no taxonomy match.
 
@@ -303,14 +510,20 @@ def main():
     parser = argparse.ArgumentParser(
         description="Pre-score a parsed JD against the skill taxonomy"
     )
-    parser.add_argument("--jd", required=True, help="Path to raw JD text file")
+    parser.add_argument("--jd", help="Path to raw JD text file")
     parser.add_argument(
-        "--parsed-jd", required=True, dest="parsed_jd",
+        "--parsed-jd", dest="parsed_jd",
         help="Path to parsed JD YAML (from jd_parser.py)"
     )
+    parser.add_argument(
+        "--batch",
+        help="Directory or glob of raw JD files to parse and score in one pass "
+             "(requires numpy; replaces --jd/--parsed-jd)",
+    )
     parser.add_argument(
         "--output",
-        help="Output path (default: archive/jd-scores-{slug}-{date}.yaml)"
+        help="Output path (default: archive/jd-scores-{slug}-{date}.yaml; "
+             "with --batch, the base path for .npz/.csv, default archive/jd-batch-scores-{date})"
     )
     parser.add_argument(
         "--summary", action="store_true",
@@ -323,7 +536,11 @@ def main():
         print(f"Error: skill-taxonomy.yaml not found at {taxonomy_path}")
         sys.exit(1)
 
-    taxonomy = load_yaml(taxonomy_path)
+    if args.batch:
+        return run_batch(args.batch, args.output, taxonomy_path)
+    if not args.jd or not args.parsed_jd:
+        parser.error("--jd and --parsed-jd are required unless --batch is given")
+
     jd_path = Path(args.jd)
     parsed_jd_path = Path(args.parsed_jd)
 
@@ -334,15 +551,10 @@ def main():
         print(f"Error: Parsed JD not found: {parsed_jd_path}")
         sys.exit(1)
 
-    scores, summary = run_scoring(jd_path, parsed_jd_path, taxonomy)
+    skill_index = load_skill_index(taxonomy_path)
+    scores, summary = run_scoring(jd_path, parsed_jd_path, skill_index=skill_index)
 
-    output_data = {
-        "source_jd": str(jd_path.name),
-        "parsed_jd": str(parsed_jd_path.name),
-        "scored_date": str(date.today()),
-        "summary": summary,
-        "scores": scores,
-    }
+    output_data = build_scores_output(jd_path, parsed_jd_path, scores, summary)
 
     if args.output:
         output_path = Path(args.output)
@@ -369,5 +581,32 @@ def main():
     return str(output_path)
 
 
+def run_batch(spec: str, output: str | None, taxonomy_path: Path) -> str:
+    """CLI entry for --batch: score every matching JD and write .npz + .csv."""
+    if not NUMPY_AVAILABLE:
+        print("numpy is required for --batch. Install with: pip install numpy")
+        sys.exit(1)
+
+    jd_paths = _resolve_batch_paths(spec)
+    if not jd_paths:
+        print(f"Error: no JD files match {spec}")
+        sys.exit(1)
+
+    skill_index = load_skill_index(taxonomy_path)
+    confidence, summaries = score_batch(jd_paths, skill_index)
+
+    base_path = Path(output) if output else ROOT / "archive" / f"jd-batch-scores-{date.today()}"
+    npz_path, csv_path = write_batch_outputs(base_path, jd_paths, skill_index, confidence, summaries)
+
+    print(f"Scored {len(jd_paths)} JD(s) against {len(skill_index)} skills")
+    print(f"  Confidence matrix : {npz_path}")
+    print(f"  Fit summary       : {csv_path}")
+    ranked = sorted(summaries, key=lambda s: s["estimated_fit_score"], reverse=True)
+    for summary in ranked[:10]:
+        print(f"  {summary['estimated_fit_score']:>4}/10  {summary['source_jd']}")
+
+    return str(csv_path)
+
+
 if __name__ == "__main__":
     main()
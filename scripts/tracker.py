@@ -8,6 +8,11 @@ Commands:
     --status        Print a formatted summary table to terminal
     --export-csv    Write output/tracker.csv
     --scan-outputs  Scan output/application-*.md and import any missing entries
+                    (reads the application-*.json sidecar when present; files
+                    unchanged since the last scan are skipped unless --full)
+    --import-yaml   Load tracker.yaml into output/tracker.db; the SQLite store is
+                    used instead of the YAML from then on
+    --export-yaml   Write output/tracker.db back to tracker.yaml
 
 Usage examples:
     python scripts/tracker.py --status
@@ -16,12 +21,22 @@ Usage examples:
     python scripts/tracker.py --update --company "HiBob" --status interviewing --notes "Phone screen scheduled"
     python scripts/tracker.py --export-csv
     python scripts/tracker.py --scan-outputs
+    python scripts/tracker.py --scan-outputs --full
+    python scripts/tracker.py --import-yaml
+    python scripts/tracker.py --export-yaml
 """
 
 import argparse
 import csv
+import hashlib
+import json
+import os
 import re
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 
@@ -31,9 +46,22 @@ except ImportError:
     print("PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+from fileio import FCNTL_AVAILABLE, atomic_write, file_lock
+
 ROOT = Path(__file__).resolve().parent.parent
 TRACKER_PATH = ROOT / "output" / "tracker.yaml"
+TRACKER_DB_PATH = ROOT / "output" / "tracker.db"
 OUTPUT_DIR = ROOT / "output"
+SCAN_MANIFEST_PATH = ROOT / ".cache" / "scan-outputs.json"
+EVAL_QUEUE_PATH = ROOT / "output" / "eval-queue.txt"
+SCAN_MANIFEST_VERSION = 1
+
+SIDECAR_VERSION = 1
+
+TRACKER_FIELDS = ("company", "role", "date_evaluated", "fit_score", "recommendation",
+                  "status", "date_applied", "output_file", "notes")
+
+UPDATE_RETRIES = 5
 
 VALID_STATUSES = {"applied", "interviewing", "offer", "rejected", "ghosted", "skipped", "pending_application", "pending_evaluation"}
 
@@ -51,10 +79,110 @@ def load_tracker() -> dict:
 
 
 def save_tracker(data: dict) -> None:
+    """Replace tracker.yaml atomically. To change entries, use update_tracker."""
     data["metadata"] = {"last_updated": str(date.today())}
     TRACKER_PATH.parent.mkdir(exist_ok=True)
-    with open(TRACKER_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    write_yaml_atomic(TRACKER_PATH, data)
+
+
+def update_tracker(mutate) -> bool:
+    """
+    Apply mutate(data) to the current tracker.yaml under its lock and save it
+    if mutate returns True. See locked_update.
+    """
+    return locked_update(TRACKER_PATH, load_tracker, save_tracker, mutate)
+
+
+# ---- Locked writes ----------------------------------------------------------
+
+def write_yaml_atomic(path: Path, data: dict) -> None:
+    """Write YAML to a temp file in the same directory, fsync it, and os.replace it over path."""
+    atomic_write(path, yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False),
+                 fsync=True)
+
+
+def _file_state(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def locked_update(path: Path, load, save, mutate) -> bool:
+    """
+    Read-modify-write of a whole file that is safe against concurrent writers.
+
+    Under file_lock(path), data = load() is read fresh, mutate(data) applies
+    the change and, if it returns True, save(data) commits it. mutate always
+    sees the latest file, so concurrent updates merge instead of overwriting
+    each other; it may be called more than once and must not depend on an
+    earlier call. Without fcntl the write is retried on fresh data when the
+    file changed while mutate ran. Returns whether anything was saved.
+    """
+    for attempt in range(UPDATE_RETRIES):
+        with file_lock(path):
+            before = _file_state(path)
+            data = load()
+            if not mutate(data):
+                return False
+            if FCNTL_AVAILABLE or _file_state(path) == before:
+                save(data)
+                return True
+        time.sleep(0.01 * 2 ** attempt)
+    raise TimeoutError(f"{path} kept changing during {UPDATE_RETRIES} update attempts")
+
+
+# ---- Evaluation queue -------------------------------------------------------
+# output/eval-queue.txt: one JD path (relative to the repo root) per line, added
+# by crawl_boards.py and consumed by evaluate.py --queue.
+
+def load_eval_queue() -> list[str]:
+    try:
+        lines = EVAL_QUEUE_PATH.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def _save_eval_queue(queue: list[str]) -> None:
+    EVAL_QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(EVAL_QUEUE_PATH, "".join(f"{entry}\n" for entry in queue))
+
+
+def _queue_entry(path: Path) -> str:
+    path = Path(path).resolve()
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else str(path)
+
+
+def enqueue_jds(paths: list[Path]) -> int:
+    """Append JD paths not already queued; returns how many were added."""
+    entries = [_queue_entry(p) for p in paths]
+    added = 0
+
+    def append(queue: list[str]) -> bool:
+        nonlocal added
+        queued = set(queue)
+        new = [e for e in dict.fromkeys(entries) if e not in queued]
+        added = len(new)
+        queue.extend(new)
+        return bool(new)
+
+    locked_update(EVAL_QUEUE_PATH, load_eval_queue, _save_eval_queue, append)
+    return added
+
+
+def dequeue_jds(paths: list[Path]) -> None:
+    """Remove JD paths from the queue, e.g. once they have been evaluated."""
+    done = {_queue_entry(p) for p in paths}
+
+    def remove(queue: list[str]) -> bool:
+        kept = [e for e in queue if e not in done]
+        changed = len(kept) != len(queue)
+        queue[:] = kept
+        return changed
+
+    locked_update(EVAL_QUEUE_PATH, load_eval_queue, _save_eval_queue, remove)
 
 
 # ---- Entry helpers ----------------------------------------------------------
@@ -100,10 +228,243 @@ def build_entry(
     }
 
 
+def add_applications(entries: list[dict], db: "TrackerDB | None" = None) -> list[bool]:
+    """
+    Add entries (from build_entry) to the active tracker store (db if given)
+    with a single locked write. Returns, per entry, whether it was added
+    (False if already tracked).
+    """
+    if db is not None:
+        return db.add_many(entries)
+    if TRACKER_DB_PATH.exists():
+        with TrackerDB() as db:
+            return db.add_many(entries)
+
+    added: list[bool] = []
+
+    def add(data: dict) -> bool:
+        added.clear()
+        for entry in entries:
+            added.append(find_entry(data["applications"], entry["company"], entry["role"]) is None)
+            if added[-1]:
+                data["applications"].append(entry)
+        return any(added)
+
+    update_tracker(add)
+    return added
+
+
+# ---- SQLite store -----------------------------------------------------------
+
+# Once output/tracker.db exists (see --import-yaml) it is the tracker store
+# for tracker.py and evaluate.py; --export-yaml writes it back to tracker.yaml.
+
+# fit_score is untyped so 7 and 7.5 round-trip exactly as they were given
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id             INTEGER PRIMARY KEY,
+    company        TEXT NOT NULL,
+    role           TEXT NOT NULL,
+    company_slug   TEXT NOT NULL,
+    role_slug      TEXT NOT NULL,
+    date_evaluated TEXT,
+    fit_score,
+    recommendation TEXT,
+    status         TEXT,
+    date_applied   TEXT,
+    output_file    TEXT,
+    notes          TEXT
+);
+CREATE INDEX IF NOT EXISTS applications_slugs ON applications (company_slug, role_slug);
+CREATE INDEX IF NOT EXISTS applications_status ON applications (status, date_evaluated);
+CREATE INDEX IF NOT EXISTS applications_date ON applications (date_evaluated);
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class TrackerDB:
+    """
+    The tracker as an SQLite database: one row per application with the
+    build_entry fields plus the slugs find_entry matches on. Every write runs
+    in its own transaction, taken with BEGIN IMMEDIATE so a duplicate check
+    and the insert that follows it cannot interleave with another process.
+    """
+
+    def __init__(self, path: Path | None = None):
+        path = path or TRACKER_DB_PATH
+        path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_DB_SCHEMA)
+
+    def __enter__(self) -> "TrackerDB":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_updated', ?)",
+            (str(date.today()),),
+        )
+        self.conn.execute("COMMIT")
+
+    def find_id(self, company: str, role: str | None = None) -> int | None:
+        """Row id of the first entry matching company (and role, if given) by slug."""
+        if role is None:
+            row = self.conn.execute(
+                "SELECT id FROM applications WHERE company_slug = ? ORDER BY id LIMIT 1",
+                (_slug(company),)).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT id FROM applications WHERE company_slug = ? AND role_slug = ? "
+                "ORDER BY id LIMIT 1", (_slug(company), _slug(role))).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, entry: dict) -> None:
+        values = [entry.get(field, "") for field in TRACKER_FIELDS]
+        self.conn.execute(
+            f"INSERT INTO applications (company_slug, role_slug, {', '.join(TRACKER_FIELDS)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(TRACKER_FIELDS))})",
+            [_slug(entry["company"]), _slug(entry["role"]), *values],
+        )
+
+    def _entry(self, row_id: int) -> dict:
+        row = self.conn.execute(
+            f"SELECT {', '.join(TRACKER_FIELDS)} FROM applications WHERE id = ?", (row_id,)).fetchone()
+        return dict(row)
+
+    def add_many(self, entries: list[dict]) -> list[bool]:
+        """Insert the entries not already tracked, in one transaction; see add_applications."""
+        added = []
+        with self.transaction():
+            for entry in entries:
+                added.append(self.find_id(entry["company"], entry["role"]) is None)
+                if added[-1]:
+                    self._insert(entry)
+        return added
+
+    def update(self, company: str, role: str | None, changes: dict) -> dict | None:
+        """Apply field changes to the matching entry; returns the updated entry or None."""
+        with self.transaction():
+            row_id = self.find_id(company, role)
+            if row_id is None:
+                return None
+            if changes:
+                self.conn.execute(
+                    f"UPDATE applications SET {', '.join(f'{k} = ?' for k in changes)} WHERE id = ?",
+                    [*changes.values(), row_id],
+                )
+            return self._entry(row_id)
+
+    def entries(self, status: str | None = None) -> list[dict]:
+        """Entries, newest evaluation first (ties in insertion order), optionally of one status."""
+        sql = f"SELECT {', '.join(TRACKER_FIELDS)} FROM applications"
+        params: tuple = ()
+        if status is not None:
+            sql += " WHERE status = ?"
+            params = (status,)
+        sql += " ORDER BY date_evaluated DESC, id"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def status_counts(self) -> dict[str, int]:
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM applications GROUP BY status").fetchall())
+
+    def last_updated(self) -> str:
+        row = self.conn.execute("SELECT value FROM metadata WHERE key = 'last_updated'").fetchone()
+        return row[0] if row else "?"
+
+    def import_data(self, data: dict) -> int:
+        """Replace every row with the applications of a tracker.yaml document."""
+        apps = data.get("applications") or []
+        with self.transaction():
+            self.conn.execute("DELETE FROM applications")
+            for app in apps:
+                self._insert(app)
+        return len(apps)
+
+    def export_data(self) -> dict:
+        """The tracker as a tracker.yaml document, in insertion order."""
+        rows = self.conn.execute(f"SELECT {', '.join(TRACKER_FIELDS)} FROM applications ORDER BY id")
+        return {"applications": [dict(row) for row in rows]}
+
+
+# ---- Sidecars ---------------------------------------------------------------
+
+def sidecar_path(md_path: Path) -> Path:
+    """application-{slug}-{date}.md → application-{slug}-{date}.json"""
+    return md_path.with_suffix(".json")
+
+
+def write_sidecar(md_path: Path, fields: dict) -> Path:
+    """
+    Write the JSON sidecar for an application .md that was just written.
+    The .md's size and mtime are recorded so a sidecar left behind by a later
+    edit of the .md is detected and ignored.
+    """
+    st = md_path.stat()
+    sidecar = {"version": SIDECAR_VERSION, "md_size": st.st_size, "md_mtime_ns": st.st_mtime_ns}
+    sidecar.update(fields)
+    path = sidecar_path(md_path)
+    atomic_write(path, json.dumps(sidecar, indent=1, ensure_ascii=False))
+    return path
+
+
+def load_sidecar(md_path: Path) -> dict | None:
+    """Return the sidecar of an application .md, or None if missing, unreadable or stale."""
+    try:
+        st = md_path.stat()
+        sidecar = json.loads(sidecar_path(md_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(sidecar, dict) or sidecar.get("version") != SIDECAR_VERSION
+            or sidecar.get("md_size") != st.st_size or sidecar.get("md_mtime_ns") != st.st_mtime_ns):
+        return None
+    return sidecar
+
+
 # ---- Scan outputs -----------------------------------------------------------
 
+def _status_for(recommendation: str) -> str:
+    """Derive a tracker status from a recommendation string."""
+    rec_upper = recommendation.upper()
+    if "SKIP" in rec_upper:
+        return "skipped"
+    if "APPLY" in rec_upper or "INVESTIGATE" in rec_upper:
+        return "applied"
+    return "pending_application"
+
+
 def _parse_output_file(path: Path) -> dict | None:
-    """Extract company, role, fit score, and recommendation from an application .md file."""
+    """
+    Extract company, role, fit score, and recommendation from an application
+    .md file — from its JSON sidecar when there is a current one, otherwise
+    by scanning the Markdown.
+    """
+    output_file = str(path.relative_to(ROOT)).replace("\\", "/")
+    sidecar = load_sidecar(path)
+    if sidecar:
+        return build_entry(
+            company=sidecar["company"],
+            role=sidecar["role"],
+            fit_score=sidecar.get("fit_score"),
+            recommendation=sidecar.get("recommendation", ""),
+            status=_status_for(sidecar.get("recommendation", "")),
+            output_file=output_file,
+            date_evaluated=sidecar.get("date_evaluated", ""),
+        )
+
     try:
         text = path.read_text(encoding="utf-8")
     except Exception:
@@ -138,14 +499,7 @@ def _parse_output_file(path: Path) -> dict | None:
             rec = m.group(1).strip().rstrip("*").strip()
             break
 
-    # Derive status from recommendation
-    rec_upper = rec.upper()
-    if "SKIP" in rec_upper:
-        status = "skipped"
-    elif "APPLY" in rec_upper or "INVESTIGATE" in rec_upper:
-        status = "applied"
-    else:
-        status = "pending_application"
+    status = _status_for(rec)
 
     # Extract company and role from filename: application-{company}-{role}-{date}.md
     stem = path.stem  # e.g. application-merge-solutions-engineer-2026-02-20
@@ -167,36 +521,95 @@ def _parse_output_file(path: Path) -> dict | None:
         fit_score=fit,
         recommendation=rec,
         status=status,
-        output_file=str(path.relative_to(ROOT)).replace("\\", "/"),
+        output_file=output_file,
         date_evaluated=eval_date,
     )
 
 
-def scan_outputs(data: dict, dry_run: bool = False) -> int:
-    """Scan output/application-*.md and add any missing entries to tracker."""
-    apps = data["applications"]
-    added = 0
-
-    for md_path in sorted(OUTPUT_DIR.glob("application-*.md")):
-        entry = _parse_output_file(md_path)
-        if not entry:
+def load_scan_manifest() -> dict[str, dict]:
+    """{output path: {size, mtime_ns, hash}} of the files earlier scans processed."""
+    try:
+        manifest = json.loads(SCAN_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != SCAN_MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def save_scan_manifest(files: dict[str, dict]) -> None:
+    SCAN_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(SCAN_MANIFEST_PATH,
+                 json.dumps({"version": SCAN_MANIFEST_VERSION, "files": files}, indent=1, sort_keys=True))
+
+
+def _scan_file(path: Path, st: os.stat_result, previous: dict | None) -> tuple[dict, dict | None]:
+    """
+    Hash a new or touched output file and parse it unless its content is the
+    one already processed. Returns (manifest record, tracker entry or None).
+    """
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    record = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+    if previous and previous.get("hash") == digest:
+        return record, None  # touched, not changed
+    return record, _parse_output_file(path)
+
+
+def scan_outputs(dry_run: bool = False, db: "TrackerDB | None" = None, full: bool = False) -> int:
+    """
+    Scan output/application-*.md and add any missing entries to the tracker
+    (db if given, otherwise the active store).
+
+    Files recorded in the scan manifest with the same size and mtime are
+    skipped without being read; the rest are hashed and, if their content is
+    new, parsed on a thread pool. full ignores the manifest and re-parses
+    every file. The manifest is updated, after the tracker, unless dry_run.
+    """
+    manifest = {} if full else load_scan_manifest()
+    paths = sorted(OUTPUT_DIR.glob("application-*.md"))
+    todo = []
+    for path in paths:
+        st = path.stat()
+        previous = manifest.get(path.name)
+        if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
             continue
-        idx = find_entry(apps, entry["company"], entry["role"])
-        if idx is not None:
+        todo.append((path, st, previous))
+    print(f"  {len(todo)} new or changed of {len(paths)} output file(s)")
+
+    with ThreadPoolExecutor() as pool:
+        scanned = list(pool.map(lambda job: _scan_file(*job), todo))
+    entries = [entry for _, entry in scanned if entry]
+
+    if not dry_run:
+        new = add_applications(entries, db) if entries else []
+    elif db is not None:
+        new = [db.find_id(e["company"], e["role"]) is None for e in entries]
+    else:
+        apps = load_tracker()["applications"]
+        new = [find_entry(apps, e["company"], e["role"]) is None for e in entries]
+
+    added = 0
+    for entry, is_new in zip(entries, new):
+        if not is_new:
             continue  # already tracked
-        if not dry_run:
-            apps.append(entry)
         print(f"  {'[DRY RUN] ' if dry_run else ''}Added: {entry['company']} — {entry['role']}  (fit: {entry['fit_score']}, {entry['status']})")
         added += 1
 
+    if not dry_run:
+        names = {path.name for path in paths}
+        files = {name: record for name, record in manifest.items() if name in names}
+        files.update((path.name, record) for (path, _, _), (record, _) in zip(todo, scanned))
+        save_scan_manifest(files)
     return added
 
 
 # ---- CLI commands -----------------------------------------------------------
 
-def cmd_add(args, data: dict) -> None:
-    apps = data["applications"]
+STATUS_ORDER = ["applied", "interviewing", "offer", "pending_application",
+                "pending_evaluation", "rejected", "ghosted", "skipped"]
 
+
+def cmd_add(args, db: TrackerDB | None = None) -> None:
     # Interactive fallback if required flags missing
     company = args.company or input("Company name: ").strip()
     role = args.role or input("Role: ").strip()
@@ -209,69 +622,75 @@ def cmd_add(args, data: dict) -> None:
     output_file = args.output_file or ""
     notes = args.notes or ""
 
-    idx = find_entry(apps, company, role)
-    if idx is not None:
+    if not add_applications([build_entry(company, role, fit, rec, status, output_file, notes=notes)], db)[0]:
         print(f"Warning: Entry for {company} — {role} already exists. Use --update to modify.")
         return
-
-    entry = build_entry(
-        company=company,
-        role=role,
-        fit_score=fit,
-        recommendation=rec,
-        status=status,
-        output_file=output_file,
-        notes=notes,
-    )
-    apps.append(entry)
-    save_tracker(data)
     print(f"Added: {company} — {role}  [{status}]")
 
 
-def cmd_update(args, data: dict) -> None:
-    apps = data["applications"]
+def cmd_update(args, db: TrackerDB | None = None) -> None:
     if not args.company:
         print("Error: --company is required for --update")
         sys.exit(1)
-
-    idx = find_entry(apps, args.company, args.role)
-    if idx is None:
-        print(f"Error: No entry found for company '{args.company}'" +
-              (f" role '{args.role}'" if args.role else ""))
+    if args.app_status and args.app_status not in VALID_STATUSES:
+        print(f"Invalid status '{args.app_status}'. Valid: {', '.join(sorted(VALID_STATUSES))}")
         sys.exit(1)
 
-    entry = apps[idx]
+    changes = {}
     if args.app_status:
-        if args.app_status not in VALID_STATUSES:
-            print(f"Invalid status '{args.app_status}'. Valid: {', '.join(sorted(VALID_STATUSES))}")
-            sys.exit(1)
-        entry["status"] = args.app_status
+        changes["status"] = args.app_status
     if args.notes:
-        entry["notes"] = args.notes
+        changes["notes"] = args.notes
     if args.fit:
-        entry["fit_score"] = args.fit
+        changes["fit_score"] = args.fit
     if args.date_applied:
-        entry["date_applied"] = args.date_applied
+        changes["date_applied"] = args.date_applied
+
+    if db is not None:
+        entry = db.update(args.company, args.role, changes)
+    else:
+        entry = None
+
+        def apply(data: dict) -> bool:
+            nonlocal entry
+            idx = find_entry(data["applications"], args.company, args.role)
+            if idx is None:
+                return False
+            entry = data["applications"][idx]
+            entry.update(changes)
+            return True
+
+        update_tracker(apply)
+    if entry is None:
+        print(f"Error: No entry found for company '{args.company}'" +
+              (f" role '{args.role}'" if args.role else ""))
+        sys.exit(1)
 
-    save_tracker(data)
     print(f"Updated: {entry['company']} — {entry['role']}  [{entry['status']}]")
 
 
-def cmd_status(data: dict) -> None:
-    apps = data["applications"]
-    if not apps:
+def cmd_status(data: dict | None, db: TrackerDB | None = None) -> None:
+    if db is not None:
+        # One indexed query per status, already in display order
+        counts = db.status_counts()
+        total = sum(counts.values())
+        groups = {s: db.entries(s) for s in STATUS_ORDER if counts.get(s)}
+        last_updated = db.last_updated()
+    else:
+        apps = data["applications"]
+        total = len(apps)
+        groups: dict[str, list[dict]] = {}
+        for app in apps:
+            s = app.get("status", "unknown")
+            groups.setdefault(s, []).append(app)
+        for s, group in groups.items():
+            group.sort(key=lambda x: x.get("date_evaluated", ""), reverse=True)
+        last_updated = data.get("metadata", {}).get("last_updated", "?")
+
+    if not total:
         print("No applications tracked yet.")
         return
 
-    # Group by status
-    groups: dict[str, list[dict]] = {}
-    for app in apps:
-        s = app.get("status", "unknown")
-        groups.setdefault(s, []).append(app)
-
-    STATUS_ORDER = ["applied", "interviewing", "offer", "pending_application",
-                    "pending_evaluation", "rejected", "ghosted", "skipped"]
-
     COL_W = {"company": 18, "role": 32, "fit": 6, "rec": 22, "status": 20, "notes": 28}
     header = (
         f"{'Company':<{COL_W['company']}} "
@@ -284,7 +703,7 @@ def cmd_status(data: dict) -> None:
     divider = "-" * len(header)
 
     print(f"\n{'='*len(header)}")
-    print(f"  APPLICATION TRACKER  ({len(apps)} total | last updated: {data.get('metadata', {}).get('last_updated', '?')})")
+    print(f"  APPLICATION TRACKER  ({total} total | last updated: {last_updated})")
     print(f"{'='*len(header)}\n")
 
     for status_key in STATUS_ORDER:
@@ -296,7 +715,7 @@ def cmd_status(data: dict) -> None:
         print(f"  {divider}")
         print(f"  {header}")
         print(f"  {divider}")
-        for app in sorted(group, key=lambda x: x.get("date_evaluated", ""), reverse=True):
+        for app in group:
             company = str(app.get("company", ""))[:COL_W["company"]]
             role = str(app.get("role", ""))[:COL_W["role"]]
             fit = str(app.get("fit_score", "?"))
@@ -321,40 +740,53 @@ def cmd_status(data: dict) -> None:
     print()
 
 
-def cmd_export_csv(data: dict) -> None:
-    apps = data["applications"]
+def cmd_export_csv(data: dict | None, db: TrackerDB | None = None) -> None:
+    if db is not None:
+        apps = db.entries()
+    else:
+        apps = sorted(data["applications"], key=lambda x: x.get("date_evaluated", ""), reverse=True)
     if not apps:
         print("No applications to export.")
         return
 
     csv_path = ROOT / "output" / "tracker.csv"
-    fieldnames = ["company", "role", "date_evaluated", "fit_score", "recommendation",
-                  "status", "date_applied", "output_file", "notes"]
 
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS, extrasaction="ignore")
         writer.writeheader()
-        for app in sorted(apps, key=lambda x: x.get("date_evaluated", ""), reverse=True):
-            writer.writerow(app)
+        writer.writerows(apps)
 
     print(f"Exported {len(apps)} applications to: {csv_path}")
 
 
-def cmd_scan_outputs(data: dict) -> None:
+def cmd_scan_outputs(db: TrackerDB | None = None, full: bool = False) -> None:
     print("Scanning output/ for untracked application files...")
-    added = scan_outputs(data)
+    added = scan_outputs(db=db, full=full)
     if added:
-        save_tracker(data)
         print(f"\nAdded {added} new entries to tracker.")
     else:
         print("No new entries found — tracker is up to date.")
 
 
+def cmd_import_yaml() -> None:
+    with TrackerDB() as db:
+        n = db.import_data(load_tracker())
+    print(f"Imported {n} applications from {TRACKER_PATH.name} into {TRACKER_DB_PATH}")
+    print(f"tracker.py and evaluate.py now use the database; delete it to return to YAML.")
+
+
+def cmd_export_yaml(db: TrackerDB) -> None:
+    data = db.export_data()
+    with file_lock(TRACKER_PATH):
+        save_tracker(data)
+    print(f"Exported {len(data['applications'])} applications to: {TRACKER_PATH}")
+
+
 # ---- Main -------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Manage the application tracker (output/tracker.yaml)"
+        description="Manage the application tracker (output/tracker.yaml, or output/tracker.db)"
     )
     parser.add_argument("--add", action="store_true", help="Add a new entry")
     parser.add_argument("--update", action="store_true", help="Update an existing entry")
@@ -363,6 +795,13 @@ def main():
                         help="Export to output/tracker.csv")
     parser.add_argument("--scan-outputs", action="store_true", dest="scan_outputs",
                         help="Scan output/ directory and import missing entries")
+    parser.add_argument("--full", action="store_true",
+                        help="With --scan-outputs: ignore the scan manifest and re-parse every file")
+    parser.add_argument("--import-yaml", action="store_true", dest="import_yaml",
+                        help="Load tracker.yaml into output/tracker.db (replacing its rows) "
+                             "and use the database from then on")
+    parser.add_argument("--export-yaml", action="store_true", dest="export_yaml",
+                        help="Write output/tracker.db back to tracker.yaml")
 
     # Entry fields
     parser.add_argument("--company", help="Company name")
@@ -378,20 +817,33 @@ def main():
     parser.add_argument("--notes", help="Free-text notes")
     args = parser.parse_args()
 
-    data = load_tracker()
+    if args.import_yaml:
+        cmd_import_yaml()
+        return
+    if not TRACKER_DB_PATH.exists():
+        if args.export_yaml:
+            print(f"Error: {TRACKER_DB_PATH} does not exist (see --import-yaml)")
+            sys.exit(1)
+        db = None
+    else:
+        db = TrackerDB()
 
     if args.add:
-        cmd_add(args, data)
+        cmd_add(args, db)
     elif args.update:
-        cmd_update(args, data)
+        cmd_update(args, db)
     elif args.status:
-        cmd_status(data)
+        cmd_status(None if db else load_tracker(), db)
     elif args.export_csv:
-        cmd_export_csv(data)
+        cmd_export_csv(None if db else load_tracker(), db)
     elif args.scan_outputs:
-        cmd_scan_outputs(data)
+        cmd_scan_outputs(db, full=args.full)
+    elif args.export_yaml:
+        cmd_export_yaml(db)
     else:
         parser.print_help()
+    if db is not None:
+        db.close()
 
 
 if __name__ == "__main__":